@@ -30,13 +30,95 @@ Usage:
 Note: bytes_sent() and bytes_received() cannot be combined in one batch —
 the HF API only supports one "bytes" key per request. Calling both raises
 ValueError. Use two separate fetch() calls instead.
+
+Oversize batches:
+    HF answers at most so many ids per resource in one /read (ID_LIMITS —
+    20 users, 30 threads) and silently drops the rest. A batch may hold any
+    number: fetch() splits it into the fewest /read calls that stay within
+    every limit (call i carries chunk i of each oversize id list, everything
+    else rides with the first), starts them together and merges the answers
+    in order into one HFBatchResult.
+
+    Each call still takes its own rate limiter slot (HFRateLimiter). Until
+    the token's first x-rate-limit-remaining header they all go out at
+    once; after that a full bucket lets BURST (10) through together and the
+    rest follow at remaining/3600 calls per second — 500 users are 25
+    calls, which with 240 calls left this hour take minutes, not one round
+    trip. A call still waiting after
+    its lane's LANE_MAX_WAIT is dropped; result.failed counts it and its
+    rows are missing.
 """
 
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Any
 
+from HFFields import Fields, project
+
+log = logging.getLogger("hfapi.batch")
+
+# Most ids HF answers per (resource, id parameter) in one /read. users and
+# threads are the documented limits (users above 20 come back truncated,
+# HFThreads.get_many takes 30). The others aren't documented; 30 is HF's
+# largest page size and what the wrapper has always stayed within.
+ID_LIMITS: dict[tuple[str, str], int] = {
+    ("users",     "_uid"):  20,
+    ("threads",   "_tid"):  30,
+    ("posts",     "_pid"):  30,
+    ("contracts", "_cid"):  30,
+    ("bratings",  "_crid"): 30,
+    ("disputes",  "_cid"):  30,
+    ("disputes",  "_cdid"): 30,
+}
+
+
+def split_asks(asks: dict) -> list[dict]:
+    """
+    Split asks whose id lists exceed ID_LIMITS into the fewest /read calls.
+    Returns [asks] unchanged when nothing is over a limit.
+    """
+    chunked: dict[str, tuple[str, list[list]]] = {}
+    for resource, ask in asks.items():
+        if not isinstance(ask, dict):
+            continue
+        for param, value in ask.items():
+            limit = ID_LIMITS.get((resource, param))
+            if limit is None or not isinstance(value, list):
+                continue
+            if len(value) > limit:
+                ids = list(dict.fromkeys(value))
+                chunked[resource] = (param, [ids[i : i + limit] for i in range(0, len(ids), limit)])
+            break   # one id filter per resource
+    if not chunked:
+        return [asks]
+
+    calls: list[dict] = [{} for _ in range(max(len(chunks) for _, chunks in chunked.values()))]
+    for resource, ask in asks.items():
+        if resource in chunked:
+            param, chunks = chunked[resource]
+            for call, chunk in zip(calls, chunks):
+                call[resource] = {**ask, param: chunk}
+        else:
+            calls[0][resource] = ask
+    return calls
+
+
+def _merge(responses: list[dict]) -> dict:
+    """One response from the responses of a split batch — row lists concatenated."""
+    merged: dict = {}
+    for raw in responses:
+        for key, value in raw.items():
+            have = merged.get(key)
+            if have is None:
+                merged[key] = value
+            elif isinstance(have, (list, dict)) and isinstance(value, (list, dict)):
+                merged[key] = (list(have) if isinstance(have, list) else [have]) + (
+                    value if isinstance(value, list) else [value]
+                )
+    return merged
+
 
 # ── Result wrapper ─────────────────────────────────────────────────────────────
 
@@ -47,10 +129,14 @@ class HFBatchResult:
     Provides both attribute access (result.me) and dict access (result["me"]).
     All list resources (users, posts, etc.) default to [] if not in the batch.
     The 'me' resource defaults to {} (single object, not a list).
+
+    failed is the number of /read calls of a split batch that returned
+    nothing; their rows are missing from the result.
     """
 
-    def __init__(self, raw: dict):
-        self._raw = raw or {}
+    def __init__(self, raw: dict, failed: int = 0):
+        self._raw   = raw or {}
+        self.failed = failed
 
         me_raw = self._raw.get("me")
         if isinstance(me_raw, list):
@@ -95,6 +181,11 @@ class HFBatchResult:
         return f"HFBatchResult(resources={keys})"
 
 
+def _project(resource: str, fields: Fields) -> dict | None:
+    """The caller's projection for a builder, or None to use its default."""
+    return project(resource, fields) if fields else None
+
+
 # ── Batch builder ──────────────────────────────────────────────────────────────
 
 class HFBatch:
@@ -103,6 +194,9 @@ class HFBatch:
 
     Chain calls to describe what you want, then call fetch() once.
 
+    Every builder takes fields= — a profile name ("minimal", "summary",
+    "full"), a list of field names or an asks dict. See HFFields.
+
     Note: bytes_sent() and bytes_received() cannot be combined in one batch.
     Use two separate fetch() calls if you need both directions.
     """
@@ -128,10 +222,10 @@ class HFBatch:
         unreadpms: bool = True,
         vault: bool = True,
         advanced: bool = True,
-        fields: dict | None = None,
+        fields: Fields = None,
     ) -> "HFBatch":
         if fields:
-            self._asks["me"] = fields
+            self._asks["me"] = project("me", fields)
         else:
             ask = {
                 "uid": uid, "username": username, "usergroup": usergroup,
@@ -148,13 +242,13 @@ class HFBatch:
             self._asks["me"] = ask
         return self
 
-    def user(self, uid: int, fields: dict | None = None) -> "HFBatch":
+    def user(self, uid: int, fields: Fields = None) -> "HFBatch":
         existing = self._asks.get("users", {})
         uids     = existing.get("_uid", [])
         uids.append(uid)
         self._asks["users"] = {
             "_uid": uids,
-            **(fields or {
+            **(_project("users", fields) or {
                 "uid": True, "username": True, "usergroup": True,
                 "displaygroup": True, "postnum": True, "awards": True,
                 "myps": True, "threadnum": True, "avatar": True,
@@ -163,12 +257,12 @@ class HFBatch:
         }
         return self
 
-    def users(self, uids: list[int], fields: dict | None = None) -> "HFBatch":
+    def users(self, uids: list[int], fields: Fields = None) -> "HFBatch":
         existing = self._asks.get("users", {})
         all_uids = existing.get("_uid", []) + list(uids)
         self._asks["users"] = {
             "_uid": all_uids,
-            **(fields or {
+            **(_project("users", fields) or {
                 "uid": True, "username": True, "usergroup": True,
                 "displaygroup": True, "postnum": True, "awards": True,
                 "myps": True, "threadnum": True, "avatar": True,
@@ -184,9 +278,9 @@ class HFBatch:
         uid: int | None = None,
         page: int = 1,
         perpage: int = 20,
-        fields: dict | None = None,
+        fields: Fields = None,
     ) -> "HFBatch":
-        ask: dict = fields or {
+        ask: dict = _project("posts", fields) or {
             "pid": True, "tid": True, "uid": True, "fid": True,
             "dateline": True, "message": True, "subject": True,
             "edituid": True, "edittime": True, "editreason": True,
@@ -211,9 +305,9 @@ class HFBatch:
         uid: int | None = None,
         page: int = 1,
         perpage: int = 20,
-        fields: dict | None = None,
+        fields: Fields = None,
     ) -> "HFBatch":
-        ask: dict = fields or {
+        ask: dict = _project("threads", fields) or {
             "tid": True, "uid": True, "fid": True, "subject": True,
             "closed": True, "numreplies": True, "views": True,
             "dateline": True, "firstpost": True, "lastpost": True,
@@ -231,10 +325,10 @@ class HFBatch:
         self._asks["threads"] = ask
         return self
 
-    def forums(self, fids: list[int], fields: dict | None = None) -> "HFBatch":
+    def forums(self, fids: list[int], fields: Fields = None) -> "HFBatch":
         self._asks["forums"] = {
             "_fid": fids,
-            **(fields or {
+            **(_project("forums", fields) or {
                 "fid": True, "name": True, "description": True, "type": True,
             }),
         }
@@ -246,7 +340,7 @@ class HFBatch:
         page: int = 1,
         perpage: int = 20,
         include_post: bool = False,
-        fields: dict | None = None,
+        fields: Fields = None,
     ) -> "HFBatch":
         """
         Include bytes received by a user.
@@ -264,7 +358,7 @@ class HFBatch:
             )
         self._bytes_direction = "received"
 
-        ask: dict = fields or {
+        ask: dict = _project("bytes", fields) or {
             "id": True, "amount": True, "dateline": True,
             "type": True, "reason": True, "from": True, "to": True,
         }
@@ -281,7 +375,7 @@ class HFBatch:
         uid: int,
         page: int = 1,
         perpage: int = 20,
-        fields: dict | None = None,
+        fields: Fields = None,
     ) -> "HFBatch":
         """
         Include bytes sent by a user.
@@ -297,7 +391,7 @@ class HFBatch:
             )
         self._bytes_direction = "sent"
 
-        ask: dict = fields or {
+        ask: dict = _project("bytes", fields) or {
             "id": True, "amount": True, "dateline": True,
             "type": True, "reason": True, "from": True, "to": True,
         }
@@ -313,7 +407,7 @@ class HFBatch:
         cids: list[int] | None = None,
         page: int = 1,
         perpage: int = 30,
-        fields: dict | None = None,
+        fields: Fields = None,
     ) -> "HFBatch":
         """
         Include contracts in the batch.
@@ -322,7 +416,7 @@ class HFBatch:
         authenticated token's own user. Pass your own UID or a list of cids
         for specific contract lookups.
         """
-        ask: dict = fields or {
+        ask: dict = _project("contracts", fields) or {
             "cid": True, "dateline": True, "otherdateline": True,
             "public": True, "status": True, "istatus": True, "ostatus": True,
             "cancelstatus": True, "type": True, "tid": True,
@@ -347,9 +441,9 @@ class HFBatch:
         crids: list[int] | None = None,
         page: int = 1,
         perpage: int = 30,
-        fields: dict | None = None,
+        fields: Fields = None,
     ) -> "HFBatch":
-        ask: dict = fields or {
+        ask: dict = _project("bratings", fields) or {
             "crid": True, "contractid": True, "fromid": True, "toid": True,
             "dateline": True, "amount": True, "message": True,
         }
@@ -374,9 +468,9 @@ class HFBatch:
         self,
         cids: list[int] | None = None,
         cdids: list[int] | None = None,
-        fields: dict | None = None,
+        fields: Fields = None,
     ) -> "HFBatch":
-        ask: dict = fields or {
+        ask: dict = _project("disputes", fields) or {
             "cdid": True, "contractid": True, "claimantuid": True,
             "defendantuid": True, "dateline": True, "status": True,
             "dispute_tid": True, "claimantnotes": True, "defendantnotes": True,
@@ -392,7 +486,9 @@ class HFBatch:
 
     async def fetch(self) -> HFBatchResult:
         """
-        Execute the batch request — fires a single /read POST with all accumulated asks.
+        Execute the batch request — one /read POST with all accumulated asks,
+        or several if an id list is over its ID_LIMITS. Those are started
+        together but paced by the rate limiter (see the module docstring).
         Resets the builder after fetching so it can be reused.
         """
         if not self._asks:
@@ -401,12 +497,24 @@ class HFBatch:
         asks = dict(self._asks)
         self._reset()
 
-        raw = await self._client.read(asks)
-        return HFBatchResult(raw or {})
+        calls = split_asks(asks)
+        if len(calls) == 1:
+            raw = await self._client.read(asks)
+            return HFBatchResult(raw or {})
+
+        raws   = await asyncio.gather(*(self._client.read(call) for call in calls))
+        failed = sum(1 for raw in raws if raw is None)
+        if failed:
+            log.warning(f"HFBatch: {failed} of {len(calls)} /read calls failed — result is incomplete")
+        return HFBatchResult(_merge([raw for raw in raws if raw]), failed=failed)
 
     def fetch_sync(self) -> HFBatchResult:
-        """Synchronous version of fetch() for non-async contexts."""
-        return asyncio.run(self.fetch())
+        """
+        Synchronous version of fetch() for non-async contexts.
+        Runs on HFClient's shared background loop, reusing its connections.
+        """
+        from HFClient import run_sync
+        return run_sync(self.fetch())
 
     async def __aenter__(self) -> "HFBatch":
         return self
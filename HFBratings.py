@@ -5,11 +5,7 @@ Requires 'Contracts' scope.
 """
 
 from HFClient import HFClient
-
-_FIELDS = {
-    "crid": True, "contractid": True, "fromid": True, "toid": True,
-    "dateline": True, "amount": True, "message": True,
-}
+from HFFields import Fields, project
 
 
 class HFBratings(HFClient):
@@ -24,51 +20,101 @@ class HFBratings(HFClient):
         ratings = ratings_api.get_received(uid=761578)
         ratings = ratings_api.get_given(uid=761578)
         ratings = ratings_api.get_by_contract(cid=409675)
+
+        # Inside an event loop, use the async twins:
+        ratings = await ratings_api.aget_received(uid=761578)
+
+        # Skip the review text (see HFFields):
+        ratings = ratings_api.get_received(uid=761578, fields="summary")
     """
 
-    def get(self, crids: list[int]) -> list[dict]:
-        """Get b-ratings by b-rating ID(s)."""
-        data = self.read_sync({"bratings": {"_crid": crids, **_FIELDS}})
+    async def aget(self, crids: list[int], fields: Fields = None) -> list[dict]:
+        """Async version of get()."""
+        data = await self.read({"bratings": {"_crid": crids, **project("bratings", fields)}})
         return self._unwrap(data, "bratings")
 
-    def get_received(self, uid: int, page: int = 1, perpage: int = 30) -> list[dict]:
-        """Get b-ratings received by a user (single page)."""
-        data = self.read_sync({"bratings": {
+    def get(self, crids: list[int], fields: Fields = None) -> list[dict]:
+        """Get b-ratings by b-rating ID(s)."""
+        return self._run_sync(self.aget(crids, fields))
+
+    async def aget_received(
+        self, uid: int, page: int = 1, perpage: int = 30, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_received()."""
+        data = await self.read({"bratings": {
             "_to":      [uid],
             "_page":    page,
             "_perpage": perpage,
-            **_FIELDS,
+            **project("bratings", fields),
         }})
         return self._unwrap(data, "bratings")
 
-    def get_given(self, uid: int, page: int = 1, perpage: int = 30) -> list[dict]:
-        """Get b-ratings given by a user (single page)."""
-        data = self.read_sync({"bratings": {
+    def get_received(
+        self, uid: int, page: int = 1, perpage: int = 30, fields: Fields = None
+    ) -> list[dict]:
+        """Get b-ratings received by a user (single page)."""
+        return self._run_sync(self.aget_received(uid, page, perpage, fields))
+
+    async def aget_given(
+        self, uid: int, page: int = 1, perpage: int = 30, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_given()."""
+        data = await self.read({"bratings": {
             "_from":    [uid],
             "_page":    page,
             "_perpage": perpage,
-            **_FIELDS,
+            **project("bratings", fields),
         }})
         return self._unwrap(data, "bratings")
 
-    def get_by_contract(self, cid: int) -> list[dict]:
-        """Get b-ratings for a specific contract."""
-        data = self.read_sync({"bratings": {"_cid": [cid], **_FIELDS}})
+    def get_given(
+        self, uid: int, page: int = 1, perpage: int = 30, fields: Fields = None
+    ) -> list[dict]:
+        """Get b-ratings given by a user (single page)."""
+        return self._run_sync(self.aget_given(uid, page, perpage, fields))
+
+    async def aget_by_contract(self, cid: int, fields: Fields = None) -> list[dict]:
+        """Async version of get_by_contract()."""
+        data = await self.read({"bratings": {"_cid": [cid], **project("bratings", fields)}})
         return self._unwrap(data, "bratings")
 
+    def get_by_contract(self, cid: int, fields: Fields = None) -> list[dict]:
+        """Get b-ratings for a specific contract."""
+        return self._run_sync(self.aget_by_contract(cid, fields))
+
+    async def aget_score(self, uid: int) -> int:
+        """Async version of get_score()."""
+        ratings = await self.aget_all_received(uid, fields="minimal")
+        return sum(int(r.get("amount", 0)) for r in ratings)
+
     def get_score(self, uid: int) -> int:
         """
         Calculate total b-rating score for a user (sum of all received amounts).
         """
-        ratings = self.get_all_received(uid)
-        return sum(int(r.get("amount", 0)) for r in ratings)
+        return self._run_sync(self.aget_score(uid))
+
+    async def aget_all_received(
+        self, uid: int, perpage: int = 30, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_all_received()."""
+        from HFPaginator import HFPaginator
+        return await HFPaginator.aget_all_bratings_received(self, uid, perpage, max_pages, fields)
 
-    def get_all_received(self, uid: int, perpage: int = 30, max_pages: int = 50) -> list[dict]:
+    def get_all_received(
+        self, uid: int, perpage: int = 30, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
         """Get ALL b-ratings received by a user, automatically paginating."""
+        return self._run_sync(self.aget_all_received(uid, perpage, max_pages, fields))
+
+    async def aget_all_given(
+        self, uid: int, perpage: int = 30, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_all_given()."""
         from HFPaginator import HFPaginator
-        return HFPaginator.get_all_bratings_received(self, uid, perpage, max_pages)
+        return await HFPaginator.aget_all_bratings_given(self, uid, perpage, max_pages, fields)
 
-    def get_all_given(self, uid: int, perpage: int = 30, max_pages: int = 50) -> list[dict]:
+    def get_all_given(
+        self, uid: int, perpage: int = 30, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
         """Get ALL b-ratings given by a user, automatically paginating."""
-        from HFPaginator import HFPaginator
-        return HFPaginator.get_all_bratings_given(self, uid, perpage, max_pages)
+        return self._run_sync(self.aget_all_given(uid, perpage, max_pages, fields))
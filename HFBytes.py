@@ -9,26 +9,7 @@ AMOUNT CAST WARNING:
 """
 
 from HFClient import HFClient
-
-_FIELDS = {
-    "id":       True,
-    "amount":   True,
-    "dateline": True,
-    "type":     True,
-    "reason":   True,
-    "from":     True,
-    "to":       True,
-    "post":     True,
-}
-
-_FIELDS_LIGHT = {
-    "id":       True,
-    "amount":   True,
-    "dateline": True,
-    "type":     True,
-    "reason":   True,
-    "from":     True,
-}
+from HFFields import PROFILE_FULL, PROFILE_SUMMARY, Fields, project
 
 
 def parse_amount(raw) -> int:
@@ -55,6 +36,11 @@ def parse_amount(raw) -> int:
         return 0
 
 
+def _projection(fields: Fields, include_post: bool) -> dict:
+    """Read fields: the "full" profile with include_post, else "summary"."""
+    return project("bytes", fields, default=PROFILE_FULL if include_post else PROFILE_SUMMARY)
+
+
 class HFBytes(HFClient):
     """
     Send and read bytes transactions (/read/bytes and /write/bytes endpoints).
@@ -71,41 +57,112 @@ class HFBytes(HFClient):
         bytes_api.withdraw(50)
         bytes_api.bump(tid=6083735)
         txs = bytes_api.get_received(uid=761578)
+        txs = await bytes_api.aget_received(uid=761578)   # inside an event loop
 
         # Safe amount parsing:
         for tx in txs:
             amount = parse_amount(tx["amount"])   # always use this
+
+    FIELD PROFILES:
+        Read methods take fields= ("minimal", "summary", "full", a list of
+        field names or an asks dict — see HFFields). Without it they ask for
+        "summary", or "full" (adds to + the linked post) with include_post.
     """
 
     # Expose module-level helper as a static method for convenience
     parse_amount = staticmethod(parse_amount)
 
-    def send(self, to_uid: int, amount: int, reason: str = "", pid: int = 0) -> str | None:
-        """Send bytes to a user. Returns transaction ID or None on failure."""
+    # ── Write asks (shared with HFOutbox) ─────────────────────────────────────
+
+    @staticmethod
+    def send_asks(to_uid: int, amount: int, reason: str = "", pid: int = 0) -> dict:
+        """Build the asks for send()."""
         ask: dict = {
             "_uid":    str(to_uid),
             "_amount": str(amount),
         }
         if reason: ask["_reason"] = reason
         if pid:    ask["_pid"]    = str(pid)
-        data = self.write_sync({"bytes": ask})
+        return {"bytes": ask}
+
+    @staticmethod
+    def deposit_asks(amount: int) -> dict:
+        """Build the asks for deposit()."""
+        return {"bytes": {"_deposit": amount}}
+
+    @staticmethod
+    def withdraw_asks(amount: int) -> dict:
+        """Build the asks for withdraw()."""
+        return {"bytes": {"_withdraw": amount}}
+
+    @staticmethod
+    def bump_asks(tid: int) -> dict:
+        """Build the asks for bump()."""
+        return {"bytes": {"_bump": tid}}
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+    # idempotency_key lets a write retry when nothing reached HF and answers a
+    # repeat call from memory — see HFClient.write(). For writes that must
+    # survive a crash or go out in bulk, use HFOutbox.
+
+    async def asend(
+        self, to_uid: int, amount: int, reason: str = "", pid: int = 0, idempotency_key: str | None = None
+    ) -> str | None:
+        """Async version of send()."""
+        data = await self.write(self.send_asks(to_uid, amount, reason, pid), idempotency_key)
         rows = self._unwrap(data, "bytes")
         return rows[0].get("id") if rows else None
 
-    def deposit(self, amount: int) -> bool:
+    def send(
+        self, to_uid: int, amount: int, reason: str = "", pid: int = 0, idempotency_key: str | None = None
+    ) -> str | None:
+        """Send bytes to a user. Returns transaction ID or None on failure."""
+        return self._run_sync(self.asend(to_uid, amount, reason, pid, idempotency_key))
+
+    async def adeposit(self, amount: int, idempotency_key: str | None = None) -> bool:
+        """Async version of deposit()."""
+        data = await self.write(self.deposit_asks(amount), idempotency_key)
+        return data is not None
+
+    def deposit(self, amount: int, idempotency_key: str | None = None) -> bool:
         """Deposit bytes from your account into your API client vault."""
-        data = self.write_sync({"bytes": {"_deposit": amount}})
+        return self._run_sync(self.adeposit(amount, idempotency_key))
+
+    async def awithdraw(self, amount: int, idempotency_key: str | None = None) -> bool:
+        """Async version of withdraw()."""
+        data = await self.write(self.withdraw_asks(amount), idempotency_key)
         return data is not None
 
-    def withdraw(self, amount: int) -> bool:
+    def withdraw(self, amount: int, idempotency_key: str | None = None) -> bool:
         """Withdraw bytes from your API client vault back to your account."""
-        data = self.write_sync({"bytes": {"_withdraw": amount}})
+        return self._run_sync(self.awithdraw(amount, idempotency_key))
+
+    async def abump(self, tid: int, idempotency_key: str | None = None) -> bool:
+        """Async version of bump()."""
+        data = await self.write(self.bump_asks(tid), idempotency_key)
         return data is not None
 
-    def bump(self, tid: int) -> bool:
+    def bump(self, tid: int, idempotency_key: str | None = None) -> bool:
         """Bump a thread using bytes."""
-        data = self.write_sync({"bytes": {"_bump": tid}})
-        return data is not None
+        return self._run_sync(self.abump(tid, idempotency_key))
+
+    async def aget_received(
+        self,
+        uid: int,
+        page: int = 1,
+        perpage: int = 20,
+        include_post: bool = False,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_received()."""
+        ask = _projection(fields, include_post)
+        data = await self.read({"bytes": {
+            "_to":      [uid],
+            "_page":    page,
+            "_perpage": perpage,
+            **ask,
+        }})
+        return self._unwrap(data, "bytes")
 
     def get_received(
         self,
@@ -113,6 +170,7 @@ class HFBytes(HFClient):
         page: int = 1,
         perpage: int = 20,
         include_post: bool = False,
+        fields: Fields = None,
     ) -> list[dict]:
         """
         Get bytes transactions received by a user.
@@ -120,12 +178,23 @@ class HFBytes(HFClient):
         Note: tx["amount"] is a float string ("430.43"). Use parse_amount()
         or int(float(tx["amount"])) — never int(tx["amount"]) directly.
         """
-        fields = dict(_FIELDS) if include_post else dict(_FIELDS_LIGHT)
-        data = self.read_sync({"bytes": {
-            "_to":      [uid],
+        return self._run_sync(self.aget_received(uid, page, perpage, include_post, fields))
+
+    async def aget_sent(
+        self,
+        uid: int,
+        page: int = 1,
+        perpage: int = 20,
+        include_post: bool = False,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_sent()."""
+        ask = _projection(fields, include_post)
+        data = await self.read({"bytes": {
+            "_from":    [uid],
             "_page":    page,
             "_perpage": perpage,
-            **fields,
+            **ask,
         }})
         return self._unwrap(data, "bytes")
 
@@ -135,6 +204,7 @@ class HFBytes(HFClient):
         page: int = 1,
         perpage: int = 20,
         include_post: bool = False,
+        fields: Fields = None,
     ) -> list[dict]:
         """
         Get bytes transactions sent by a user.
@@ -142,20 +212,35 @@ class HFBytes(HFClient):
         Note: tx["amount"] is a float string ("430.43"). Use parse_amount()
         or int(float(tx["amount"])) — never int(tx["amount"]) directly.
         """
-        fields = dict(_FIELDS) if include_post else dict(_FIELDS_LIGHT)
-        data = self.read_sync({"bytes": {
-            "_from":    [uid],
-            "_page":    page,
-            "_perpage": perpage,
-            **fields,
-        }})
+        return self._run_sync(self.aget_sent(uid, page, perpage, include_post, fields))
+
+    async def aget_by_id(
+        self, tx_ids: list[int], include_post: bool = False, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_by_id()."""
+        ask = _projection(fields, include_post)
+        data = await self.read({"bytes": {"_id": tx_ids, **ask}})
         return self._unwrap(data, "bytes")
 
-    def get_by_id(self, tx_ids: list[int], include_post: bool = False) -> list[dict]:
+    def get_by_id(
+        self, tx_ids: list[int], include_post: bool = False, fields: Fields = None
+    ) -> list[dict]:
         """Get specific transactions by ID."""
-        fields = dict(_FIELDS) if include_post else dict(_FIELDS_LIGHT)
-        data = self.read_sync({"bytes": {"_id": tx_ids, **fields}})
-        return self._unwrap(data, "bytes")
+        return self._run_sync(self.aget_by_id(tx_ids, include_post, fields))
+
+    async def aget_all_received(
+        self,
+        uid: int,
+        perpage: int = 20,
+        max_pages: int = 50,
+        stop_at_id: int = 0,
+        include_post: bool = False,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_received()."""
+        from HFPaginator import HFPaginator
+        ask = _projection(fields, include_post)
+        return await HFPaginator.aget_all_bytes_received(self, uid, perpage, max_pages, stop_at_id, ask)
 
     def get_all_received(
         self,
@@ -164,17 +249,28 @@ class HFBytes(HFClient):
         max_pages: int = 50,
         stop_at_id: int = 0,
         include_post: bool = False,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get ALL bytes received by a user, automatically paginating."""
+        return self._run_sync(self.aget_all_received(uid, perpage, max_pages, stop_at_id, include_post, fields))
+
+    async def aget_all_sent(
+        self,
+        uid: int,
+        perpage: int = 20,
+        max_pages: int = 50,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_sent()."""
         from HFPaginator import HFPaginator
-        return HFPaginator.get_all_bytes_received(self, uid, perpage, max_pages, stop_at_id)
+        return await HFPaginator.aget_all_bytes_sent(self, uid, perpage, max_pages, fields)
 
     def get_all_sent(
         self,
         uid: int,
         perpage: int = 20,
         max_pages: int = 50,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get ALL bytes sent by a user, automatically paginating."""
-        from HFPaginator import HFPaginator
-        return HFPaginator.get_all_bytes_sent(self, uid, perpage, max_pages)
+        return self._run_sync(self.aget_all_sent(uid, perpage, max_pages, fields))
@@ -0,0 +1,230 @@
+"""
+HFCircuitBreaker — stop calling HF through a route that keeps failing.
+
+During an HF outage or a Cloudflare block, every call returns 403/503 or
+times out, and every watcher keeps polling anyway — spending quota and
+opening connections for nothing. HFClient checks a CircuitBreaker for each
+(route, endpoint) pair before sending, where route is the proxy host:port
+or "direct":
+
+    closed     Normal. FAILURE_THRESHOLD consecutive failures open it.
+    open       Calls are refused immediately — no network, no rate budget.
+               After the reset timeout it goes half-open.
+    half_open  Exactly one probe call is let through. Success closes the
+               breaker; failure re-opens it with the reset timeout doubled
+               (up to MAX_RESET_TIMEOUT). Other calls are refused meanwhile.
+
+Failures: transport errors (timeout, proxy, connect) and the statuses
+Cloudflare answers when it blocks us or can't reach HF — 403, 502, 503,
+504 and 520–524 — unless the body is HF's own JSON error. HF itself
+answers 503 {"success": false, ...} for a missing scope or a query it
+won't run (disputes by _uid), and 403 for some permission
+errors; those mean HF is reachable and would otherwise let one bad query
+open the breaker for every caller on the route. Any other HTTP response
+(200, 401, 404, 500, ...) counts as a success.
+
+A refused call returns None like any other failure. With an HFProxyPool it
+fails over to the next proxy instead.
+
+Usage:
+    from HFCircuitBreaker import add_listener, get_breaker_stats
+
+    def on_change(route, endpoint, old, new):
+        print(f"breaker {route} /{endpoint}: {old} → {new}")
+
+    add_listener(on_change)      # plain function or coroutine function
+    print(get_breaker_stats())
+
+    # Tune before the first call:
+    import HFCircuitBreaker
+    HFCircuitBreaker.FAILURE_THRESHOLD = 3
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+log = logging.getLogger("hfapi.breaker")
+
+FAILURE_THRESHOLD = 5       # consecutive failures that open a breaker
+RESET_TIMEOUT     = 30.0    # seconds open before the first probe
+MAX_RESET_TIMEOUT = 300.0   # cap for the doubling after failed probes
+
+CLOSED    = "closed"
+OPEN      = "open"
+HALF_OPEN = "half_open"
+
+Listener = Callable[[str, str, str, str], Any]   # (route, endpoint, old, new)
+
+_listeners: list[Listener] = []
+_listener_tasks: set[asyncio.Task] = set()   # keeps async listener calls alive
+
+
+class CircuitBreaker:
+    """Breaker state for one (route, endpoint) pair. Thread-safe."""
+
+    def __init__(
+        self,
+        route: str,
+        endpoint: str,
+        threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+        max_reset_timeout: float = MAX_RESET_TIMEOUT,
+    ):
+        self.route    = route
+        self.endpoint = endpoint
+        self.threshold         = threshold
+        self.reset_timeout     = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+
+        self._lock      = threading.Lock()
+        self._state     = CLOSED
+        self._failures  = 0
+        self._opened_at = 0.0
+        self._timeout   = reset_timeout
+        self._probing   = False
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self._timeout:
+            return HALF_OPEN
+        return self._state
+
+    # ── Call gate ──────────────────────────────────────────────────────────────
+
+    def allow(self) -> bool:
+        """
+        True if a call may go out now. In half-open state only the first
+        caller gets True (the probe); it must then call success(), failure()
+        or abandon().
+        """
+        change = None
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                if self._state != HALF_OPEN:
+                    change, self._state = (self._state, HALF_OPEN), HALF_OPEN
+                allowed = True
+            else:
+                self.short_circuited += 1
+                allowed = False
+        if change:
+            self._notify(*change)
+        return allowed
+
+    def success(self) -> None:
+        change = None
+        with self._lock:
+            self._failures = 0
+            self._probing  = False
+            self._timeout  = self.reset_timeout
+            if self._state != CLOSED:
+                change, self._state = (self._state, CLOSED), CLOSED
+        if change:
+            self._notify(*change)
+
+    def failure(self) -> None:
+        change = None
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN:
+                # Failed probe — back off harder before the next one
+                self._timeout = min(self.max_reset_timeout, self._timeout * 2)
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.threshold):
+                change, self._state = (self._state, OPEN), OPEN
+                self._opened_at = time.monotonic()
+            self._probing = False
+        if change:
+            self._notify(*change)
+
+    def abandon(self) -> None:
+        """A call let through by allow() never produced an outcome (cancelled, no budget)."""
+        with self._lock:
+            self._probing = False
+
+    # ── Notification ───────────────────────────────────────────────────────────
+
+    def _notify(self, old: str, new: str) -> None:
+        level = logging.WARNING if new == OPEN else logging.INFO
+        log.log(level, f"Circuit breaker {self.route} /{self.endpoint}: {old} → {new}")
+        for listener in list(_listeners):
+            try:
+                result = listener(self.route, self.endpoint, old, new)
+                if inspect.isawaitable(result):
+                    task = asyncio.get_running_loop().create_task(result)
+                    _listener_tasks.add(task)
+                    task.add_done_callback(_listener_tasks.discard)
+            except Exception as e:
+                log.warning(f"Circuit breaker listener error: {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state":           self._current_state(time.monotonic()),
+                "failures":        self._failures,
+                "reset_timeout":   self._timeout,
+                "short_circuited": self.short_circuited,
+            }
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker({self.route} /{self.endpoint}, state={self.state})"
+
+
+# ── Registry ───────────────────────────────────────────────────────────────────
+
+_breakers: dict[tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(route: str, endpoint: str) -> CircuitBreaker:
+    """Return the breaker for (route, endpoint), creating it with the module settings."""
+    key     = (route, endpoint)
+    breaker = _breakers.get(key)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(key)
+            if breaker is None:
+                breaker = _breakers[key] = CircuitBreaker(
+                    route, endpoint, FAILURE_THRESHOLD, RESET_TIMEOUT, MAX_RESET_TIMEOUT,
+                )
+    return breaker
+
+
+def get_breaker_stats() -> dict:
+    """{"direct /read": {"state": "closed", "failures": 0, ...}, ...}"""
+    return {f"{route} /{endpoint}": b.stats() for (route, endpoint), b in list(_breakers.items())}
+
+
+def add_listener(listener: Listener) -> None:
+    """Call listener(route, endpoint, old_state, new_state) on every state change."""
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+# Statuses from Cloudflare in front of HF when the route is blocked or HF is down
+BREAKER_STATUSES = frozenset({403, 502, 503, 504, 520, 521, 522, 523, 524})
+
+
+def is_breaker_failure(status: int | None, failure: str | None, body: bytes = b"") -> bool:
+    """True if a call outcome counts against the breaker."""
+    if failure is not None:
+        return failure in ("timeout", "proxy", "connect", "error")
+    # A JSON body is HF answering — Cloudflare's pages are HTML
+    return status in BREAKER_STATUSES and not body.lstrip()[:1] == b"{"
@@ -0,0 +1,149 @@
+"""
+HFCodec — JSON encoding for the asks form field and decoding of API responses.
+
+Every API call encodes its asks dict and decodes the response body. With
+large batched users/posts responses, stdlib json is the biggest CPU cost in
+a watcher process. HFCodec picks the fastest installed backend:
+
+    orjson   — pip install orjson
+    msgspec  — pip install msgspec
+    json     — stdlib fallback, always available
+
+All three produce the same Python objects (dicts, lists, str, int, float,
+bool, None), so nothing downstream changes.
+
+Usage:
+    from HFCodec import get_codec, set_codec
+
+    print(get_codec().name)   # "orjson"
+    set_codec("json")         # force the stdlib, e.g. while debugging
+
+    # Or plug in your own — any object with name, dumps, loads and canonical:
+    set_codec(MyCodec())
+
+    pip install hf-api[speed]   # installs orjson
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Protocol
+
+log = logging.getLogger("hfapi.codec")
+
+
+class Codec(Protocol):
+    name: str
+
+    def dumps(self, obj: Any) -> str:
+        """Encode obj as compact JSON text."""
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON bytes or text. Raises on invalid input."""
+
+    def canonical(self, obj: Any) -> str:
+        """Encode with sorted keys, so equal objects give equal strings."""
+
+
+# ── Backends ───────────────────────────────────────────────────────────────────
+
+class StdlibCodec:
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def canonical(self, obj: Any) -> str:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson    = orjson
+        self._opts      = orjson.OPT_NON_STR_KEYS
+        self._opts_sort = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj, default=str, option=self._opts).decode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+    def canonical(self, obj: Any) -> str:
+        return self._orjson.dumps(obj, default=str, option=self._opts_sort).decode()
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+        self._sorted  = msgspec.json.Encoder(enc_hook=str, order="sorted")
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode()
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+    def canonical(self, obj: Any) -> str:
+        return self._sorted.encode(obj).decode()
+
+
+_BACKENDS = {
+    "orjson":  OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json":    StdlibCodec,
+}
+
+
+def _best_available() -> Codec:
+    for name in ("orjson", "msgspec"):
+        try:
+            return _BACKENDS[name]()
+        except (ImportError, TypeError):
+            # TypeError: msgspec too old for order="sorted"
+            continue
+    return StdlibCodec()
+
+
+# ── Active codec ───────────────────────────────────────────────────────────────
+
+_codec: Codec = _best_available()
+log.debug(f"JSON codec: {_codec.name}")
+
+
+def get_codec() -> Codec:
+    """Return the codec HFClient is currently using."""
+    return _codec
+
+
+def set_codec(codec: Codec | str) -> Codec:
+    """
+    Switch the process-wide codec. Accepts "orjson", "msgspec", "json" or a
+    codec object. Raises ImportError if the named backend isn't installed.
+    """
+    global _codec
+    _codec = _BACKENDS[codec]() if isinstance(codec, str) else codec
+    return _codec
+
+
+def dumps(obj: Any) -> str:
+    return _codec.dumps(obj)
+
+
+def loads(data: bytes | str) -> Any:
+    return _codec.loads(data)
+
+
+def canonical(obj: Any) -> str:
+    return _codec.canonical(obj)
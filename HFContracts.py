@@ -18,6 +18,7 @@ istatus / ostatus: "0" = not yet approved, "1" = approved
 """
 
 from HFClient import HFClient
+from HFFields import Fields, project
 
 # ── Status constants (confirmed live) ─────────────────────────────────────────
 
@@ -69,51 +70,6 @@ _POSITION_TO_TYPE_CODE = {
     "vouch_copy": CONTRACT_TYPE_VOUCHCOPY,
 }
 
-# ── Fields ────────────────────────────────────────────────────────────────────
-
-_FIELDS = {
-    "cid":           True,
-    "dateline":      True,
-    "otherdateline": True,
-    "public":        True,
-    "timeout_days":  True,
-    "timeout":       True,
-    "status":        True,
-    "istatus":       True,
-    "ostatus":       True,
-    "cancelstatus":  True,
-    "type":          True,
-    "tid":           True,
-    "inituid":       True,
-    "otheruid":      True,
-    "muid":          True,
-    "iprice":        True,
-    "oprice":        True,
-    "iproduct":      True,
-    "oproduct":      True,
-    "icurrency":     True,
-    "ocurrency":     True,
-    "terms":         True,
-    "iaddress":      True,
-    "oaddress":      True,
-}
-
-_SUMMARY_FIELDS = {
-    "cid":          True,
-    "status":       True,
-    "istatus":      True,
-    "ostatus":      True,
-    "cancelstatus": True,
-    "type":         True,
-    "inituid":      True,
-    "otheruid":     True,
-    "muid":         True,
-    "iproduct":     True,
-    "iprice":       True,
-    "icurrency":    True,
-    "dateline":     True,
-}
-
 
 def _is_set(val) -> bool:
     return bool(val) and str(val) not in ("", "0", "None", "null")
@@ -178,9 +134,26 @@ class HFContracts(HFClient):
     APPROVAL FLAGS — istatus / ostatus:
         "0" = not yet approved by this party
         "1" = approved by this party
+
+    ASYNC:
+        Every method that calls the API has an "a"-prefixed coroutine twin
+        (aget, aget_all_mine, aget_summary, ...). The status/type filter
+        helpers are thin filters over get_all_mine() — from async code,
+        filter the result of aget_all_mine() directly.
+
+    FIELD PROFILES:
+        Read methods take fields= — "minimal", "summary", "full" (default),
+        a list of field names or an asks dict. "summary" skips terms,
+        addresses and the other long text fields. The filter helpers below
+        need the field they filter on in the projection. See HFFields.
     """
 
-    def get(self, cids: list[int], fields: dict = None) -> list[dict]:
+    async def aget(self, cids: list[int], fields: Fields = None) -> list[dict]:
+        """Async version of get()."""
+        data = await self.read({"contracts": {"_cid": cids, **project("contracts", fields)}})
+        return self._unwrap(data, "contracts")
+
+    def get(self, cids: list[int], fields: Fields = None) -> list[dict]:
         """
         Get contracts by specific contract ID(s).
 
@@ -188,10 +161,23 @@ class HFContracts(HFClient):
         but only if the contract is public. Private contracts by CID that
         don't involve you will return empty.
         """
-        data = self.read_sync({"contracts": {"_cid": cids, **(fields or _FIELDS)}})
+        return self._run_sync(self.aget(cids, fields))
+
+    async def aget_mine(
+        self, uid: int, page: int = 1, perpage: int = 30, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_mine()."""
+        data = await self.read({"contracts": {
+            "_uid":     [uid],
+            "_page":    page,
+            "_perpage": perpage,
+            **project("contracts", fields),
+        }})
         return self._unwrap(data, "contracts")
 
-    def get_mine(self, uid: int, page: int = 1, perpage: int = 30) -> list[dict]:
+    def get_mine(
+        self, uid: int, page: int = 1, perpage: int = 30, fields: Fields = None
+    ) -> list[dict]:
         """
         Get contracts for the authenticated token owner (single page).
 
@@ -201,41 +187,55 @@ class HFContracts(HFClient):
             uid:     Your UID.
             page:    Page number (default 1).
             perpage: Results per page (default 30, max 30).
+            fields:  Field profile or projection (default "full").
         """
-        data = self.read_sync({"contracts": {
-            "_uid":     [uid],
-            "_page":    page,
-            "_perpage": perpage,
-            **_FIELDS,
-        }})
-        return self._unwrap(data, "contracts")
+        return self._run_sync(self.aget_mine(uid, page, perpage, fields))
+
+    async def aget_by_user(
+        self, uid: int, page: int = 1, perpage: int = 30, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_by_user()."""
+        return await self.aget_mine(uid, page, perpage, fields)
 
-    def get_by_user(self, uid: int, page: int = 1, perpage: int = 30) -> list[dict]:
+    def get_by_user(
+        self, uid: int, page: int = 1, perpage: int = 30, fields: Fields = None
+    ) -> list[dict]:
         """Alias for get_mine(). uid must be the token owner's own UID."""
-        return self.get_mine(uid, page, perpage)
+        return self.get_mine(uid, page, perpage, fields)
+
+    async def aget_all_mine(
+        self, uid: int, perpage: int = 30, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_all_mine()."""
+        from HFPaginator import HFPaginator
+        return await HFPaginator.aget_all_contracts_by_user(self, uid, perpage, max_pages, fields)
 
-    def get_all_mine(self, uid: int, perpage: int = 30, max_pages: int = 50) -> list[dict]:
+    def get_all_mine(
+        self, uid: int, perpage: int = 30, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
         """
         Get ALL contracts for the authenticated token owner, auto-paginating.
 
         OWNER-SCOPED: uid must be your own UID from the me endpoint.
         """
-        from HFPaginator import HFPaginator
-        return HFPaginator.get_all_contracts_by_user(self, uid, perpage, max_pages)
+        return self._run_sync(self.aget_all_mine(uid, perpage, max_pages, fields))
 
-    def get_all_by_user(self, uid: int, perpage: int = 30, max_pages: int = 50) -> list[dict]:
-        """Alias for get_all_mine(). uid must be the token owner's own UID."""
-        return self.get_all_mine(uid, perpage, max_pages)
+    async def aget_all_by_user(
+        self, uid: int, perpage: int = 30, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_all_by_user()."""
+        return await self.aget_all_mine(uid, perpage, max_pages, fields)
 
-    def get_full(self, cid: int) -> dict | None:
-        """
-        Get a single contract with all fields and nested objects.
+    def get_all_by_user(
+        self, uid: int, perpage: int = 30, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
+        """Alias for get_all_mine(). uid must be the token owner's own UID."""
+        return self.get_all_mine(uid, perpage, max_pages, fields)
 
-        Includes inituser, otheruser, escrow (user objects), thread (linked
-        thread), and ibrating/obrating (b-ratings) inline.
-        """
-        rows = self.get([cid], fields={
-            **_FIELDS,
+    async def aget_full(self, cid: int) -> dict | None:
+        """Async version of get_full()."""
+        rows = await self.aget([cid], fields={
+            **project("contracts"),
             "template_id": True,
             "inituser":    ["uid", "username", "reputation", "myps"],
             "otheruser":   ["uid", "username", "reputation", "myps"],
@@ -246,6 +246,15 @@ class HFContracts(HFClient):
         })
         return rows[0] if rows else None
 
+    def get_full(self, cid: int) -> dict | None:
+        """
+        Get a single contract with all fields and nested objects.
+
+        Includes inituser, otheruser, escrow (user objects), thread (linked
+        thread), and ibrating/obrating (b-ratings) inline.
+        """
+        return self._run_sync(self.aget_full(cid))
+
     # ── Value helper ───────────────────────────────────────────────────────────
 
     @staticmethod
@@ -267,7 +276,7 @@ class HFContracts(HFClient):
     # ("complete", "buying", etc.) which never matched — every filter
     # silently returned wrong results.
 
-    def get_active(self, uid: int, max_pages: int = 10) -> list[dict]:
+    def get_active(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
         """
         Get open contracts (Awaiting Approval or Active Deal).
 
@@ -276,11 +285,11 @@ class HFContracts(HFClient):
         OWNER-SCOPED: uid must be your own UID.
         """
         return [
-            c for c in self.get_all_mine(uid, max_pages=max_pages)
+            c for c in self.get_all_mine(uid, max_pages=max_pages, fields=fields)
             if c.get("status") not in _CLOSED_STATUSES
         ]
 
-    def get_pending(self, uid: int, max_pages: int = 10) -> list[dict]:
+    def get_pending(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
         """
         Get contracts awaiting approval from one or both parties.
 
@@ -291,22 +300,22 @@ class HFContracts(HFClient):
         OWNER-SCOPED: uid must be your own UID.
         """
         return [
-            c for c in self.get_all_mine(uid, max_pages=max_pages)
+            c for c in self.get_all_mine(uid, max_pages=max_pages, fields=fields)
             if c.get("status") == CONTRACT_STATUS_AWAITING
         ]
 
-    def get_complete(self, uid: int, max_pages: int = 10) -> list[dict]:
+    def get_complete(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
         """
         Get completed contracts (status == "6").
 
         OWNER-SCOPED: uid must be your own UID.
         """
         return [
-            c for c in self.get_all_mine(uid, max_pages=max_pages)
+            c for c in self.get_all_mine(uid, max_pages=max_pages, fields=fields)
             if c.get("status") == CONTRACT_STATUS_COMPLETE
         ]
 
-    def get_incomplete(self, uid: int, max_pages: int = 10) -> list[dict]:
+    def get_incomplete(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
         """
         Get expired contracts (status == "8").
 
@@ -317,25 +326,38 @@ class HFContracts(HFClient):
         OWNER-SCOPED: uid must be your own UID.
         """
         return [
-            c for c in self.get_all_mine(uid, max_pages=max_pages)
+            c for c in self.get_all_mine(uid, max_pages=max_pages, fields=fields)
             if c.get("status") == CONTRACT_STATUS_EXPIRED
         ]
 
     # Explicit alias with the correct HF label
     get_expired = get_incomplete
 
-    def get_cancelled(self, uid: int, max_pages: int = 10) -> list[dict]:
+    def get_cancelled(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
         """
         Get cancelled contracts (status == "2").
 
         OWNER-SCOPED: uid must be your own UID.
         """
         return [
-            c for c in self.get_all_mine(uid, max_pages=max_pages)
+            c for c in self.get_all_mine(uid, max_pages=max_pages, fields=fields)
             if c.get("status") == CONTRACT_STATUS_CANCELLED
         ]
 
-    def get_disputed(self, uid: int, max_pages: int = 10) -> list[dict]:
+    async def aget_disputed(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
+        """Async version of get_disputed()."""
+        contracts = await self.aget_all_mine(uid, max_pages=max_pages, fields=fields)
+        if not contracts:
+            return []
+        cids = [int(c["cid"]) for c in contracts if c.get("cid")]
+        if not cids:
+            return []
+        from HFDisputes import HFDisputes
+        dispute_rows = await self._sibling(HFDisputes).aget_by_contracts(cids, fields="minimal")
+        disputed_cids = {str(d.get("contractid")) for d in dispute_rows if d.get("contractid")}
+        return [c for c in contracts if str(c.get("cid")) in disputed_cids]
+
+    def get_disputed(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
         """
         Get contracts that have a dispute.
 
@@ -346,40 +368,33 @@ class HFContracts(HFClient):
         Disputes can exist on contracts of any status, including complete and
         cancelled.
         """
-        contracts = self.get_all_mine(uid, max_pages=max_pages)
-        if not contracts:
-            return []
-        cids = [int(c["cid"]) for c in contracts if c.get("cid")]
-        if not cids:
-            return []
-        from HFDisputes import HFDisputes
-        dispute_rows = HFDisputes(self.token, proxy=self.proxy).get_by_contracts(cids)
-        disputed_cids = {str(d.get("contractid")) for d in dispute_rows if d.get("contractid")}
-        return [c for c in contracts if str(c.get("cid")) in disputed_cids]
+        return self._run_sync(self.aget_disputed(uid, max_pages, fields))
 
-    def get_cancellation_requested(self, uid: int, max_pages: int = 10) -> list[dict]:
+    def get_cancellation_requested(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
         """
         Get contracts where a cancellation has been requested but not yet resolved.
 
         OWNER-SCOPED: uid must be your own UID.
         """
         return [
-            c for c in self.get_all_mine(uid, max_pages=max_pages)
+            c for c in self.get_all_mine(uid, max_pages=max_pages, fields=fields)
             if _is_set(c.get("cancelstatus"))
         ]
 
-    def get_middleman_contracts(self, uid: int, max_pages: int = 10) -> list[dict]:
+    def get_middleman_contracts(self, uid: int, max_pages: int = 10, fields: Fields = None) -> list[dict]:
         """
         Get contracts that involve a middleman/escrow (muid is set).
 
         OWNER-SCOPED: uid must be your own UID.
         """
         return [
-            c for c in self.get_all_mine(uid, max_pages=max_pages)
+            c for c in self.get_all_mine(uid, max_pages=max_pages, fields=fields)
             if _is_set(c.get("muid"))
         ]
 
-    def get_by_type(self, uid: int, ctype: str, max_pages: int = 10) -> list[dict]:
+    def get_by_type(
+        self, uid: int, ctype: str, max_pages: int = 10, fields: Fields = None
+    ) -> list[dict]:
         """
         Get contracts filtered by the initiator's position type.
 
@@ -393,33 +408,13 @@ class HFContracts(HFClient):
         # Accept either the text position name or the raw numeric code
         target = _POSITION_TO_TYPE_CODE.get(ctype.lower().strip(), ctype.strip())
         return [
-            c for c in self.get_all_mine(uid, max_pages=max_pages)
+            c for c in self.get_all_mine(uid, max_pages=max_pages, fields=fields)
             if c.get("type") == target
         ]
 
-    def get_summary(self, uid: int, max_pages: int = 50) -> dict:
-        """
-        Return a statistical summary of all contracts for the token owner.
-
-        OWNER-SCOPED: uid must be your own UID.
-
-        Queries the disputes endpoint separately to get an accurate disputed
-        count. Returns disputed=0 gracefully if the disputes call fails.
-
-        Returns:
-            {
-              "total":                int,
-              "by_status":            {"Awaiting Approval": N, "Complete": N, ...},
-              "by_type":              {"Selling": N, "Buying": N, ...},
-              "middleman":            int,
-              "disputed":             int,
-              "cancellation_pending": int,
-            }
-
-        Status and type keys use human-readable labels (e.g. "Active Deal"),
-        not raw numeric codes.
-        """
-        contracts = self.get_all_mine(uid, max_pages=max_pages)
+    async def aget_summary(self, uid: int, max_pages: int = 50) -> dict:
+        """Async version of get_summary()."""
+        contracts = await self.aget_all_mine(uid, max_pages=max_pages, fields="summary")
         by_status: dict[str, int] = {}
         by_type:   dict[str, int] = {}
         middleman = cancel_pending = 0
@@ -444,7 +439,7 @@ class HFContracts(HFClient):
             cids = [int(c["cid"]) for c in contracts if c.get("cid")]
             try:
                 from HFDisputes import HFDisputes
-                dispute_rows = HFDisputes(self.token, proxy=self.proxy).get_by_contracts(cids)
+                dispute_rows = await self._sibling(HFDisputes).aget_by_contracts(cids, fields="minimal")
                 disputed_cids = {str(d.get("contractid")) for d in dispute_rows if d.get("contractid")}
                 disputed = len(disputed_cids)
             except Exception:
@@ -458,3 +453,27 @@ class HFContracts(HFClient):
             "disputed":             disputed,
             "cancellation_pending": cancel_pending,
         }
+
+    def get_summary(self, uid: int, max_pages: int = 50) -> dict:
+        """
+        Return a statistical summary of all contracts for the token owner.
+
+        OWNER-SCOPED: uid must be your own UID.
+
+        Queries the disputes endpoint separately to get an accurate disputed
+        count. Returns disputed=0 gracefully if the disputes call fails.
+
+        Returns:
+            {
+              "total":                int,
+              "by_status":            {"Awaiting Approval": N, "Complete": N, ...},
+              "by_type":              {"Selling": N, "Buying": N, ...},
+              "middleman":            int,
+              "disputed":             int,
+              "cancellation_pending": int,
+            }
+
+        Status and type keys use human-readable labels (e.g. "Active Deal"),
+        not raw numeric codes.
+        """
+        return self._run_sync(self.aget_summary(uid, max_pages))
@@ -2,45 +2,62 @@
 HFDisputes — read dispute data from HackForums.
 Requires 'Contracts' scope.
 
-BUG FIX #1: All self.read() calls changed to self.read_sync().
+BUG FIX #1: Sync methods now run their async twin (aget, ...) via _run_sync()
+instead of calling the async read() without awaiting it.
 
 IMPORTANT: Querying disputes by _uid 503s on the HF API.
 Always query by _cid (contract IDs) or _cdid (dispute IDs).
 """
 
 from HFClient import HFClient
-
-_FIELDS = {
-    "cdid": True, "contractid": True, "claimantuid": True,
-    "defendantuid": True, "dateline": True, "status": True,
-    "dispute_tid": True, "claimantnotes": True, "defendantnotes": True,
-}
+from HFFields import Fields, project
 
 
 class HFDisputes(HFClient):
-    """Read dispute data (/read/disputes endpoint)."""
+    """
+    Read dispute data (/read/disputes endpoint).
+
+    Every method has an async twin prefixed with "a" (aget, aget_by_contracts, ...)
+    and takes fields= to leave out e.g. the notes text (see HFFields).
+    """
+
+    async def aget(self, cdids: list[int], fields: Fields = None) -> list[dict]:
+        """Async version of get()."""
+        data = await self.read({"disputes": {"_cdid": cdids, **project("disputes", fields)}})
+        return self._unwrap(data, "disputes") or self._unwrap(data, "bratings")
 
-    def get(self, cdids: list[int]) -> list[dict]:
+    def get(self, cdids: list[int], fields: Fields = None) -> list[dict]:
         """Get disputes by dispute ID(s)."""
-        data = self.read_sync({"disputes": {"_cdid": cdids, **_FIELDS}})
+        return self._run_sync(self.aget(cdids, fields))
+
+    async def aget_by_contracts(self, cids: list[int], fields: Fields = None) -> list[dict]:
+        """Async version of get_by_contracts()."""
+        if not cids:
+            return []
+        data = await self.read({"disputes": {"_cid": [int(c) for c in cids], **project("disputes", fields)}})
         return self._unwrap(data, "disputes") or self._unwrap(data, "bratings")
 
-    def get_by_contracts(self, cids: list[int]) -> list[dict]:
+    def get_by_contracts(self, cids: list[int], fields: Fields = None) -> list[dict]:
         """
         Get disputes for specific contract ID(s).
         This is the recommended way to query — _uid queries return 503.
         """
-        if not cids:
-            return []
-        data = self.read_sync({"disputes": {"_cid": [int(c) for c in cids], **_FIELDS}})
+        return self._run_sync(self.aget_by_contracts(cids, fields))
+
+    async def aget_by_claimant(self, uid: int, fields: Fields = None) -> list[dict]:
+        """Async version of get_by_claimant()."""
+        data = await self.read({"disputes": {"_claimantuid": [uid], **project("disputes", fields)}})
         return self._unwrap(data, "disputes") or self._unwrap(data, "bratings")
 
-    def get_by_claimant(self, uid: int) -> list[dict]:
+    def get_by_claimant(self, uid: int, fields: Fields = None) -> list[dict]:
         """Get disputes where a user is the claimant."""
-        data = self.read_sync({"disputes": {"_claimantuid": [uid], **_FIELDS}})
+        return self._run_sync(self.aget_by_claimant(uid, fields))
+
+    async def aget_by_defendant(self, uid: int, fields: Fields = None) -> list[dict]:
+        """Async version of get_by_defendant()."""
+        data = await self.read({"disputes": {"_defendantuid": [uid], **project("disputes", fields)}})
         return self._unwrap(data, "disputes") or self._unwrap(data, "bratings")
 
-    def get_by_defendant(self, uid: int) -> list[dict]:
+    def get_by_defendant(self, uid: int, fields: Fields = None) -> list[dict]:
         """Get disputes where a user is the defendant."""
-        data = self.read_sync({"disputes": {"_defendantuid": [uid], **_FIELDS}})
-        return self._unwrap(data, "disputes") or self._unwrap(data, "bratings")
+        return self._run_sync(self.aget_by_defendant(uid, fields))
@@ -0,0 +1,225 @@
+"""
+HFFields — named field projections for every /read resource.
+
+Each resource class used to request every field it knew about on every call:
+a contracts page pulled 24 fields including the full terms text, a posts
+page pulled every message body. Callers that only need ids and datelines
+paid for all of it in bandwidth (metered proxies) and JSON parsing.
+
+Every read getter, get_all_* walker and HFBatch builder now takes a fields
+argument that picks what comes back:
+
+    "minimal"   ids and timestamps — enough to detect and dedupe new rows
+    "summary"   the fields list views show, no long text (message, terms, notes)
+    "full"      everything the wrapper knows about (the default)
+    any name registered with register_profile()
+    a list of field names, or an asks-style dict (nested objects allowed)
+
+Field names are checked against the matching TypedDict in HFTypes, so a typo
+raises ValueError instead of silently coming back empty.
+
+Usage:
+    posts = HFPosts(token).get_by_thread(tid, fields="minimal")
+    rows  = HFContracts(token).get_mine(uid, fields=["cid", "status"])
+
+    register_profile("threads", "poll", ["tid", "lastpost", "numreplies"])
+    rows = HFThreads(token).get_many(tids, fields="poll")
+
+    result = await HFBatch(hf).posts(tid=tid, fields="summary").fetch()
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import get_type_hints, is_typeddict
+
+import HFTypes
+
+PROFILE_MINIMAL = "minimal"
+PROFILE_SUMMARY = "summary"
+PROFILE_FULL    = "full"
+
+# A fields argument: profile name, list of field names or asks-style dict
+Fields = str | list[str] | tuple[str, ...] | dict | None
+
+# Response shape of each resource
+_TYPES: dict[str, type] = {
+    "me":        HFTypes.HFMe,
+    "users":     HFTypes.HFUser,
+    "posts":     HFTypes.HFPost,
+    "threads":   HFTypes.HFThread,
+    "forums":    HFTypes.HFForum,
+    "bytes":     HFTypes.HFBytesTx,
+    "contracts": HFTypes.HFContract,
+    "bratings":  HFTypes.HFBrating,
+    "disputes":  HFTypes.HFDispute,
+}
+
+# TypedDict keys that had to be renamed because the API name is a keyword
+_API_NAMES = {"from_": "from"}
+
+_PROFILES: dict[str, dict[str, tuple[str, ...]]] = {
+    "me": {
+        PROFILE_MINIMAL: ("uid", "username"),
+        PROFILE_SUMMARY: ("uid", "username", "usergroup", "bytes", "reputation",
+                          "postnum", "threadnum"),
+        PROFILE_FULL:    ("uid", "username", "usergroup", "displaygroup",
+                          "additionalgroups", "postnum", "awards", "bytes",
+                          "threadnum", "avatar", "avatardimensions", "avatartype",
+                          "lastvisit", "usertitle", "website", "timeonline",
+                          "reputation", "referrals", "vault", "lastactive",
+                          "unreadpms", "invisible", "totalpms", "warningpoints"),
+    },
+    "users": {
+        PROFILE_MINIMAL: ("uid", "username"),
+        PROFILE_SUMMARY: ("uid", "username", "usergroup", "displaygroup",
+                          "postnum", "threadnum", "myps", "reputation", "avatar"),
+        PROFILE_FULL:    ("uid", "username", "usergroup", "displaygroup",
+                          "additionalgroups", "postnum", "awards", "myps",
+                          "threadnum", "avatar", "avatardimensions", "avatartype",
+                          "usertitle", "website", "timeonline", "reputation",
+                          "referrals"),
+    },
+    "posts": {
+        PROFILE_MINIMAL: ("pid", "tid", "uid", "dateline"),
+        PROFILE_SUMMARY: ("pid", "tid", "uid", "fid", "dateline", "subject",
+                          "edittime"),
+        PROFILE_FULL:    ("pid", "tid", "uid", "fid", "dateline", "message",
+                          "subject", "edituid", "edittime", "editreason"),
+    },
+    "threads": {
+        PROFILE_MINIMAL: ("tid", "dateline", "lastpost"),
+        PROFILE_SUMMARY: ("tid", "uid", "fid", "subject", "closed", "numreplies",
+                          "views", "dateline", "lastpost", "lastposter",
+                          "lastposteruid", "username", "sticky"),
+        PROFILE_FULL:    ("tid", "uid", "fid", "subject", "closed", "numreplies",
+                          "views", "dateline", "firstpost", "lastpost",
+                          "lastposter", "lastposteruid", "prefix", "icon",
+                          "poll", "username", "sticky", "bestpid"),
+    },
+    "forums": {
+        PROFILE_MINIMAL: ("fid", "type"),
+        PROFILE_SUMMARY: ("fid", "name", "type"),
+        PROFILE_FULL:    ("fid", "name", "description", "type"),
+    },
+    "bytes": {
+        PROFILE_MINIMAL: ("id", "amount", "dateline"),
+        PROFILE_SUMMARY: ("id", "amount", "dateline", "type", "reason", "from"),
+        PROFILE_FULL:    ("id", "amount", "dateline", "type", "reason", "from",
+                          "to", "post"),
+    },
+    "contracts": {
+        PROFILE_MINIMAL: ("cid", "dateline", "status"),
+        PROFILE_SUMMARY: ("cid", "status", "istatus", "ostatus", "cancelstatus",
+                          "type", "inituid", "otheruid", "muid", "iproduct",
+                          "iprice", "icurrency", "dateline"),
+        PROFILE_FULL:    ("cid", "dateline", "otherdateline", "public",
+                          "timeout_days", "timeout", "status", "istatus",
+                          "ostatus", "cancelstatus", "type", "tid", "inituid",
+                          "otheruid", "muid", "iprice", "oprice", "iproduct",
+                          "oproduct", "icurrency", "ocurrency", "terms",
+                          "iaddress", "oaddress"),
+    },
+    "bratings": {
+        PROFILE_MINIMAL: ("crid", "contractid", "dateline", "amount"),
+        PROFILE_SUMMARY: ("crid", "contractid", "fromid", "toid", "dateline",
+                          "amount"),
+        PROFILE_FULL:    ("crid", "contractid", "fromid", "toid", "dateline",
+                          "amount", "message"),
+    },
+    "disputes": {
+        PROFILE_MINIMAL: ("cdid", "contractid", "status", "dateline"),
+        PROFILE_SUMMARY: ("cdid", "contractid", "claimantuid", "defendantuid",
+                          "dateline", "status", "dispute_tid"),
+        PROFILE_FULL:    ("cdid", "contractid", "claimantuid", "defendantuid",
+                          "dateline", "status", "dispute_tid", "claimantnotes",
+                          "defendantnotes"),
+    },
+}
+
+
+@cache
+def _known_fields(shape: type) -> dict[str, type | None]:
+    """API field name → nested TypedDict (None for plain string fields)."""
+    out: dict[str, type | None] = {}
+    for name, hint in get_type_hints(shape).items():
+        out[_API_NAMES.get(name, name)] = hint if is_typeddict(hint) else None
+    return out
+
+
+def _validate(shape: type, fields: dict, path: str) -> None:
+    known = _known_fields(shape)
+    for name, value in fields.items():
+        if name.startswith("_"):
+            raise ValueError(f"{path}: '{name}' is a query parameter, not a field")
+        if name not in known:
+            raise ValueError(
+                f"{path}: unknown field '{name}' "
+                f"(not in {shape.__name__}; valid: {', '.join(sorted(known))})"
+            )
+        nested = known[name]
+        if isinstance(value, (list, tuple, dict)):
+            if nested is None:
+                raise ValueError(f"{path}.{name} is a plain field and has no sub-fields")
+            sub = value if isinstance(value, dict) else dict.fromkeys(value, True)
+            _validate(nested, sub, f"{path}.{name}")
+
+
+def _shape(resource: str) -> type:
+    shape = _TYPES.get(resource)
+    if shape is None:
+        raise ValueError(f"No field profiles for resource '{resource}' (known: {', '.join(_TYPES)})")
+    return shape
+
+
+def project(resource: str, fields: Fields = None, default: str = PROFILE_FULL) -> dict:
+    """
+    Return the asks field dict for one resource: {"pid": True, ...}.
+
+    fields may be a profile name, a list of field names or an asks-style
+    dict; None uses the default profile. The result is a new dict the
+    caller may add query parameters to.
+
+    Raises ValueError for an unknown resource, profile or field.
+    """
+    shape = _shape(resource)
+    if fields is None:
+        fields = default
+    if isinstance(fields, str):
+        names = _PROFILES[resource].get(fields)
+        if names is None:
+            raise ValueError(
+                f"Unknown {resource} field profile '{fields}' "
+                f"(known: {', '.join(_PROFILES[resource])})"
+            )
+        return dict.fromkeys(names, True)
+    if isinstance(fields, dict):
+        out = dict(fields)
+    elif isinstance(fields, (list, tuple, set, frozenset)):
+        out = dict.fromkeys(fields, True)
+    else:
+        raise ValueError(f"fields must be a profile name, list or dict, not {type(fields).__name__}")
+    if not out:
+        raise ValueError(f"Empty {resource} field projection")
+    _validate(shape, out, resource)
+    return out
+
+
+def register_profile(resource: str, name: str, fields: list[str] | tuple[str, ...] | dict) -> None:
+    """
+    Add or replace a named profile for a resource, usable anywhere a
+    fields argument is accepted. Only plain (non-nested) fields can be
+    named in a profile; pass nested objects as a dict at the call site.
+
+        register_profile("posts", "ids", ["pid", "tid"])
+    """
+    shape = _shape(resource)
+    names = tuple(fields)
+    _validate(shape, dict.fromkeys(names, True), resource)
+    _PROFILES[resource][name] = names
+
+
+def profiles(resource: str) -> dict[str, tuple[str, ...]]:
+    """Profile name → field names for one resource."""
+    _shape(resource)
+    return dict(_PROFILES[resource])
@@ -0,0 +1,489 @@
+"""
+HFForumGen — seedable synthetic forum activity for HFSimulator scale tests.
+
+Builds a forum history (users, forums, threads, BBCode posts, bytes
+transactions, contracts, b-ratings, disputes) into a SimDataset and then
+keeps it moving: replies, new threads, payments and contract progress
+arrive as Poisson streams over simulated time.
+
+    from HFForumGen import ForumGenerator, GenConfig
+    from HFSimulator import HFSimulator
+
+    gen = ForumGenerator(GenConfig.scaled(posts=1_000_000), seed=7)
+    gen.build()                               # 30 days of history, ~1 KB RAM per post
+    sim = HFSimulator(gen.dataset)
+    sim.start()
+
+    gen.subscribe(lambda kind, row: truth.append((time.monotonic(), kind, row)))
+    gen.start(speed=10)                       # live: 10 simulated s per real s
+    ...
+    gen.stop()
+
+    # Or step simulated time by hand — fully deterministic:
+    events = gen.step(60)                     # one simulated minute
+
+The same seed, config and sequence of step() calls always give the same
+forum and the same events. start() steps in real time, so only the timing
+of its events varies between runs.
+
+Popularity is skewed: a few threads and users get most of the replies
+(Zipf-like, GenConfig.hot_skew), the way real forums look.
+
+Event kinds passed to subscribers: "user", "thread", "post", "bytes",
+"contract", "contract_status", "brating", "dispute".
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable
+
+from HFSimulator import SimDataset
+
+log = logging.getLogger("hfapi.forumgen")
+
+Listener = Callable[[str, dict], None]
+
+_WORDS = (
+    "account method guide free cheap fast legit vouch service selling buying "
+    "crypto bitcoin escrow tutorial tool release update question help request "
+    "exchange trade bytes premium lifetime private public best working new "
+    "script source bot proxy panel setup config checker cracked leak giveaway "
+    "review feedback support instant delivery price offer deal lowest stock "
+    "bulk discount method ebook course tips tricks beginner advanced python "
+    "discord telegram youtube instagram twitter market monthly weekly daily"
+).split()
+
+_SMILIES = (":)", ":D", ";)", ":P", ":O", ":pinch:", ":victoire:", ":hehe:")
+
+_BYTES_TYPES = ("don", "don", "don", "att", "qlp", "qlp", "bon", "cvr", "sbs", "bla")
+
+_FORUM_NAMES = (
+    "Marketplace", "Premium Sellers", "Hacking Tutorials", "Coding", "Python",
+    "Web Development", "Cryptocurrency", "Gaming", "Graphics", "Money Making",
+    "The Lounge", "Giveaways", "Introductions", "Feedback", "Tools", "Security",
+    "Monetizing Techniques", "Social Media", "Service Offerings", "Requests",
+)
+
+
+@dataclass(frozen=True)
+class GenConfig:
+    """
+    Size and shape of a generated forum.
+
+    History (build):
+        users, forums, threads, posts (first posts included), transactions,
+        contracts, spread over the last `days` days.
+    Shape:
+        hot_skew:     Zipf exponent of thread/user popularity (0 = uniform).
+        rich_rate:    Share of posts with heavier BBCode (lists, code, urls, images).
+        quote_rate:   Share of replies quoting an earlier post of the thread.
+        mention_rate: Share of posts mentioning another user.
+    Live activity (events per simulated minute):
+        live_replies, live_threads, live_bytes, live_contracts, live_users.
+    """
+    users:        int   = 500
+    forums:       int   = 20
+    threads:      int   = 2_000
+    posts:        int   = 20_000
+    transactions: int   = 2_000
+    contracts:    int   = 500
+    days:         float = 30.0
+
+    hot_skew:     float = 0.8
+    rich_rate:    float = 0.25
+    quote_rate:   float = 0.2
+    mention_rate: float = 0.1
+
+    live_replies:   float = 6.0
+    live_threads:   float = 0.5
+    live_bytes:     float = 1.0
+    live_contracts: float = 0.2
+    live_users:     float = 0.05
+
+    @classmethod
+    def scaled(cls, posts: int, **overrides) -> GenConfig:
+        """A config sized from a post count — ~10 posts per thread, ~40 per user."""
+        config = cls(
+            users=max(20, posts // 40),
+            forums=min(len(_FORUM_NAMES) * 10, max(5, posts // 5_000)),
+            threads=max(1, posts // 10),
+            posts=posts,
+            transactions=max(10, posts // 10),
+            contracts=max(5, posts // 40),
+        )
+        return replace(config, **overrides)
+
+
+class SimClock:
+    """Simulated time for a generated forum. Call it for "now" (unix seconds)."""
+
+    def __init__(self, start: float | None = None):
+        self._now = time.time() if start is None else float(start)
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self._now
+
+    def set(self, when: float) -> None:
+        with self._lock:
+            self._now = max(self._now, float(when))
+
+    def advance(self, seconds: float) -> float:
+        with self._lock:
+            self._now += seconds
+            return self._now
+
+
+class ForumGenerator:
+    """
+    Generates forum history and live activity into a SimDataset.
+
+    Args:
+        config:  GenConfig (default GenConfig()).
+        seed:    Random seed. None for a different forum every run.
+        dataset: SimDataset to fill (default: a new one on this generator's clock).
+        clock:   Time source. Defaults to a SimClock starting now; step() and
+                 start() need a SimClock.
+    """
+
+    def __init__(
+        self,
+        config: GenConfig | None = None,
+        seed: int | None = 0,
+        dataset: SimDataset | None = None,
+        clock: Callable[[], float] | None = None,
+    ):
+        self.config  = config or GenConfig()
+        self.rng     = random.Random(seed)
+        self.clock   = clock or SimClock()
+        self.dataset = dataset if dataset is not None else SimDataset(clock=self.clock)
+        self._listeners: list[Listener] = []
+        self._sentences = [self._sentence() for _ in range(512)]
+        self._thread_weights: list[float] = []   # cumulative popularity per tid (index tid-1)
+        self._user_weights:   list[float] = []
+        self._live: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._counts: dict[str, int] = dict.fromkeys(
+            ("user", "thread", "post", "bytes", "contract", "contract_status", "brating", "dispute"), 0,
+        )
+
+    # ── Text ──
+
+    def _sentence(self) -> str:
+        words = self.rng.choices(_WORDS, k=self.rng.randint(4, 14))
+        return " ".join(words).capitalize() + self.rng.choice((".", ".", ".", "!", "?"))
+
+    def _text(self, sentences: int) -> str:
+        return " ".join(self.rng.choices(self._sentences, k=sentences))
+
+    def _subject(self) -> str:
+        rng = self.rng
+        subject = " ".join(rng.choices(_WORDS, k=rng.randint(3, 8))).title()
+        if rng.random() < 0.2:
+            subject = f"[{rng.choice(('WTS', 'WTB', 'HQ', 'FREE', 'GUIDE', 'HELP'))}] {subject}"
+        return subject
+
+    def _message(self, tid: int | None = None) -> str:
+        """A BBCode post body; replies may quote the thread's latest post."""
+        rng   = self.rng
+        parts = []
+        if tid is not None and rng.random() < self.config.quote_rate:
+            last = self.dataset.posts_by_thread.get(tid)
+            if last:
+                quoted = self.dataset.posts[last[-1]]
+                snippet = self._text(1)
+                parts.append(
+                    f"[quote='{quoted['username']}' pid='{quoted['pid']}' "
+                    f"dateline='{quoted['dateline']}']{snippet}[/quote]"
+                )
+        if rng.random() < self.config.mention_rate and self.dataset.users:
+            other = self.dataset.users.get(rng.randint(1, len(self.dataset.users)))
+            if other:
+                parts.append(f"[mention]{other['username']}[/mention]")
+
+        parts.append(self._text(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            parts[-1] = f"[b]{parts[-1]}[/b]" if rng.random() < 0.5 else f"[i]{parts[-1]}[/i]"
+        if rng.random() < self.config.rich_rate:
+            kind = rng.randrange(5)
+            if kind == 0:
+                items = "".join(f"[*]{self._text(1)}\n" for _ in range(rng.randint(2, 5)))
+                parts.append(f"[list]\n{items}[/list]")
+            elif kind == 1:
+                parts.append(f"[code]print('{rng.choice(_WORDS)}')\n# {self._text(1)}[/code]")
+            elif kind == 2:
+                slug = "-".join(rng.choices(_WORDS, k=3))
+                parts.append(f"[url=https://example.com/{slug}]{self._text(1)}[/url]")
+            elif kind == 3:
+                parts.append(f"[img]https://i.example.com/{rng.getrandbits(32):08x}.png[/img]")
+            else:
+                color = f"#{rng.getrandbits(24):06x}"
+                parts.append(f"[color={color}][size=large]{self._text(1)}[/size][/color]")
+        if rng.random() < 0.15:
+            parts.append(rng.choice(_SMILIES))
+        return "\n".join(parts)
+
+    # ── Popularity ──
+
+    def _zipf_cumulative(self, n: int) -> list[float]:
+        """Cumulative Zipf weights for n items in random rank order."""
+        ranks = list(range(1, n + 1))
+        self.rng.shuffle(ranks)
+        s = self.config.hot_skew
+        return list(itertools.accumulate(1.0 / r ** s for r in ranks))
+
+    def _pick(self, cumulative: list[float]) -> int:
+        """1-based id drawn by popularity."""
+        return bisect.bisect_left(cumulative, self.rng.random() * cumulative[-1]) + 1
+
+    def _grow(self, cumulative: list[float]) -> None:
+        """Weight for a newly added item — new threads start warm."""
+        top = cumulative[-1] if cumulative else 0.0
+        cumulative.append(top + 1.0 / 3 ** self.config.hot_skew)
+
+    # ── History ──
+
+    def build(self) -> SimDataset:
+        """Fill the dataset with `days` of history ending at the clock's now."""
+        c, rng, d = self.config, self.rng, self.dataset
+        end   = self.clock()
+        start = end - c.days * 86400
+        began = time.monotonic()
+
+        def times(n: int, lo: float = start) -> list[int]:
+            return sorted(int(rng.uniform(lo, end)) for _ in range(n))
+
+        for i in range(1, c.users + 1):
+            d.add_user(
+                f"{rng.choice(_WORDS)}{rng.choice(_WORDS).title()}{i}",
+                myps=rng.randint(0, 50_000), reputation=int(rng.paretovariate(1.5) * 10),
+                timeonline=rng.randint(0, 10_000_000),
+            )
+        self._user_weights = self._zipf_cumulative(c.users)
+
+        categories = max(1, c.forums // 10)
+        for i in range(categories):
+            d.add_forum(f"{rng.choice(_FORUM_NAMES)} Section {i + 1}", type="c")
+        for i in range(c.forums):
+            name = _FORUM_NAMES[i % len(_FORUM_NAMES)]
+            if i >= len(_FORUM_NAMES):
+                name = f"{name} {i // len(_FORUM_NAMES) + 1}"
+            d.add_forum(name, description=self._text(1))
+        fids = [int(f["fid"]) for f in d.forums.values() if f["type"] == "f"]
+
+        for when in times(c.threads):
+            d.add_thread(rng.choice(fids), self._pick(self._user_weights), self._subject(),
+                         self._message(), dateline=when)
+        self._thread_weights = self._zipf_cumulative(len(d.threads))
+
+        # Each reply lands after its thread was started; insert in time order
+        # so pids grow with dateline like on HF.
+        replies = []
+        for _ in range(max(0, c.posts - c.threads) if d.threads else 0):
+            tid = self._pick(self._thread_weights)
+            replies.append((int(rng.uniform(int(d.threads[tid]["dateline"]), end)), tid))
+        replies.sort()
+        for when, tid in replies:
+            d.add_post(tid, self._pick(self._user_weights), self._message(tid), dateline=when)
+
+        for when in times(c.transactions):
+            self._transaction(when)
+        for when in times(c.contracts):
+            self._contract(when, history=True)
+
+        log.info(
+            f"Generated {len(d.users)} users, {len(d.threads)} threads, {len(d.posts)} posts, "
+            f"{len(d.bytes)} transactions, {len(d.contracts)} contracts "
+            f"in {time.monotonic() - began:.1f}s"
+        )
+        return d
+
+    def _two_users(self) -> tuple[int, int]:
+        a = self._pick(self._user_weights)
+        b = self._pick(self._user_weights)
+        while b == a and len(self.dataset.users) > 1:
+            b = self.rng.randint(1, len(self.dataset.users))
+        return a, b
+
+    def _transaction(self, when: int) -> dict:
+        rng  = self.rng
+        a, b = self._two_users()
+        kind = rng.choice(_BYTES_TYPES)
+        amount = round(rng.paretovariate(1.2) * 10, 2)
+        pid = 0
+        if kind == "qlp" and self.dataset.posts_by_user.get(b):
+            pid = rng.choice(self.dataset.posts_by_user[b])
+        return self.dataset.add_bytes(a, b, amount, type=kind, pid=pid, dateline=when,
+                                      reason=rng.choice(("", "", "thanks", "Contract", "gift")))
+
+    def _contract(self, when: int, history: bool = False) -> dict:
+        rng  = self.rng
+        a, b = self._two_users()
+        status = rng.choice(("1", "2", "5", "6", "6", "6", "6", "8")) if history else "1"
+        tids = self.dataset.threads_by_user.get(a)
+        row = self.dataset.add_contract(
+            a, b, type=rng.choice("11223345"), status=status,
+            muid=self._pick(self._user_weights) if rng.random() < 0.05 else 0,
+            tid=rng.choice(tids) if tids and rng.random() < 0.5 else 0,
+            iprice=str(rng.choice((5, 10, 25, 50, 100, 250, 1000))),
+            iproduct=" ".join(rng.choices(_WORDS, k=3)), terms=self._text(3), dateline=when,
+        )
+        if history and status == "6":
+            self._complete(row, when + rng.randint(600, 3 * 86400))
+        elif history and status == "5" and rng.random() < 0.05:
+            self.dataset.add_dispute(int(row["cid"]), a, b, self._text(2), dateline=when + 86400)
+        return row
+
+    def _complete(self, contract: dict, when: int) -> list[dict]:
+        """Finish a contract: payment, then b-ratings from one or both sides."""
+        rng  = self.rng
+        cid  = int(contract["cid"])
+        a, b = int(contract["inituid"]), int(contract["otheruid"])
+        contract["status"] = "6"
+        rows = [self.dataset.add_bytes(b, a, float(contract["iprice"]), type="don",
+                                       reason="Contract", dateline=when)]
+        for rater, rated in ((a, b), (b, a)):
+            if rng.random() < 0.7:
+                rows.append(self.dataset.add_brating(
+                    cid, rater, rated, "+1" if rng.random() < 0.93 else "-1",
+                    self._text(1), dateline=when + rng.randint(60, 86400),
+                ))
+        return rows
+
+    # ── Live activity ──
+
+    def subscribe(self, listener: Listener) -> None:
+        """Call listener(kind, row) for every live event, from the generating thread."""
+        self._listeners.append(listener)
+
+    def _emit(self, kind: str, row: dict, events: list) -> None:
+        self._counts[kind] += 1
+        events.append((kind, row))
+        for listener in self._listeners:
+            try:
+                listener(kind, row)
+            except Exception as e:
+                log.warning(f"Forum generator listener failed on {kind}: {e}")
+
+    def _event(self, kind: str, when: int, events: list) -> None:
+        d, rng = self.dataset, self.rng
+        if kind == "post" and d.threads:
+            tid = self._pick(self._thread_weights)
+            if d.threads[tid]["closed"] == "1":
+                return
+            self._emit("post", d.add_post(tid, self._pick(self._user_weights), self._message(tid), dateline=when), events)
+        elif kind == "thread":
+            fids = [int(f["fid"]) for f in d.forums.values() if f["type"] == "f"]
+            if fids and d.users:
+                row = d.add_thread(rng.choice(fids), self._pick(self._user_weights),
+                                   self._subject(), self._message(), dateline=when)
+                self._grow(self._thread_weights)
+                self._emit("thread", row, events)
+        elif kind == "bytes" and len(d.users) > 1:
+            self._emit("bytes", self._transaction(when), events)
+        elif kind == "contract" and len(d.users) > 1:
+            open_ = [c for c in itertools.islice(reversed(d.contracts.values()), 50)
+                     if c["status"] in ("1", "5")]
+            if open_ and rng.random() < 0.6:
+                contract = rng.choice(open_)
+                if contract["status"] == "1":
+                    contract["status"], contract["ostatus"] = "5", "1"
+                    self._emit("contract_status", contract, events)
+                elif rng.random() < 0.05:
+                    self._emit("dispute", d.add_dispute(int(contract["cid"]), int(contract["inituid"]),
+                                                        int(contract["otheruid"]), self._text(2),
+                                                        dateline=when), events)
+                else:
+                    for row in self._complete(contract, when):
+                        self._emit("brating" if "crid" in row else "bytes", row, events)
+                    self._emit("contract_status", contract, events)
+            else:
+                self._emit("contract", self._contract(when), events)
+        elif kind == "user":
+            n = len(d.users) + 1
+            row = d.add_user(f"{rng.choice(_WORDS)}{rng.choice(_WORDS).title()}{n}")
+            self._grow(self._user_weights)
+            self._emit("user", row, events)
+
+    def step(self, seconds: float) -> list[tuple[str, dict]]:
+        """
+        Advance simulated time by seconds, creating the activity that falls
+        in that span at its own timestamp. Returns [(kind, row), ...].
+        """
+        if not isinstance(self.clock, SimClock):
+            raise TypeError("step() needs the generator to run on a SimClock")
+        d = self.dataset
+        if len(self._user_weights) != len(d.users):
+            self._user_weights = self._zipf_cumulative(len(d.users))
+        if len(self._thread_weights) != len(d.threads):
+            self._thread_weights = self._zipf_cumulative(len(d.threads))
+        c = self.config
+        rates = {
+            "post": c.live_replies, "thread": c.live_threads, "bytes": c.live_bytes,
+            "contract": c.live_contracts, "user": c.live_users,
+        }
+        start = self.clock()
+        end   = start + seconds
+        arrivals = []
+        for kind, per_minute in rates.items():
+            if per_minute <= 0:
+                continue
+            t = start
+            while True:
+                t += self.rng.expovariate(per_minute / 60.0)
+                if t >= end:
+                    break
+                arrivals.append((t, kind))
+        arrivals.sort()
+
+        events: list[tuple[str, dict]] = []
+        for when, kind in arrivals:
+            self.clock.set(when)
+            with self.dataset._lock:
+                self._event(kind, int(when), events)
+        self.clock.set(end)
+        return events
+
+    def start(self, speed: float = 1.0, tick: float = 0.5) -> None:
+        """
+        Keep generating activity from a daemon thread, `speed` simulated
+        seconds per real second, in steps of `tick` real seconds.
+        """
+        if self._live is not None:
+            return
+        self._stop.clear()
+
+        def _run():
+            last = time.monotonic()
+            while not self._stop.wait(tick):
+                now = time.monotonic()
+                self.step((now - last) * speed)
+                last = now
+
+        self._live = threading.Thread(target=_run, name="hfapi-forumgen", daemon=True)
+        self._live.start()
+
+    def stop(self) -> None:
+        if self._live is None:
+            return
+        self._stop.set()
+        self._live.join(timeout=5)
+        self._live = None
+
+    def stats(self) -> dict:
+        """Live events generated so far per kind, plus dataset sizes."""
+        d = self.dataset
+        return {
+            "events": dict(self._counts),
+            "users": len(d.users), "threads": len(d.threads), "posts": len(d.posts),
+            "bytes": len(d.bytes), "contracts": len(d.contracts),
+            "bratings": len(d.bratings), "disputes": len(d.disputes),
+            "now": self.clock(),
+        }
@@ -2,27 +2,34 @@
 HFForums — get forum info by forum ID.
 Requires 'Posts' scope.
 
-BUG FIX #1: self.read() changed to self.read_sync().
+BUG FIX #1: Sync methods now run their async twin via _run_sync() instead of
+calling the async read() without awaiting it.
 """
 
 from HFClient import HFClient
+from HFFields import Fields, project
 
 
 class HFForums(HFClient):
-    """Get forum info (/read/forums endpoint)."""
+    """
+    Get forum info (/read/forums endpoint). Async twins: aget(), aget_many().
+    Both take fields= (see HFFields).
+    """
 
-    def get(self, fid: int) -> dict | None:
-        """Get info for a single forum."""
-        forums = self.get_many([fid])
+    async def aget(self, fid: int, fields: Fields = None) -> dict | None:
+        """Async version of get()."""
+        forums = await self.aget_many([fid], fields)
         return forums[0] if forums else None
 
-    def get_many(self, fids: list[int]) -> list[dict]:
-        """Get info for multiple forums."""
-        data = self.read_sync({"forums": {
-            "_fid":        fids,
-            "fid":         True,
-            "name":        True,
-            "description": True,
-            "type":        True,
-        }})
+    def get(self, fid: int, fields: Fields = None) -> dict | None:
+        """Get info for a single forum."""
+        return self._run_sync(self.aget(fid, fields))
+
+    async def aget_many(self, fids: list[int], fields: Fields = None) -> list[dict]:
+        """Async version of get_many()."""
+        data = await self.read({"forums": {"_fid": fids, **project("forums", fields)}})
         return self._unwrap(data, "forums")
+
+    def get_many(self, fids: list[int], fields: Fields = None) -> list[dict]:
+        """Get info for multiple forums."""
+        return self._run_sync(self.aget_many(fids, fields))
@@ -0,0 +1,173 @@
+"""
+HFLatency — rolling latency windows per endpoint and proxy, and hedged reads.
+
+HFClient records how long every successful request took, keyed by endpoint
+("read", "write") and route (proxy host:port, or "direct"). Each key keeps
+the last WINDOW_SIZE samples, so percentiles follow current conditions
+rather than the whole process lifetime.
+
+    from HFLatency import get_window
+
+    get_window("read").percentile(0.95)                   # all routes
+    get_window("read", "res1.example:8000").percentile(0.5)
+
+Hedged reads:
+    HF response times have a long tail. With hedging on, a /read that hasn't
+    answered by the observed p95 for its endpoint gets a duplicate request
+    through another connection (another proxy when using an HFProxyPool),
+    and whichever answers first wins; the other is cancelled.
+
+    - Hedges take a rate limiter slot like any call, and are only sent if a
+      slot is free right away — a hedge never queues.
+    - At most hedge_ratio (default 10%) of a client's reads are hedged.
+    - No hedging until the endpoint has MIN_SAMPLES latency samples.
+
+    Turn it on per client, or only for the calls that need it:
+
+        hf = HFClient(token, hedge=True)
+
+        with hedged_reads():
+            meta = await hf.read({"threads": {...}})
+
+    HFWatcher hedges its thread metadata polls and server.py hedges its
+    /api/* handlers this way.
+
+Adaptive timeouts:
+    A fixed 25 s timeout is too long when HF answers in half a second (a
+    hung request stalls a watcher tick for 25 s). By default HFClient gives
+    each attempt a deadline from the same windows: p99 of the route's
+    latency × 3, kept between 5 s and 25 s (TimeoutPolicy). The route's own
+    window is used once it has MIN_SAMPLES samples, the endpoint's across
+    all routes before that, and 25 s until the endpoint has any history.
+    The ceiling is the old fixed timeout, so no call waits longer than it
+    used to; raise it if HF slowdowns on your routes outlast 25 s.
+
+    A timed-out attempt is recorded at its deadline — it took at least that
+    long — so during a slowdown the deadline grows with the real latency
+    instead of cutting every request off at the old p99.
+
+        hf = HFClient(token)                                   # adaptive
+        hf = HFClient(token, timeout_policy=TimeoutPolicy(factor=4, floor=8))
+        hf = HFClient(token, timeout_policy=TimeoutPolicy(ceiling=60))   # allow slower calls
+        hf = HFClient(token, timeout=25)                       # fixed, as before
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+WINDOW_SIZE = 200   # samples kept per key
+MIN_SAMPLES = 20    # fewer than this and percentile() returns None
+
+ALL_ROUTES = "*"
+
+
+class LatencyWindow:
+    """The most recent request durations (seconds) for one key. Thread-safe."""
+
+    def __init__(self, size: int = WINDOW_SIZE):
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float, min_samples: int = MIN_SAMPLES) -> float | None:
+        """The q-quantile (0–1) of the window, or None with too few samples."""
+        with self._lock:
+            if len(self._samples) < max(min_samples, 1):
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __repr__(self) -> str:
+        return f"LatencyWindow(samples={len(self._samples)}, p95={self.percentile(0.95)})"
+
+
+# ── Registry ───────────────────────────────────────────────────────────────────
+
+_windows: dict[tuple[str, str], LatencyWindow] = {}
+_windows_lock = threading.Lock()
+
+
+def get_window(endpoint: str, route: str = ALL_ROUTES) -> LatencyWindow:
+    """Return the window for (endpoint, route), creating it on first use."""
+    key    = (endpoint, route)
+    window = _windows.get(key)
+    if window is None:
+        with _windows_lock:
+            window = _windows.setdefault(key, LatencyWindow())
+    return window
+
+
+def record(endpoint: str, route: str, seconds: float) -> None:
+    """Add one sample to both the route's window and the endpoint-wide one."""
+    get_window(endpoint, route).add(seconds)
+    get_window(endpoint).add(seconds)
+
+
+# ── Adaptive timeouts ──────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class TimeoutPolicy:
+    """
+    Args:
+        quantile:    Latency quantile the deadline is based on.
+        factor:      Deadline = observed quantile × factor.
+        floor:       Shortest deadline, however fast HF has been.
+        ceiling:     Longest deadline, however slow HF has been. Also the
+                     overall cap of one HFClient call without a fixed
+                     timeout; the default matches the old fixed 25 s.
+        initial:     Deadline while the endpoint has too few samples.
+        min_samples: Samples a window needs before it is trusted.
+    """
+    quantile:    float = 0.99
+    factor:      float = 3.0
+    floor:       float = 5.0
+    ceiling:     float = 25.0
+    initial:     float = 25.0
+    min_samples: int   = MIN_SAMPLES
+
+    def timeout(self, endpoint: str, route: str = ALL_ROUTES) -> float:
+        """Deadline in seconds for one attempt on endpoint through route."""
+        observed = get_window(endpoint, route).percentile(self.quantile, self.min_samples)
+        if observed is None and route != ALL_ROUTES:
+            observed = get_window(endpoint).percentile(self.quantile, self.min_samples)
+        if observed is None:
+            return self.initial
+        return min(self.ceiling, max(self.floor, observed * self.factor))
+
+
+DEFAULT_TIMEOUTS = TimeoutPolicy()
+
+
+# ── Hedging context ────────────────────────────────────────────────────────────
+
+_hedge: contextvars.ContextVar[bool] = contextvars.ContextVar("hfapi_hedge", default=False)
+
+
+def hedging_enabled() -> bool:
+    return _hedge.get()
+
+
+def set_hedging(enabled: bool) -> None:
+    """Enable hedged reads for the rest of the current context (e.g. a Flask request)."""
+    _hedge.set(enabled)
+
+
+@contextmanager
+def hedged_reads(enabled: bool = True):
+    """Hedge HF reads made inside the block."""
+    token = _hedge.set(enabled)
+    try:
+        yield
+    finally:
+        _hedge.reset(token)
@@ -3,7 +3,8 @@ HFMe — read info about the currently authenticated user.
 Requires 'Basic Info' scope. Advanced fields require 'Advanced Info' scope.
 
 BUG FIXES:
-  #1 — self.read() changed to self.read_sync() in get().
+  #1 — get() no longer calls the async read() without awaiting it; it runs
+       its async twin aget() via _run_sync().
   #8 — watch_pms() monkey-patched watcher.start() to only run the PM loop,
        silently killing any other watches registered on the same HFWatcher
        instance. Fixed: watch_pms() now returns a standalone HFWatcher that
@@ -20,9 +21,13 @@ AVATAR URL NOTE:
 """
 
 from HFClient import HFClient
+from HFFields import Fields, project
 
 _HF_BASE = "https://hackforums.net"
 
+# Fields that need the 'Advanced Info' scope
+_ADVANCED_FIELDS = ("lastactive", "unreadpms", "invisible", "totalpms", "warningpoints")
+
 
 def normalize_avatar_url(avatar: str | None) -> str | None:
     """
@@ -54,18 +59,35 @@ def normalize_avatar_url(avatar: str | None) -> str | None:
 
 
 class HFMe(HFClient):
-    """Access info about the authenticated user (/read/me endpoint)."""
+    """
+    Access info about the authenticated user (/read/me endpoint).
+
+    Every getter has an async twin prefixed with "a" (aget, aget_unread_pms, ...).
+    get() takes fields= to ask for less than the full profile (see HFFields).
+    """
 
     # Expose as a static method for convenience
     normalize_avatar_url = staticmethod(normalize_avatar_url)
 
-    def get(self, advanced: bool = True) -> dict | None:
+    async def aget(self, advanced: bool = True, fields: Fields = None) -> dict | None:
+        """Async version of get()."""
+        ask = project("me", fields)
+        if not advanced:
+            for name in _ADVANCED_FIELDS:
+                ask.pop(name, None)
+        data = await self.read({"me": ask})
+        rows = self._unwrap(data, "me")
+        return rows[0] if rows else None
+
+    def get(self, advanced: bool = True, fields: Fields = None) -> dict | None:
         """
         Get the authenticated user's profile.
 
         Args:
             advanced: Include advanced fields (unreadpms, warningpoints, etc).
                       Requires 'Advanced Info' scope.
+            fields:   Field profile or projection (default "full"). Advanced
+                      fields are still dropped when advanced=False.
 
         Returns:
             Dict with user fields or None on failure.
@@ -74,38 +96,41 @@ class HFMe(HFClient):
             The 'avatar' field is a relative path like "./uploads/avatars/...".
             Use normalize_avatar_url(me["avatar"]) to get an absolute URL.
         """
-        ask = {
-            "uid": True, "username": True, "usergroup": True,
-            "displaygroup": True, "additionalgroups": True,
-            "postnum": True, "awards": True, "bytes": True,
-            "threadnum": True, "avatar": True, "avatardimensions": True,
-            "avatartype": True, "lastvisit": True, "usertitle": True,
-            "website": True, "timeonline": True, "reputation": True,
-            "referrals": True, "vault": True,
-        }
-        if advanced:
-            ask.update({
-                "lastactive": True, "unreadpms": True,
-                "invisible": True, "totalpms": True, "warningpoints": True,
-            })
-        data = self.read_sync({"me": ask})
-        rows = self._unwrap(data, "me")
-        return rows[0] if rows else None
+        return self._run_sync(self.aget(advanced, fields))
+
+    async def aget_unread_pms(self) -> int:
+        """Async version of get_unread_pms()."""
+        me = await self.aget(fields=["uid", "unreadpms"])
+        return int(me.get("unreadpms", 0)) if me else 0
 
     def get_unread_pms(self) -> int:
         """Returns number of unread PMs. Requires Advanced Info scope."""
-        me = self.get(advanced=True)
-        return int(me.get("unreadpms", 0)) if me else 0
+        return self._run_sync(self.aget_unread_pms())
+
+    async def aget_bytes_balance(self) -> float:
+        """Async version of get_bytes_balance()."""
+        me = await self.aget(fields=["uid", "bytes"])
+        return float(me.get("bytes", 0)) if me else 0.0
 
     def get_bytes_balance(self) -> float:
         """Returns bytes balance."""
-        me = self.get(advanced=False)
-        return float(me.get("bytes", 0)) if me else 0.0
+        return self._run_sync(self.aget_bytes_balance())
+
+    async def aget_reputation(self) -> int:
+        """Async version of get_reputation()."""
+        me = await self.aget(fields=["uid", "reputation"])
+        return int(float(me.get("reputation", 0))) if me else 0
 
     def get_reputation(self) -> int:
         """Returns current reputation/popularity."""
-        me = self.get(advanced=False)
-        return int(float(me.get("reputation", 0))) if me else 0
+        return self._run_sync(self.aget_reputation())
+
+    async def aget_avatar_url(self) -> str | None:
+        """Async version of get_avatar_url()."""
+        me = await self.aget(fields=["uid", "avatar"])
+        if not me:
+            return None
+        return normalize_avatar_url(me.get("avatar"))
 
     def get_avatar_url(self) -> str | None:
         """
@@ -116,10 +141,7 @@ class HFMe(HFClient):
         Returns:
             Absolute avatar URL or None if no avatar is set.
         """
-        me = self.get(advanced=False)
-        if not me:
-            return None
-        return normalize_avatar_url(me.get("avatar"))
+        return self._run_sync(self.aget_avatar_url())
 
     def watch_pms(
         self,
@@ -159,12 +181,13 @@ class HFMe(HFClient):
         """
         import asyncio as _asyncio
         from HFWatcher import HFWatcher
+        from HFRateLimiter import PRIORITY_BACKGROUND, request_priority
 
         me_client   = self
         _last_count: list[int] = [-1]  # mutable container for closure
 
         async def _poll_unread() -> None:
-            current = me_client.get_unread_pms()
+            current = await me_client.aget_unread_pms()
             last    = _last_count[0]
             if last == -1:
                 _last_count[0] = current
@@ -192,6 +215,8 @@ class HFMe(HFClient):
                             if self._on_error:
                                 await self._on_error("pms", e)
                         await _asyncio.sleep(interval)
-                await _asyncio.gather(_asyncio.create_task(_loop(), name="watch_pms"))
+                with request_priority(PRIORITY_BACKGROUND):
+                    task = _asyncio.create_task(_loop(), name="watch_pms")
+                await _asyncio.gather(task)
 
         return _PMWatcher(self)
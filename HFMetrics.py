@@ -0,0 +1,250 @@
+"""
+HFMetrics — per-endpoint and per-resource request instrumentation.
+
+HFClient records every HTTP request it sends (retries, hedges and proxy
+failovers included, since each spends a call):
+
+    - request count, per endpoint ("read", "write") and per top-level
+      resource key in the asks ("users", "threads", "posts", ...)
+    - latency histogram
+    - response size in bytes
+    - errors by class: timeout, proxy, connect, error (other transport
+      failures), cancelled (a losing hedge or abandoned call), budget
+      (dropped waiting for rate budget) and circuit_open (refused by an open
+      circuit breaker) — these two count as errors only, never as
+      requests — rate_limited (MAX_HOURLY_CALLS_EXCEEDED), http_<status>
+      for non-200 responses
+    - x-rate-limit-remaining snapshots per token
+
+A coalesced POST asking for several resources counts once per endpoint and
+once for each resource in it; its full response size is added to every one
+of those resources.
+
+In-process:
+    from HFMetrics import get_metrics
+    m = get_metrics()
+    m["endpoints"]["read"]["requests"]              # POSTs to /read
+    m["resources"]["read"]["users"]["bytes"]        # bytes of responses that included users
+    m["rate_limit"]["...a1b2c3"]                    # [(unix_ts, remaining), ...]
+
+OpenMetrics (Prometheus) text:
+    from HFMetrics import render_openmetrics, start_metrics_server
+    text = render_openmetrics()
+    start_metrics_server(9464)      # GET http://127.0.0.1:9464/metrics
+
+server.py also serves the same text at /metrics.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger("hfapi.metrics")
+
+# Histogram bucket upper bounds in seconds (+Inf is implicit)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0)
+
+# Rate limit snapshots kept per token
+SNAPSHOTS_KEPT = 120
+
+# Error classes for calls that were refused before anything was sent
+_NOT_SENT = frozenset({"budget", "circuit_open"})
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class _Series:
+    __slots__ = ("requests", "errors", "bytes", "buckets", "latency_sum", "latency_count")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        self.bytes    = 0
+        self.buckets  = [0] * (len(LATENCY_BUCKETS) + 1)   # last = +Inf
+        self.latency_sum   = 0.0
+        self.latency_count = 0
+
+    def add(self, seconds: float | None, nbytes: int, error: str | None) -> None:
+        # Budget drops and open breakers never reach the network — an error, not a request
+        if error not in _NOT_SENT:
+            self.requests += 1
+        self.bytes    += nbytes
+        if error:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        if seconds is not None:
+            self.latency_sum   += seconds
+            self.latency_count += 1
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    self.buckets[i] += 1
+                    break
+            else:
+                self.buckets[-1] += 1
+
+    def snapshot(self) -> dict:
+        cumulative, running = {}, 0
+        for bound, n in zip((*LATENCY_BUCKETS, float("inf")), self.buckets):
+            running += n
+            cumulative["+Inf" if bound == float("inf") else str(bound)] = running
+        return {
+            "requests": self.requests,
+            "errors":   dict(self.errors),
+            "bytes":    self.bytes,
+            "latency":  {
+                "count":   self.latency_count,
+                "sum":     round(self.latency_sum, 4),
+                "buckets": cumulative,
+            },
+        }
+
+
+_lock = threading.Lock()
+_endpoints: dict[str, _Series] = {}
+_resources: dict[tuple[str, str], _Series] = {}
+_remaining: dict[str, deque[tuple[float, int]]] = {}
+
+
+# ── Recording (called by HFClient) ─────────────────────────────────────────────
+
+def record_request(
+    endpoint: str,
+    resources,
+    seconds: float | None,
+    nbytes: int = 0,
+    error: str | None = None,
+) -> None:
+    """Record one HTTP request. seconds is None when no response came back."""
+    with _lock:
+        series = _endpoints.get(endpoint)
+        if series is None:
+            series = _endpoints[endpoint] = _Series()
+        series.add(seconds, nbytes, error)
+        for resource in resources:
+            key    = (endpoint, resource)
+            series = _resources.get(key)
+            if series is None:
+                series = _resources[key] = _Series()
+            series.add(seconds, nbytes, error)
+
+
+def record_remaining(token: str, remaining: int) -> None:
+    """Record an x-rate-limit-remaining value seen for a token."""
+    label = f"...{token[-6:]}"
+    with _lock:
+        history = _remaining.get(label)
+        if history is None:
+            history = _remaining[label] = deque(maxlen=SNAPSHOTS_KEPT)
+        history.append((time.time(), remaining))
+
+
+def reset_metrics() -> None:
+    with _lock:
+        _endpoints.clear()
+        _resources.clear()
+        _remaining.clear()
+
+
+# ── In-process API ─────────────────────────────────────────────────────────────
+
+def get_metrics() -> dict:
+    """Snapshot of everything recorded so far. See the module docstring for the shape."""
+    with _lock:
+        resources: dict[str, dict[str, dict]] = {}
+        for (endpoint, resource), series in _resources.items():
+            resources.setdefault(endpoint, {})[resource] = series.snapshot()
+        return {
+            "endpoints":  {e: s.snapshot() for e, s in _endpoints.items()},
+            "resources":  resources,
+            "rate_limit": {t: list(h) for t, h in _remaining.items()},
+        }
+
+
+# ── OpenMetrics exporter ───────────────────────────────────────────────────────
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def render_openmetrics() -> str:
+    """Render every metric in the OpenMetrics text format."""
+    m = get_metrics()
+    series: list[tuple[str, dict, dict]] = []
+    for endpoint, s in m["endpoints"].items():
+        series.append(("hfapi", {"endpoint": endpoint}, s))
+    for endpoint, by_resource in m["resources"].items():
+        for resource, s in by_resource.items():
+            series.append(("hfapi_resource", {"endpoint": endpoint, "resource": resource}, s))
+
+    out: list[str] = []
+    for prefix, help_scope in (("hfapi", "HTTP requests sent"), ("hfapi_resource", "HTTP requests that included the resource")):
+        rows = [(labels, s) for p, labels, s in series if p == prefix]
+
+        out.append(f"# TYPE {prefix}_requests counter")
+        out.append(f"# HELP {prefix}_requests {help_scope}.")
+        out += [f"{prefix}_requests_total{_labels(**labels)} {s['requests']}" for labels, s in rows]
+
+        out.append(f"# TYPE {prefix}_response_bytes counter")
+        out.append(f"# UNIT {prefix}_response_bytes bytes")
+        out.append(f"# HELP {prefix}_response_bytes Response body bytes received.")
+        out += [f"{prefix}_response_bytes_total{_labels(**labels)} {s['bytes']}" for labels, s in rows]
+
+        out.append(f"# TYPE {prefix}_errors counter")
+        out.append(f"# HELP {prefix}_errors Failed requests by error class.")
+        for labels, s in rows:
+            for error, n in sorted(s["errors"].items()):
+                out.append(f"{prefix}_errors_total{_labels(**labels, error=error)} {n}")
+
+        out.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+        out.append(f"# UNIT {prefix}_request_duration_seconds seconds")
+        out.append(f"# HELP {prefix}_request_duration_seconds Time until the response arrived.")
+        for labels, s in rows:
+            lat = s["latency"]
+            for le, n in lat["buckets"].items():
+                out.append(f"{prefix}_request_duration_seconds_bucket{_labels(**labels, le=le)} {n}")
+            out.append(f"{prefix}_request_duration_seconds_count{_labels(**labels)} {lat['count']}")
+            out.append(f"{prefix}_request_duration_seconds_sum{_labels(**labels)} {lat['sum']}")
+
+    out.append("# TYPE hfapi_rate_limit_remaining gauge")
+    out.append("# HELP hfapi_rate_limit_remaining Last x-rate-limit-remaining value seen per token.")
+    for token, history in m["rate_limit"].items():
+        if history:
+            out.append(f"hfapi_rate_limit_remaining{_labels(token=token)} {history[-1][1]}")
+
+    out.append("# EOF")
+    return "\n".join(out) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_openmetrics().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_metrics_server(port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve /metrics from a daemon thread — for processes without a web
+    server, like a standalone HFWatcher. Returns the server (call shutdown()
+    to stop it).
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="hfapi-metrics", daemon=True).start()
+    log.info(f"Serving HF API metrics on http://{host}:{server.server_port}/metrics")
+    return server
@@ -0,0 +1,692 @@
+"""
+HFOutbox — durable, idempotent queue for /write calls.
+
+HFBytes.send(), HFPosts.reply(), HFThreads.create() and the bump / deposit /
+withdraw calls go out synchronously and return None when anything fails.
+After a timeout the caller can't tell whether the write landed: sending it
+again may pay someone twice, not sending it may pay them never. A payout or
+bump job pushing thousands of writes also holds its caller for as long as
+the rate budget takes to let them all through.
+
+HFOutbox puts writes in a SQLite file first and sends them from there:
+
+    - Each write has an idempotency key (yours or a generated one). Queueing
+      a key that is already in the outbox is a no-op, so a job that crashed
+      halfway can simply be run again.
+    - Queueing is one local INSERT; the caller never waits on HF.
+    - drain() / run() send queued writes with at most `concurrency` in
+      flight, in the background rate limiter lane, and stop claiming new
+      ones while the token's remaining budget is at or below `reserve` —
+      interactive calls keep their share of the hour.
+    - A row is marked "sending" (and committed) before its POST goes out and
+      settled after. Whoever is sending keeps the claim alive; a claim that
+      stops being renewed (process died) expires after `lease` seconds and
+      the row is picked up again.
+
+Retry rules:
+    Failures where the request never reached HF (no rate budget, breaker
+    open, proxy/connect error, MAX_HOURLY_CALLS_EXCEEDED) and the transient
+    statuses of the retry policy are sent again with backoff. Other HTTP
+    errors and {"success": false} answers fail the row.
+
+    A timeout, an unexpected transport error or an expired claim leaves the
+    write in doubt. Before sending it again the outbox looks for it on HF:
+    bytes sends in the token owner's sent transactions, replies in their
+    posts, new threads in their threads (same recipient or target and
+    content, dated after the first attempt), paging back until the rows
+    predate the first attempt. Found → done; not found → sent again.
+    Deposits, withdrawals and bumps leave nothing to look for; those rows
+    go to "unknown" for you to settle with resolve().
+
+States:
+    pending   waiting to be sent (due at `due`)
+    sending   claimed by a drainer
+    done      HF accepted it; response holds the answer
+    failed    HF rejected it, or it ran out of attempts; error says why
+    unknown   may or may not have landed, and can't be checked
+
+Usage:
+    from HFOutbox import HFOutbox
+
+    outbox = HFOutbox(HFClient(token), "payouts.db", concurrency=4)
+
+    for winner in winners:                      # returns at once
+        outbox.send_bytes(winner.uid, 100, "Giveaway", key=f"giveaway-42-{winner.uid}")
+    outbox.bump(6083735, key="bump-6083735-2026-10-16")
+
+    await outbox.drain()                        # or: asyncio.create_task(outbox.run())
+    row = outbox.get(f"giveaway-42-{uid}")      # {"state": "done", "response": {...}, ...}
+
+    outbox.drain_sync()                         # from synchronous code
+
+Several processes may drain the same file; each write is claimed by one of
+them at a time. drain() and wait() do their SQLite work in a worker thread,
+so waiting on another drainer's lock never stalls the event loop. Rows
+belong to the token that queued them (stored as a SHA-256 prefix) and are
+only sent with that token.
+
+Schema:
+    outbox(
+        id INTEGER PRIMARY KEY,
+        owner TEXT,         -- token's state_key()
+        key TEXT,           -- idempotency key, UNIQUE per owner
+        kind TEXT,          -- "bytes.send", "posts.reply", ...
+        asks TEXT,          -- JSON asks dict
+        state TEXT, attempts INTEGER, due REAL,
+        claimed REAL,       -- last renewal of the current claim
+        in_doubt INTEGER,   -- 1 = look for it on HF before sending again
+        first_sent REAL,    -- when the first attempt went out
+        response TEXT, error TEXT, created REAL, updated REAL
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Awaitable, Callable
+
+import HFCodec
+from HFBytes import HFBytes, parse_amount
+from HFClient import HFClient, get_rate_limit_remaining, is_rate_limited, run_sync
+from HFPosts import HFPosts
+from HFRateLimiter import PRIORITY_BACKGROUND, request_priority
+from HFRateState import state_key
+from HFRetry import RetryPolicy
+from HFThreads import HFThreads
+
+log = logging.getLogger("hfapi.outbox")
+
+PENDING = "pending"
+SENDING = "sending"
+DONE    = "done"
+FAILED  = "failed"
+UNKNOWN = "unknown"
+
+SETTLED = frozenset({DONE, FAILED, UNKNOWN})
+
+# Backoff between attempts of one write; attempts is the most sends it gets
+OUTBOX_RETRY = RetryPolicy(attempts=8, base_delay=5.0, multiplier=3.0, max_delay=900.0, deadline=None)
+
+# Failure kinds for requests that never reached HF — always safe to send again.
+# Any other failure (timeout, unexpected error) leaves the write in doubt.
+_NOT_SENT = frozenset({"budget", "circuit_open", "proxy", "connect"})
+
+# Wait this long after an in-doubt attempt before looking for it on HF
+_SETTLE_DELAY = 30.0
+# Allowance for clock skew between us and HF when matching datelines
+_CLOCK_SLACK  = 120.0
+
+
+class HFOutbox:
+    """
+    Durable write queue for one token. See the module docstring.
+
+    Args:
+        client:      HFClient whose token, proxy and timeout the writes use.
+        path:        SQLite file. ":memory:" works but survives nothing.
+        concurrency: Most writes in flight at once.
+        reserve:     Leave at least this many calls of the hourly budget to
+                     everything else — no new write is claimed below it.
+        lease:       Seconds a claim lasts without renewal before another
+                     drainer may take the write over.
+        retry:       Backoff and attempt limit per write.
+    """
+
+    def __init__(
+        self,
+        client: HFClient,
+        path: str = "hf_outbox.db",
+        concurrency: int = 4,
+        reserve: int = 50,
+        lease: float = 60.0,
+        retry: RetryPolicy = OUTBOX_RETRY,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._hf         = client
+        self._path       = path
+        self._owner      = state_key(client.token)
+        self.concurrency = concurrency
+        self.reserve     = reserve
+        self.lease       = lease
+        self.retry       = retry
+        self._lock       = threading.Lock()
+        self._conn       = self._connect()
+        self._init_schema()
+        self._running    = False
+        self._my_uid: int | None = None
+        log.info(f"HFOutbox opened: {path}")
+
+    # ── Connection ─────────────────────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path,
+            check_same_thread=False,   # guarded by self._lock
+            timeout=10,
+            isolation_level=None,      # explicit BEGIN/COMMIT below
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=FULL")   # a committed claim must survive power loss
+        return conn
+
+    def _init_schema(self) -> None:
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id         INTEGER PRIMARY KEY,
+                    owner      TEXT    NOT NULL,
+                    key        TEXT    NOT NULL,
+                    kind       TEXT    NOT NULL,
+                    asks       TEXT    NOT NULL,
+                    state      TEXT    NOT NULL DEFAULT 'pending',
+                    attempts   INTEGER NOT NULL DEFAULT 0,
+                    due        REAL    NOT NULL,
+                    claimed    REAL,
+                    in_doubt   INTEGER NOT NULL DEFAULT 0,
+                    first_sent REAL,
+                    response   TEXT,
+                    error      TEXT,
+                    created    REAL    NOT NULL,
+                    updated    REAL    NOT NULL,
+                    UNIQUE (owner, key)
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (owner, state, due)")
+
+    def _transaction(self, fn: Callable[[sqlite3.Connection], object]):
+        """Run fn in a write transaction that holds the file lock from the start."""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return result
+
+    async def _atransaction(self, fn: Callable[[sqlite3.Connection], object]):
+        """
+        _transaction() for drain(). Another drainer's commit can hold the file
+        lock for a while (synchronous=FULL fsyncs), so the wait happens in a
+        worker thread and the event loop keeps serving everything else.
+        """
+        return await asyncio.to_thread(self._transaction, fn)
+
+    # ── Queueing ───────────────────────────────────────────────────────────────
+
+    def enqueue(self, kind: str, asks: dict, key: str | None = None) -> str:
+        """
+        Queue one /write call and return its idempotency key.
+
+        A key already in the outbox is left as it is, whatever its state.
+        Reusing a key for a different write raises ValueError.
+        """
+        key     = key or uuid.uuid4().hex
+        encoded = HFCodec.dumps(asks)
+        now     = time.time()
+
+        def _insert(conn: sqlite3.Connection) -> None:
+            row = conn.execute(
+                "SELECT kind, asks FROM outbox WHERE owner=? AND key=?", (self._owner, key)
+            ).fetchone()
+            if row is not None:
+                if row["kind"] != kind or HFCodec.loads(row["asks"]) != HFCodec.loads(encoded):
+                    raise ValueError(f"Idempotency key {key!r} is already used for a different write")
+                return
+            conn.execute(
+                "INSERT INTO outbox (owner, key, kind, asks, due, created, updated) VALUES (?,?,?,?,?,?,?)",
+                (self._owner, key, kind, encoded, now, now, now),
+            )
+
+        self._transaction(_insert)
+        return key
+
+    def send_bytes(self, to_uid: int, amount: int, reason: str = "", pid: int = 0, key: str | None = None) -> str:
+        """Queue HFBytes.send()."""
+        return self.enqueue("bytes.send", HFBytes.send_asks(to_uid, amount, reason, pid), key)
+
+    def deposit(self, amount: int, key: str | None = None) -> str:
+        """Queue HFBytes.deposit()."""
+        return self.enqueue("bytes.deposit", HFBytes.deposit_asks(amount), key)
+
+    def withdraw(self, amount: int, key: str | None = None) -> str:
+        """Queue HFBytes.withdraw()."""
+        return self.enqueue("bytes.withdraw", HFBytes.withdraw_asks(amount), key)
+
+    def bump(self, tid: int, key: str | None = None) -> str:
+        """Queue HFBytes.bump()."""
+        return self.enqueue("bytes.bump", HFBytes.bump_asks(tid), key)
+
+    def reply(self, tid: int, message: str, key: str | None = None) -> str:
+        """Queue HFPosts.reply()."""
+        return self.enqueue("posts.reply", HFPosts.reply_asks(tid, message), key)
+
+    def create_thread(self, fid: int, subject: str, message: str, key: str | None = None) -> str:
+        """Queue HFThreads.create()."""
+        return self.enqueue("threads.create", HFThreads.create_asks(fid, subject, message), key)
+
+    # ── Inspection ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> dict:
+        out = dict(row)
+        out["asks"]     = HFCodec.loads(out["asks"])
+        out["response"] = HFCodec.loads(out["response"]) if out["response"] else None
+        out["in_doubt"] = bool(out["in_doubt"])
+        del out["owner"]
+        return out
+
+    def get(self, key: str) -> dict | None:
+        """The outbox row for key, or None if there is none."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM outbox WHERE owner=? AND key=?", (self._owner, key)
+            ).fetchone()
+        return self._row(row) if row else None
+
+    def list(self, state: str | None = None, limit: int = 100) -> list[dict]:
+        """Rows in one state (or all), oldest first."""
+        sql    = "SELECT * FROM outbox WHERE owner=?"
+        params: list = [self._owner]
+        if state is not None:
+            sql += " AND state=?"
+            params.append(state)
+        sql += " ORDER BY id LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row(r) for r in rows]
+
+    def stats(self) -> dict[str, int]:
+        """Row count per state."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM outbox WHERE owner=? GROUP BY state", (self._owner,)
+            ).fetchall()
+        out = dict.fromkeys((PENDING, SENDING, DONE, FAILED, UNKNOWN), 0)
+        out.update({state: n for state, n in rows})
+        return out
+
+    async def wait(self, key: str, timeout: float | None = None, poll: float = 0.25) -> dict | None:
+        """
+        Wait until key's write is settled (done, failed or unknown) by any
+        drainer and return its row. None if it isn't settled within timeout
+        or the key doesn't exist.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            row = await asyncio.to_thread(self.get, key)
+            if row is None or row["state"] in SETTLED:
+                return row
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(poll)
+
+    # ── Manual settling ────────────────────────────────────────────────────────
+
+    def resolve(self, key: str, landed: bool) -> bool:
+        """
+        Settle an "unknown" write once you've checked HF yourself: landed=True
+        marks it done, False queues it to be sent again. Returns False if key
+        isn't in the unknown state.
+        """
+        now = time.time()
+
+        def _resolve(conn: sqlite3.Connection) -> bool:
+            if landed:
+                cur = conn.execute(
+                    "UPDATE outbox SET state=?, in_doubt=0, error=NULL, updated=? "
+                    "WHERE owner=? AND key=? AND state=?",
+                    (DONE, now, self._owner, key, UNKNOWN),
+                )
+            else:
+                cur = conn.execute(
+                    "UPDATE outbox SET state=?, in_doubt=0, attempts=0, due=?, updated=? "
+                    "WHERE owner=? AND key=? AND state=?",
+                    (PENDING, now, now, self._owner, key, UNKNOWN),
+                )
+            return cur.rowcount > 0
+
+        return self._transaction(_resolve)
+
+    def retry_failed(self, key: str | None = None) -> int:
+        """Queue failed writes (one, or all) to be sent again. Returns how many."""
+        now = time.time()
+        sql = "UPDATE outbox SET state=?, attempts=0, due=?, updated=? WHERE owner=? AND state=?"
+        params: list = [PENDING, now, now, self._owner, FAILED]
+        if key is not None:
+            sql += " AND key=?"
+            params.append(key)
+        return self._transaction(lambda conn: conn.execute(sql, params).rowcount)
+
+    def purge(self, days: int = 7) -> int:
+        """Delete done rows settled more than days ago. Returns how many."""
+        cutoff = time.time() - days * 86400
+        return self._transaction(lambda conn: conn.execute(
+            "DELETE FROM outbox WHERE owner=? AND state=? AND updated < ?", (self._owner, DONE, cutoff)
+        ).rowcount)
+
+    # ── Claiming ───────────────────────────────────────────────────────────────
+
+    async def _claim(self, n: int) -> list[sqlite3.Row]:
+        """Take up to n due writes, first releasing claims that have expired."""
+        now = time.time()
+
+        def _take(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            expired = conn.execute(
+                "UPDATE outbox SET state=?, in_doubt=1, due=?, error='claim expired', updated=? "
+                "WHERE owner=? AND state=? AND claimed < ?",
+                (PENDING, now, now, self._owner, SENDING, now - self.lease),
+            ).rowcount
+            if expired:
+                log.warning(f"HFOutbox: {expired} write(s) abandoned mid-send — checking them before resending")
+            rows = conn.execute(
+                "SELECT * FROM outbox WHERE owner=? AND state=? AND due <= ? ORDER BY due, id LIMIT ?",
+                (self._owner, PENDING, now, n),
+            ).fetchall()
+            if rows:
+                conn.executemany(
+                    "UPDATE outbox SET state=?, claimed=?, updated=? WHERE id=?",
+                    [(SENDING, now, now, r["id"]) for r in rows],
+                )
+            return rows
+
+        return await self._atransaction(_take)
+
+    async def _renew(self, ids: list[int]) -> None:
+        now = time.time()
+        await self._atransaction(lambda conn: conn.executemany(
+            "UPDATE outbox SET claimed=? WHERE id=? AND state=?", [(now, i, SENDING) for i in ids]
+        ))
+
+    async def _settle(self, row_id: int, **fields) -> None:
+        fields["updated"] = time.time()
+        cols = ", ".join(f"{k}=?" for k in fields)
+        await self._atransaction(lambda conn: conn.execute(
+            f"UPDATE outbox SET {cols} WHERE id=? AND state=?", (*fields.values(), row_id, SENDING)
+        ))
+
+    async def _mark_sent(self, row_id: int, attempts: int) -> None:
+        """Record the attempt as under way — committed before the POST goes out."""
+        now = time.time()
+        await self._atransaction(lambda conn: conn.execute(
+            "UPDATE outbox SET attempts=?, in_doubt=1, first_sent=COALESCE(first_sent, ?), claimed=?, updated=? "
+            "WHERE id=?",
+            (attempts, now, now, now, row_id),
+        ))
+
+    # ── Draining ───────────────────────────────────────────────────────────────
+
+    def _budget_wait(self) -> float:
+        """Seconds to hold off claiming new writes (0 = go ahead)."""
+        token = self._hf.token
+        if is_rate_limited(token):
+            return 30.0
+        if get_rate_limit_remaining(token) <= self.reserve:
+            return 30.0
+        return 0.0
+
+    async def drain(self, idle_exit: bool = True) -> int:
+        """
+        Send queued writes until none is due. Returns the number settled.
+
+        Writes waiting out a backoff are left for a later drain() or run().
+        With idle_exit=False this keeps going until stop() (see run()).
+        """
+        self._running = True
+        inflight: dict[asyncio.Task, int] = {}
+        settled  = 0
+        renew_at = time.monotonic() + self.lease / 3
+        try:
+            while self._running or inflight:
+                if self._running and len(inflight) < self.concurrency:
+                    hold = self._budget_wait()
+                    rows = [] if hold else await self._claim(self.concurrency - len(inflight))
+                    # Tasks copy the context they're created in: sends and
+                    # lookups all run in the background lane
+                    with request_priority(PRIORITY_BACKGROUND):
+                        for row in rows:
+                            inflight[asyncio.create_task(self._process(row))] = row["id"]
+                else:
+                    hold = 0.0
+
+                if not inflight:
+                    if idle_exit and not hold:
+                        break
+                    await asyncio.sleep(hold or 1.0)
+                    continue
+
+                done, _ = await asyncio.wait(inflight, timeout=1.0, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    row_id = inflight.pop(task)
+                    if task.exception() is not None:
+                        # The row keeps its claim until the lease runs out
+                        log.warning(f"HFOutbox: write #{row_id} failed unexpectedly: {task.exception()!r}")
+                    elif task.result():
+                        settled += 1
+                if inflight and time.monotonic() >= renew_at:
+                    await self._renew(list(inflight.values()))
+                    renew_at = time.monotonic() + self.lease / 3
+        finally:
+            # Cancelled mid-send: leave the claims to expire, which puts the
+            # writes in doubt — they may already have reached HF
+            for task in inflight:
+                task.cancel()
+            self._running = False
+        return settled
+
+    async def run(self) -> None:
+        """Drain forever — queued writes go out as they come due — until stop()."""
+        log.info(f"HFOutbox draining {self._path} (concurrency {self.concurrency}, reserve {self.reserve})")
+        await self.drain(idle_exit=False)
+
+    def stop(self) -> None:
+        """Stop claiming writes; run()/drain() return once in-flight writes settle."""
+        self._running = False
+
+    def drain_sync(self) -> int:
+        """Synchronous drain()."""
+        return run_sync(self.drain())
+
+    # ── One write ──────────────────────────────────────────────────────────────
+
+    async def _process(self, row: sqlite3.Row) -> bool:
+        """Send (or check, then send) one claimed write. Returns True if it settled."""
+        asks     = HFCodec.loads(row["asks"])
+        attempts = row["attempts"]
+
+        if row["in_doubt"]:
+            landed = await self._check(row["kind"], asks, row["first_sent"])
+            if landed is True:
+                log.info(f"HFOutbox: {row['kind']} {row['key']} found on HF — not resending")
+                await self._settle(row["id"], state=DONE, in_doubt=0, error=None)
+                return True
+            if landed is None:
+                await self._settle(row["id"], state=UNKNOWN, error=row["error"] or "in doubt")
+                log.warning(f"HFOutbox: {row['kind']} {row['key']} may have landed and can't be checked — "
+                            f"resolve() it by hand")
+                return True
+            if landed == "retry":
+                await self._reschedule(row, self.retry.backoff(max(attempts, 1)), "could not check HF", in_doubt=1)
+                return False
+
+        if attempts >= self.retry.attempts:
+            await self._settle(row["id"], state=FAILED, in_doubt=0, error=f"gave up after {attempts} attempts")
+            return True
+
+        attempts += 1
+        await self._mark_sent(row["id"], attempts)
+        result, failure = await self._hf._write_once(asks, PRIORITY_BACKGROUND)
+        return await self._outcome(row, attempts, result, failure)
+
+    async def _outcome(self, row: sqlite3.Row, attempts: int, result, failure: str | None) -> bool:
+        kind, key = row["kind"], row["key"]
+
+        if failure in _NOT_SENT:
+            await self._reschedule(row, self.retry.backoff(attempts), failure, in_doubt=0, attempts=attempts - 1)
+            return False
+        if failure is not None:
+            log.warning(f"HFOutbox: {kind} {key} {failure} — will check HF before resending")
+            await self._reschedule(row, _SETTLE_DELAY, failure, in_doubt=1, attempts=attempts)
+            return False
+
+        status, body = result
+        if b"MAX_HOURLY_CALLS_EXCEEDED" in body:
+            await self._reschedule(row, 0, "rate_limited", in_doubt=0, attempts=attempts - 1)
+            return False
+        if status != 200:
+            if status in self.retry.statuses and attempts < self.retry.attempts:
+                await self._reschedule(row, self.retry.backoff(attempts), f"HTTP {status}", in_doubt=0, attempts=attempts)
+                return False
+            await self._settle(row["id"], state=FAILED, in_doubt=0, error=f"HTTP {status}: {body[:200]!r}")
+            log.warning(f"HFOutbox: {kind} {key} failed — HTTP {status}")
+            return True
+
+        try:
+            data = HFCodec.loads(body)
+        except Exception:
+            await self._settle(row["id"], state=UNKNOWN, error=f"non-JSON answer: {body[:200]!r}")
+            return True
+        if isinstance(data, dict) and data.get("success") is False:
+            await self._settle(row["id"], state=FAILED, in_doubt=0, error=str(data.get("message") or "rejected"))
+            log.warning(f"HFOutbox: {kind} {key} rejected — {data.get('message')}")
+            return True
+        await self._settle(row["id"], state=DONE, in_doubt=0, error=None, response=HFCodec.dumps(data))
+        return True
+
+    async def _reschedule(self, row: sqlite3.Row, delay: float, error: str, in_doubt: int, attempts: int | None = None) -> None:
+        fields = {"state": PENDING, "due": time.time() + delay, "error": error, "in_doubt": in_doubt}
+        if attempts is not None:
+            fields["attempts"] = attempts
+        await self._settle(row["id"], **fields)
+
+    # ── Looking for in-doubt writes on HF ──────────────────────────────────────
+
+    async def _check(self, kind: str, asks: dict, first_sent: float | None):
+        """
+        True if the write is on HF, False if it isn't, None if this kind
+        can't be checked, "retry" if the lookup itself failed.
+        """
+        checker = _CHECKS.get(kind)
+        if checker is None:
+            return None
+        if first_sent is None:
+            return False   # claimed but never sent
+        uid = await self._uid()
+        if uid is None:
+            return "retry"
+        found = await checker(self._hf, uid, asks, first_sent - _CLOCK_SLACK)
+        return "retry" if found is None else found
+
+    async def _uid(self) -> int | None:
+        if self._my_uid is None:
+            data = await self._hf.read({"me": {"uid": True}})
+            rows = self._hf._unwrap(data, "me")
+            uid  = int(rows[0].get("uid") or 0) if rows else 0
+            self._my_uid = uid or None
+        return self._my_uid
+
+    # ── Housekeeping ───────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+        log.info(f"HFOutbox closed: {self._path}")
+
+    def __enter__(self) -> "HFOutbox":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"HFOutbox(path={self._path!r}, concurrency={self.concurrency})"
+
+
+# ── Lookups per write kind ─────────────────────────────────────────────────────
+# Each takes (client, token owner's uid, asks, earliest dateline) and returns
+# True/False, or None if the lookup couldn't finish.
+
+def _uid_of(value) -> str:
+    """A uid from a field that comes back as a bare id or a nested user object."""
+    if isinstance(value, dict):
+        return str(value.get("uid") or "")
+    return str(value or "")
+
+
+# Rows per lookup page (HF's maximum) and the most pages one lookup reads
+_CHECK_PERPAGE   = 30
+_CHECK_MAX_PAGES = 20
+
+
+async def _find(hf: HFClient, resource: str, ask: dict, since: float, match: Callable[[dict], bool]) -> bool | None:
+    """
+    Page back through the token owner's rows of resource, newest first,
+    until one dated since or later matches, or the pages reach rows older
+    than since. None if a read failed or since lies beyond _CHECK_MAX_PAGES.
+    """
+    for page in range(1, _CHECK_MAX_PAGES + 1):
+        data = await hf.read({resource: {**ask, "_page": page, "_perpage": _CHECK_PERPAGE}})
+        if data is None:
+            return None
+        rows  = hf._unwrap(data, resource)
+        dates = [int(row.get("dateline") or 0) for row in rows]
+        if any(when >= since and match(row) for when, row in zip(dates, rows)):
+            return True
+        if len(rows) < _CHECK_PERPAGE or min(dates) < since:
+            return False
+    log.warning(f"HFOutbox lookup of {resource} gave up after {_CHECK_MAX_PAGES} pages")
+    return None
+
+
+async def _check_bytes_send(hf: HFClient, uid: int, asks: dict, since: float) -> bool | None:
+    ask = asks["bytes"]
+    return await _find(
+        hf, "bytes",
+        {"_from": [uid], "id": True, "amount": True, "dateline": True, "reason": True, "to": True},
+        since,
+        lambda tx: (
+            _uid_of(tx.get("to")) == str(ask["_uid"])
+            and parse_amount(tx.get("amount")) == parse_amount(ask["_amount"])
+            and (tx.get("reason") or "") == ask.get("_reason", "")
+        ),
+    )
+
+
+async def _check_posts_reply(hf: HFClient, uid: int, asks: dict, since: float) -> bool | None:
+    ask = asks["posts"]
+    return await _find(
+        hf, "posts",
+        {"_uid": [uid], "pid": True, "tid": True, "dateline": True, "message": True},
+        since,
+        lambda p: (
+            str(p.get("tid")) == str(ask["_tid"])
+            and (p.get("message") or "").strip() == ask["_message"].strip()
+        ),
+    )
+
+
+async def _check_threads_create(hf: HFClient, uid: int, asks: dict, since: float) -> bool | None:
+    ask = asks["threads"]
+    return await _find(
+        hf, "threads",
+        {"_uid": [uid], "tid": True, "fid": True, "subject": True, "dateline": True},
+        since,
+        lambda t: str(t.get("fid")) == str(ask["_fid"]) and (t.get("subject") or "") == ask["_subject"],
+    )
+
+
+_CHECKS: dict[str, Callable[[HFClient, int, dict, float], Awaitable[bool | None]]] = {
+    "bytes.send":     _check_bytes_send,
+    "posts.reply":    _check_posts_reply,
+    "threads.create": _check_threads_create,
+}
@@ -12,11 +12,28 @@ meaning there are no more pages. The fix passes perpage into _paginate() and
 checks `len(items) < perpage` to detect the last page correctly. This prevents
 the paginator from always making one unnecessary extra API call (the empty final
 page that was previously needed to terminate the loop).
+
+RATE LIMITER LANE:
+    Page walks run in the PRIORITY_BACKGROUND lane unless the caller already
+    set a request_priority() (e.g. the CLI runs everything interactive).
+
+ASYNC:
+    Every get_all_* method has an a-prefixed coroutine twin (aget_all_posts_by_user,
+    ...) that awaits the resource class's async getters and sleeps with
+    asyncio.sleep() between pages, so it never blocks the event loop.
+
+FIELD PROFILES:
+    Every walker passes fields= through to the page getter (see HFFields).
+    stop_at_pid / stop_at_id need "pid" / "id" in the projection.
 """
 
+import asyncio
 import time
 import logging
 
+from HFFields import Fields
+from HFRateLimiter import PRIORITY_BACKGROUND, get_request_priority, request_priority
+
 log = logging.getLogger("hfapi.paginator")
 
 DEFAULT_PERPAGE   = 20
@@ -34,10 +51,11 @@ class HFPaginator:
         perpage: int = DEFAULT_PERPAGE,
         max_pages: int = DEFAULT_MAX_PAGES,
         stop_at_pid: int = 0,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get all posts by a user across all pages."""
         return HFPaginator._paginate(
-            fetch_fn=lambda page: posts_api.get_by_user(uid, page=page, perpage=perpage),
+            fetch_fn=lambda page: posts_api.get_by_user(uid, page=page, perpage=perpage, fields=fields),
             max_pages=max_pages,
             perpage=perpage,
             stop_condition=lambda item: stop_at_pid and str(item.get("pid")) == str(stop_at_pid),
@@ -49,10 +67,11 @@ class HFPaginator:
         tid: int,
         perpage: int = DEFAULT_PERPAGE,
         max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get all posts in a thread across all pages."""
         return HFPaginator._paginate(
-            fetch_fn=lambda page: posts_api.get_by_thread(tid, page=page, perpage=perpage),
+            fetch_fn=lambda page: posts_api.get_by_thread(tid, page=page, perpage=perpage, fields=fields),
             max_pages=max_pages,
             perpage=perpage,
         )
@@ -63,10 +82,11 @@ class HFPaginator:
         uid: int,
         perpage: int = DEFAULT_PERPAGE,
         max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get all threads created by a user."""
         return HFPaginator._paginate(
-            fetch_fn=lambda page: threads_api.get_by_user(uid, page=page, perpage=perpage),
+            fetch_fn=lambda page: threads_api.get_by_user(uid, page=page, perpage=perpage, fields=fields),
             max_pages=max_pages,
             perpage=perpage,
         )
@@ -78,10 +98,11 @@ class HFPaginator:
         perpage: int = DEFAULT_PERPAGE,
         max_pages: int = DEFAULT_MAX_PAGES,
         stop_at_id: int = 0,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get all bytes transactions received by a user."""
         return HFPaginator._paginate(
-            fetch_fn=lambda page: bytes_api.get_received(uid, page=page, perpage=perpage),
+            fetch_fn=lambda page: bytes_api.get_received(uid, page=page, perpage=perpage, fields=fields),
             max_pages=max_pages,
             perpage=perpage,
             stop_condition=lambda item: stop_at_id and str(item.get("id")) == str(stop_at_id),
@@ -93,10 +114,11 @@ class HFPaginator:
         uid: int,
         perpage: int = DEFAULT_PERPAGE,
         max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get all bytes transactions sent by a user."""
         return HFPaginator._paginate(
-            fetch_fn=lambda page: bytes_api.get_sent(uid, page=page, perpage=perpage),
+            fetch_fn=lambda page: bytes_api.get_sent(uid, page=page, perpage=perpage, fields=fields),
             max_pages=max_pages,
             perpage=perpage,
         )
@@ -107,10 +129,11 @@ class HFPaginator:
         uid: int,
         perpage: int = 30,
         max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get all contracts for a user."""
         return HFPaginator._paginate(
-            fetch_fn=lambda page: contracts_api.get_by_user(uid, page=page, perpage=perpage),
+            fetch_fn=lambda page: contracts_api.get_by_user(uid, page=page, perpage=perpage, fields=fields),
             max_pages=max_pages,
             perpage=perpage,
         )
@@ -121,10 +144,11 @@ class HFPaginator:
         uid: int,
         perpage: int = 30,
         max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get all b-ratings received by a user."""
         return HFPaginator._paginate(
-            fetch_fn=lambda page: bratings_api.get_received(uid, page=page, perpage=perpage),
+            fetch_fn=lambda page: bratings_api.get_received(uid, page=page, perpage=perpage, fields=fields),
             max_pages=max_pages,
             perpage=perpage,
         )
@@ -135,10 +159,137 @@ class HFPaginator:
         uid: int,
         perpage: int = 30,
         max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get all b-ratings given by a user."""
         return HFPaginator._paginate(
-            fetch_fn=lambda page: bratings_api.get_given(uid, page=page, perpage=perpage),
+            fetch_fn=lambda page: bratings_api.get_given(uid, page=page, perpage=perpage, fields=fields),
+            max_pages=max_pages,
+            perpage=perpage,
+        )
+
+    # ── Async variants ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    async def aget_all_posts_by_user(
+        posts_api,
+        uid: int,
+        perpage: int = DEFAULT_PERPAGE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        stop_at_pid: int = 0,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_posts_by_user()."""
+        return await HFPaginator._apaginate(
+            fetch_fn=lambda page: posts_api.aget_by_user(uid, page=page, perpage=perpage, fields=fields),
+            max_pages=max_pages,
+            perpage=perpage,
+            stop_condition=lambda item: stop_at_pid and str(item.get("pid")) == str(stop_at_pid),
+        )
+
+    @staticmethod
+    async def aget_all_posts_by_thread(
+        posts_api,
+        tid: int,
+        perpage: int = DEFAULT_PERPAGE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_posts_by_thread()."""
+        return await HFPaginator._apaginate(
+            fetch_fn=lambda page: posts_api.aget_by_thread(tid, page=page, perpage=perpage, fields=fields),
+            max_pages=max_pages,
+            perpage=perpage,
+        )
+
+    @staticmethod
+    async def aget_all_threads_by_user(
+        threads_api,
+        uid: int,
+        perpage: int = DEFAULT_PERPAGE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_threads_by_user()."""
+        return await HFPaginator._apaginate(
+            fetch_fn=lambda page: threads_api.aget_by_user(uid, page=page, perpage=perpage, fields=fields),
+            max_pages=max_pages,
+            perpage=perpage,
+        )
+
+    @staticmethod
+    async def aget_all_bytes_received(
+        bytes_api,
+        uid: int,
+        perpage: int = DEFAULT_PERPAGE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        stop_at_id: int = 0,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_bytes_received()."""
+        return await HFPaginator._apaginate(
+            fetch_fn=lambda page: bytes_api.aget_received(uid, page=page, perpage=perpage, fields=fields),
+            max_pages=max_pages,
+            perpage=perpage,
+            stop_condition=lambda item: stop_at_id and str(item.get("id")) == str(stop_at_id),
+        )
+
+    @staticmethod
+    async def aget_all_bytes_sent(
+        bytes_api,
+        uid: int,
+        perpage: int = DEFAULT_PERPAGE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_bytes_sent()."""
+        return await HFPaginator._apaginate(
+            fetch_fn=lambda page: bytes_api.aget_sent(uid, page=page, perpage=perpage, fields=fields),
+            max_pages=max_pages,
+            perpage=perpage,
+        )
+
+    @staticmethod
+    async def aget_all_contracts_by_user(
+        contracts_api,
+        uid: int,
+        perpage: int = 30,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_contracts_by_user()."""
+        return await HFPaginator._apaginate(
+            fetch_fn=lambda page: contracts_api.aget_by_user(uid, page=page, perpage=perpage, fields=fields),
+            max_pages=max_pages,
+            perpage=perpage,
+        )
+
+    @staticmethod
+    async def aget_all_bratings_received(
+        bratings_api,
+        uid: int,
+        perpage: int = 30,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_bratings_received()."""
+        return await HFPaginator._apaginate(
+            fetch_fn=lambda page: bratings_api.aget_received(uid, page=page, perpage=perpage, fields=fields),
+            max_pages=max_pages,
+            perpage=perpage,
+        )
+
+    @staticmethod
+    async def aget_all_bratings_given(
+        bratings_api,
+        uid: int,
+        perpage: int = 30,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_bratings_given()."""
+        return await HFPaginator._apaginate(
+            fetch_fn=lambda page: bratings_api.aget_given(uid, page=page, perpage=perpage, fields=fields),
             max_pages=max_pages,
             perpage=perpage,
         )
@@ -179,32 +330,67 @@ class HFPaginator:
             Accumulated list of all collected items.
         """
         all_items = []
-        for page in range(1, max_pages + 1):
-            if page > 1 and delay > 0:
-                time.sleep(delay)
-
-            items = fetch_fn(page)
-            if not items:
-                log.debug(f"Paginator: empty page {page}, stopping")
-                break
-
-            stop = False
-            for item in items:
-                if stop_condition and stop_condition(item):
-                    log.debug(f"Paginator: stop condition hit on page {page}")
-                    stop = True
+        with request_priority(_lane()):
+            for page in range(1, max_pages + 1):
+                if page > 1 and delay > 0:
+                    time.sleep(delay)
+
+                items = fetch_fn(page)
+                if not HFPaginator._collect(items, page, perpage, stop_condition, all_items):
                     break
-                all_items.append(item)
 
-            if stop:
-                break
+        return all_items
 
-            # BUG #7 FIX: Partial page means we've reached the last page.
-            # No need to make another API call just to get an empty response.
-            if len(items) < perpage:
-                log.debug(f"Paginator: partial page {page} ({len(items)}<{perpage}), stopping")
-                break
+    @staticmethod
+    async def _apaginate(
+        fetch_fn,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        perpage: int = DEFAULT_PERPAGE,
+        stop_condition=None,
+        delay: float = PAGE_DELAY,
+    ) -> list[dict]:
+        """
+        Async version of _paginate(). fetch_fn is Callable(page: int) -> Awaitable[list[dict]].
+        """
+        all_items = []
+        with request_priority(_lane()):
+            for page in range(1, max_pages + 1):
+                if page > 1 and delay > 0:
+                    await asyncio.sleep(delay)
 
-            log.debug(f"Paginator: page {page} → {len(items)} items (total {len(all_items)})")
+                items = await fetch_fn(page)
+                if not HFPaginator._collect(items, page, perpage, stop_condition, all_items):
+                    break
 
         return all_items
+
+    @staticmethod
+    def _collect(items, page: int, perpage: int, stop_condition, all_items: list) -> bool:
+        """
+        Append one page of items to all_items. Returns False when pagination
+        should stop (empty page, stop condition hit, or partial page).
+        """
+        if not items:
+            log.debug(f"Paginator: empty page {page}, stopping")
+            return False
+
+        for item in items:
+            if stop_condition and stop_condition(item):
+                log.debug(f"Paginator: stop condition hit on page {page}")
+                return False
+            all_items.append(item)
+
+        # BUG #7 FIX: Partial page means we've reached the last page.
+        # No need to make another API call just to get an empty response.
+        if len(items) < perpage:
+            log.debug(f"Paginator: partial page {page} ({len(items)}<{perpage}), stopping")
+            return False
+
+        log.debug(f"Paginator: page {page} → {len(items)} items (total {len(all_items)})")
+        return True
+
+
+def _lane() -> int:
+    """The caller's rate limiter lane, or background if none was set."""
+    priority = get_request_priority()
+    return PRIORITY_BACKGROUND if priority is None else priority
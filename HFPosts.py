@@ -2,61 +2,118 @@
 HFPosts — read and write posts on HackForums.
 Read requires 'Posts' scope. Write requires 'Posts Write' scope.
 
-BUG FIX #1: All self.read() / self.write() calls changed to
-self.read_sync() / self.write_sync().
+BUG FIX #1: Sync methods no longer call the async read()/write() without
+awaiting them. Each call is implemented once as an async method (aget, ...)
+and the sync method runs it via _run_sync().
 """
 
 from HFClient import HFClient
-
-_FIELDS = {
-    "pid": True, "tid": True, "uid": True, "fid": True,
-    "dateline": True, "message": True, "subject": True,
-    "edituid": True, "edittime": True, "editreason": True,
-}
+from HFFields import Fields, project
 
 
 class HFPosts(HFClient):
-    """Read and write posts (/read/posts and /write/posts endpoints)."""
+    """
+    Read and write posts (/read/posts and /write/posts endpoints).
 
-    def get(self, pids: list[int]) -> list[dict]:
-        """Get posts by post ID(s)."""
-        data = self.read_sync({"posts": {"_pid": pids, **_FIELDS}})
+    Every method has an async twin prefixed with "a" (aget, aget_by_thread,
+    areply, ...) for use inside an event loop.
+
+    Read methods take fields= — "minimal", "summary", "full" (default), a
+    list of field names or an asks dict. "minimal" and "summary" leave out
+    the message body. See HFFields.
+    """
+
+    async def aget(self, pids: list[int], fields: Fields = None) -> list[dict]:
+        """Async version of get()."""
+        data = await self.read({"posts": {"_pid": pids, **project("posts", fields)}})
         return self._unwrap(data, "posts")
 
-    def get_by_thread(self, tid: int, page: int = 1, perpage: int = 20) -> list[dict]:
-        """Get posts in a thread."""
-        data = self.read_sync({"posts": {
+    def get(self, pids: list[int], fields: Fields = None) -> list[dict]:
+        """Get posts by post ID(s)."""
+        return self._run_sync(self.aget(pids, fields))
+
+    async def aget_by_thread(
+        self, tid: int, page: int = 1, perpage: int = 20, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_by_thread()."""
+        data = await self.read({"posts": {
             "_tid": [tid], "_page": page, "_perpage": perpage,
-            **_FIELDS,
+            **project("posts", fields),
         }})
         return self._unwrap(data, "posts")
 
-    def get_by_user(self, uid: int, page: int = 1, perpage: int = 20) -> list[dict]:
-        """Get a user's recent posts."""
-        data = self.read_sync({"posts": {
+    def get_by_thread(
+        self, tid: int, page: int = 1, perpage: int = 20, fields: Fields = None
+    ) -> list[dict]:
+        """Get posts in a thread."""
+        return self._run_sync(self.aget_by_thread(tid, page, perpage, fields))
+
+    async def aget_by_user(
+        self, uid: int, page: int = 1, perpage: int = 20, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_by_user()."""
+        data = await self.read({"posts": {
             "_uid": [uid], "_page": page, "_perpage": perpage,
-            **_FIELDS,
+            **project("posts", fields),
         }})
         return self._unwrap(data, "posts")
 
+    def get_by_user(
+        self, uid: int, page: int = 1, perpage: int = 20, fields: Fields = None
+    ) -> list[dict]:
+        """Get a user's recent posts."""
+        return self._run_sync(self.aget_by_user(uid, page, perpage, fields))
+
     def get_last_page(self, tid: int, numreplies: int, perpage: int = 10) -> int:
         """Calculate the last page number of a thread."""
         return max(1, (numreplies + 1 + perpage - 1) // perpage)
 
-    def reply(self, tid: int, message: str) -> dict | None:
-        """Post a reply to a thread. Requires 'Posts Write' scope."""
-        data = self.write_sync({"posts": {"_tid": tid, "_message": message}})
+    @staticmethod
+    def reply_asks(tid: int, message: str) -> dict:
+        """Build the asks for reply()."""
+        return {"posts": {"_tid": tid, "_message": message}}
+
+    async def areply(self, tid: int, message: str, idempotency_key: str | None = None) -> dict | None:
+        """Async version of reply()."""
+        data = await self.write(self.reply_asks(tid, message), idempotency_key)
         rows = self._unwrap(data, "posts")
         return rows[0] if rows else None
 
+    def reply(self, tid: int, message: str, idempotency_key: str | None = None) -> dict | None:
+        """
+        Post a reply to a thread. Requires 'Posts Write' scope.
+
+        With an idempotency_key the reply is retried if a failure means it
+        never reached HF, and a repeat call with the key returns the first
+        response. A timeout still returns None — it may have been posted.
+        HFOutbox.reply() queues it durably and checks.
+        """
+        return self._run_sync(self.areply(tid, message, idempotency_key))
+
+    async def aget_all_by_user(
+        self, uid: int, perpage: int = 20, max_pages: int = 50, stop_at_pid: int = 0,
+        fields: Fields = None,
+    ) -> list[dict]:
+        """Async version of get_all_by_user()."""
+        from HFPaginator import HFPaginator
+        return await HFPaginator.aget_all_posts_by_user(self, uid, perpage, max_pages, stop_at_pid, fields)
+
     def get_all_by_user(
-        self, uid: int, perpage: int = 20, max_pages: int = 50, stop_at_pid: int = 0
+        self, uid: int, perpage: int = 20, max_pages: int = 50, stop_at_pid: int = 0,
+        fields: Fields = None,
     ) -> list[dict]:
         """Get ALL posts by a user, automatically paginating."""
+        return self._run_sync(self.aget_all_by_user(uid, perpage, max_pages, stop_at_pid, fields))
+
+    async def aget_all_by_thread(
+        self, tid: int, perpage: int = 20, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_all_by_thread()."""
         from HFPaginator import HFPaginator
-        return HFPaginator.get_all_posts_by_user(self, uid, perpage, max_pages, stop_at_pid)
+        return await HFPaginator.aget_all_posts_by_thread(self, tid, perpage, max_pages, fields)
 
-    def get_all_by_thread(self, tid: int, perpage: int = 20, max_pages: int = 50) -> list[dict]:
+    def get_all_by_thread(
+        self, tid: int, perpage: int = 20, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
         """Get ALL posts in a thread, automatically paginating."""
-        from HFPaginator import HFPaginator
-        return HFPaginator.get_all_posts_by_thread(self, tid, perpage, max_pages)
+        return self._run_sync(self.aget_all_by_thread(tid, perpage, max_pages, fields))
@@ -0,0 +1,177 @@
+"""
+HFQuery — prepared /read queries with a pre-serialized asks template.
+
+Hot pollers (HFWatcher thread and forum polls, HFThreads.poll_lastpost)
+send the same asks dict over and over with only the id list or page
+changing. Every call used to rebuild the dict and JSON-encode it twice: once
+for the single-flight key and once for the request body.
+
+An HFQuery is declared once with its resource, fields and parameter slots.
+The fixed part is encoded to a JSON template up front; bind() only encodes
+the slot values and splices them in. The result is a PreparedAsks, a dict
+that any read() accepts and that carries its own wire and canonical JSON,
+so HFClient doesn't encode it again. Coalesced batches made only of
+prepared asks are joined from those fragments as well.
+
+Usage:
+    from HFQuery import HFQuery
+
+    THREAD_POLL = HFQuery("threads", ["tid", "lastpost", "numreplies"], params=("_tid",))
+
+    data = await hf.read(THREAD_POLL.bind(_tid=[6083735, 6084000]))
+
+    # Fixed parameters are given at declaration time:
+    NEWEST = HFQuery("posts", "minimal", params=("_tid", "_page"), _perpage=10)
+    data = await hf.read(NEWEST.bind(_tid=[tid], _page=last_page))
+
+Treat a PreparedAsks as read-only: it is sent as it was encoded at bind().
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import HFCodec
+from HFFields import Fields, project
+
+# Stand-in value for a slot while the template is encoded
+_PLACEHOLDER = "__hfquery_slot_{}__"
+
+
+class PreparedAsks(dict):
+    """
+    An asks dict with its JSON already encoded, one fragment per resource
+    ('"threads":{...}' with sorted keys). Built by HFQuery.bind().
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, asks: dict, parts: dict[str, str]):
+        super().__init__(asks)
+        self._parts = parts
+
+    @property
+    def json(self) -> str:
+        """Request body for the asks form field."""
+        return "{" + ",".join(self._parts.values()) + "}"
+
+    @property
+    def canonical(self) -> str:
+        """Same string HFCodec.canonical() gives for the equivalent dict."""
+        return "{" + ",".join(self._parts[k] for k in sorted(self._parts)) + "}"
+
+    @classmethod
+    def merge(cls, asks_list: list[PreparedAsks]) -> PreparedAsks:
+        """Union of several prepared asks with distinct resource keys."""
+        merged: dict = {}
+        parts:  dict[str, str] = {}
+        for asks in asks_list:
+            merged.update(asks)
+            parts.update(asks._parts)
+        return cls(merged, parts)
+
+
+def encode_asks(asks: dict) -> str:
+    """JSON for the asks form field, reusing a prepared encoding if there is one."""
+    if isinstance(asks, PreparedAsks):
+        return asks.json
+    return HFCodec.dumps(asks)
+
+
+def canonical_asks(asks: dict) -> str:
+    """Stable string form of an asks dict — equal asks give equal strings."""
+    if isinstance(asks, PreparedAsks):
+        return asks.canonical
+    return HFCodec.canonical(asks)
+
+
+class HFQuery:
+    """
+    A prepared read of one resource.
+
+    Args:
+        resource: Top-level asks key ("threads", "posts", ...).
+        fields:   Field profile name, list of field names or asks dict
+                  (see HFFields). Default "full".
+        params:   Names of the parameters given per call to bind(), e.g.
+                  ("_tid",) or ("_uid", "_page").
+        **fixed:  Parameters that never change, e.g. _perpage=20.
+    """
+
+    __slots__ = ("resource", "params", "_ask", "_codec", "_chunks", "_order")
+
+    def __init__(
+        self,
+        resource: str,
+        fields: Fields = None,
+        params: tuple[str, ...] = (),
+        **fixed: Any,
+    ):
+        for name in (*params, *fixed):
+            if not name.startswith("_"):
+                raise ValueError(f"HFQuery parameter '{name}' must start with '_'")
+        overlap = set(params) & set(fixed)
+        if overlap:
+            raise ValueError(f"HFQuery parameters both fixed and bound: {', '.join(sorted(overlap))}")
+
+        self.resource = resource
+        self.params   = tuple(params)
+        self._ask     = {**project(resource, fields), **fixed}
+        self._codec   = None
+        self._chunks: tuple[str, ...] = ()
+        self._order:  tuple[str, ...] = ()
+
+    def _template(self) -> tuple[str, ...]:
+        """
+        The resource fragment split around its slots: chunk, value of
+        _order[0], chunk, value of _order[1], ... chunk. Slots appear in
+        sorted-key order, not declaration order. Re-encoded if the codec
+        was switched.
+        """
+        codec = HFCodec.get_codec()
+        if codec is not self._codec:
+            ask = dict(self._ask)
+            for name in self.params:
+                ask[name] = _PLACEHOLDER.format(name)
+            text = codec.canonical({self.resource: ask})[1:-1]   # drop the outer braces
+            markers = sorted(
+                (text.index(codec.canonical(_PLACEHOLDER.format(name))), name)
+                for name in self.params
+            )
+            chunks = []
+            for _, name in markers:
+                before, text = text.split(codec.canonical(_PLACEHOLDER.format(name)), 1)
+                chunks.append(before)
+            chunks.append(text)
+            self._codec  = codec
+            self._chunks = tuple(chunks)
+            self._order  = tuple(name for _, name in markers)
+        return self._chunks
+
+    def bind(self, **values: Any) -> PreparedAsks:
+        """
+        Fill in every parameter slot and return asks ready for read().
+        Raises ValueError for a missing or undeclared parameter.
+        """
+        if values.keys() != set(self.params):
+            missing = set(self.params) - values.keys()
+            extra   = values.keys() - set(self.params)
+            raise ValueError(
+                f"HFQuery({self.resource}).bind(): "
+                + "; ".join(filter(None, [
+                    f"missing {', '.join(sorted(missing))}" if missing else "",
+                    f"undeclared {', '.join(sorted(extra))}" if extra else "",
+                ]))
+            )
+        chunks = self._template()
+        codec  = self._codec
+        out    = [chunks[0]]
+        for i, name in enumerate(self._order):
+            out.append(codec.canonical(values[name]))
+            out.append(chunks[i + 1])
+        ask = dict(self._ask)
+        ask.update(values)
+        return PreparedAsks({self.resource: ask}, {self.resource: "".join(out)})
+
+    def __repr__(self) -> str:
+        return f"HFQuery({self.resource!r}, params={self.params})"
@@ -0,0 +1,404 @@
+"""
+HFRateLimiter — proactive per-token pacing for the HF hourly call budget.
+
+HF gives each token a rolling hourly call budget and reports what's left in
+the x-rate-limit-remaining header on every response. Instead of waiting for
+MAX_HOURLY_CALLS_EXCEEDED and then blocking the token for 10 minutes,
+HFClient runs every request through a TokenBucket for its token:
+
+    - The bucket refills at remaining / 3600 calls per second, so whatever
+      budget is left is spread evenly over the next hour. A fresh header
+      value re-derives the rate on every response.
+    - Up to BURST calls can go out back-to-back when the bucket is full.
+    - Until the first header is seen the bucket is unpaced.
+    - Requests that can't go yet wait in a queue instead of being dropped.
+
+Priority lanes:
+    Waiting requests are released in lane order. While anything is waiting
+    in a higher lane, lower lanes hold back.
+
+        PRIORITY_INTERACTIVE  — server handlers, CLI commands
+        PRIORITY_NORMAL       — default for direct HFClient use
+        PRIORITY_BACKGROUND   — HFWatcher polls, HFPaginator page walks
+
+    The lane comes from the request_priority() context (set by HFWatcher,
+    HFPaginator, server.py and the CLI) or, if unset, from HFClient's
+    priority argument.
+
+    Each lane has a maximum queue wait (LANE_MAX_WAIT). An interactive
+    request that can't be served within 30 s gives up and returns None
+    rather than hanging a web request; background requests wait as long as
+    it takes.
+
+Shared across processes:
+    A token's bucket state lives in the HFRateState backend (a SQLite file
+    by default), so every process using the token paces against one budget
+    and honours one block. Lanes are per process — waiting requests in
+    another process don't hold this one's lower lanes back.
+
+Usage:
+    from HFRateLimiter import request_priority, PRIORITY_BACKGROUND
+
+    with request_priority(PRIORITY_BACKGROUND):
+        rows = await posts.aget_all_by_user(uid)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from HFRateState import MemoryRateState, get_rate_state
+
+log = logging.getLogger("hfapi.ratelimiter")
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL      = 1
+PRIORITY_BACKGROUND  = 2
+
+_LANES = (PRIORITY_INTERACTIVE, PRIORITY_NORMAL, PRIORITY_BACKGROUND)
+
+# Longest a request waits for a slot before giving up. None = no limit.
+LANE_MAX_WAIT: dict[int, float | None] = {
+    PRIORITY_INTERACTIVE: 30.0,
+    PRIORITY_NORMAL:      300.0,
+    PRIORITY_BACKGROUND:  None,
+}
+
+WINDOW = 3600          # HF's budget window in seconds
+BURST  = 10            # calls that may go out back-to-back on a full bucket
+
+# With zero calls left there's no header to tell us when budget frees up,
+# so allow one probe call this long after the last update.
+_PROBE_AFTER = 600
+
+# Upper bound on a single sleep so waiters notice lane changes and blocks lifting
+_MAX_SLEEP = 1.0
+
+# Sleep used while yielding to a higher-priority lane
+_YIELD_SLEEP = 0.05
+
+# Age after which a read on the event loop refreshes its copy of the shared state
+_SNAPSHOT_MAX_AGE = 1.0
+
+
+# ── Request priority context ───────────────────────────────────────────────────
+
+_priority: contextvars.ContextVar[int | None] = contextvars.ContextVar("hfapi_priority", default=None)
+
+
+def get_request_priority() -> int | None:
+    """Return the lane set for the current context, or None if unset."""
+    return _priority.get()
+
+
+def set_request_priority(priority: int) -> None:
+    """
+    Set the lane for the rest of the current context (thread or task).
+    Used where there is no natural block to wrap, e.g. a Flask before_request.
+    """
+    _priority.set(priority)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """Run HF API calls made inside the block in the given lane."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+# ── Token bucket ───────────────────────────────────────────────────────────────
+
+class TokenBucket:
+    """
+    Paces calls for one OAuth token. Thread-safe; acquire() may be awaited
+    from any event loop.
+
+    With a token, the pacing state (remaining budget, refill rate, tokens,
+    hard-limit block) is kept in the shared HFRateState backend, so every
+    process using that token draws from one bucket. Without one the state
+    is private to this object. Priority lanes are always per process.
+
+    Nothing on the event loop waits for a blocking backend: acquire() and
+    the a* updates run their transactions in a worker thread, and the
+    read-only checks (is_blocked, remaining, stats) answer from the copy of
+    the state this process last saw, refreshed in the background once it
+    is older than _SNAPSHOT_MAX_AGE. Called off the loop, they read through.
+    """
+
+    def __init__(self, window: float = WINDOW, burst: int = BURST, token: str | None = None):
+        self._window  = window
+        self._burst   = burst
+        self._token   = token
+        self._private = MemoryRateState() if token is None else None
+        self._lock    = threading.Lock()
+        self._waiting = {lane: 0 for lane in _LANES}
+        # (backend, monotonic time, state) as of the last transaction or read
+        self._snapshot: tuple = (None, 0.0, {})
+        self._refreshing = False
+
+    # ── Shared state ───────────────────────────────────────────────────────────
+    # remaining      header value minus calls made since (None = never seen)
+    # rate           tokens per second (None = unpaced)
+    # capacity, tokens, refilled
+    # updated        wall time of the last header update
+    # blocked_until  wall time a hard limit hit holds every lane until
+    # blocked_since  wall time of that hit
+
+    def _transact(self, fn):
+        if self._private is not None:
+            return self._private.transact("", fn)
+        backend = get_rate_state()
+
+        def _run(s: dict):
+            result = fn(s)
+            self._snapshot = (backend, time.monotonic(), dict(s))
+            return result
+
+        return backend.transact(self._token, _run)
+
+    async def _atransact(self, fn):
+        """
+        _transact() for the event loop. A backend that can wait on another
+        process's lock (SQLite, Redis, ...) is called from a worker thread so
+        the loop keeps serving other requests meanwhile.
+        """
+        if self._private is not None or not getattr(get_rate_state(), "blocking", True):
+            return self._transact(fn)
+        return await asyncio.to_thread(self._transact, fn)
+
+    def _get(self) -> dict:
+        """A copy of the state to read. See the class docstring."""
+        if self._private is not None:
+            return self._private.get("") or {}
+        backend = get_rate_state()
+        if not getattr(backend, "blocking", True):
+            return backend.get(self._token) or {}
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._read(backend)
+        seen_on, at, state = self._snapshot
+        if seen_on is not backend or time.monotonic() - at > _SNAPSHOT_MAX_AGE:
+            self._refresh_soon(loop, backend)
+        return dict(state) if seen_on is backend else {}
+
+    def _read(self, backend) -> dict:
+        state = backend.get(self._token) or {}
+        self._snapshot = (backend, time.monotonic(), dict(state))
+        return state
+
+    def _refresh_soon(self, loop: asyncio.AbstractEventLoop, backend) -> None:
+        if self._refreshing:
+            return
+        self._refreshing = True
+
+        async def _refresh():
+            try:
+                await asyncio.to_thread(self._read, backend)
+            except Exception as e:
+                log.debug(f"Rate limit state refresh failed: {e}")
+            finally:
+                self._refreshing = False
+
+        task = loop.create_task(_refresh())
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+
+    def _fill(self, s: dict, now: float) -> dict:
+        if "tokens" not in s:
+            s.update(
+                remaining=None, rate=None, capacity=self._burst, tokens=self._burst,
+                refilled=now, updated=0.0, blocked_until=0.0, blocked_since=0.0,
+            )
+        return s
+
+    @staticmethod
+    def _refill(s: dict, now: float) -> None:
+        if s["rate"]:
+            s["tokens"] = min(s["capacity"], s["tokens"] + (now - s["refilled"]) * s["rate"])
+        s["refilled"] = now
+
+    # ── Feedback from responses ────────────────────────────────────────────────
+
+    def update(self, remaining: int) -> None:
+        """Re-derive the pace from a fresh x-rate-limit-remaining value."""
+        self._transact(self._updater(remaining))
+
+    async def aupdate(self, remaining: int) -> None:
+        """update() without blocking the event loop."""
+        await self._atransact(self._updater(remaining))
+
+    def _updater(self, remaining: int):
+        remaining = max(remaining, 0)
+
+        def _update(s: dict) -> None:
+            now = time.time()
+            self._refill(self._fill(s, now), now)
+            s["remaining"] = remaining
+            s["rate"]      = remaining / self._window
+            s["capacity"]  = max(1, min(self._burst, remaining))
+            s["tokens"]    = min(s["tokens"], s["capacity"], remaining)
+            s["updated"]   = now
+
+        return _update
+
+    def block_until(self, resume_at: float) -> None:
+        """Hold every lane until the given unix timestamp (hard limit hit)."""
+        self._transact(self._blocker(resume_at))
+
+    async def ablock_until(self, resume_at: float) -> None:
+        """block_until() without blocking the event loop."""
+        await self._atransact(self._blocker(resume_at))
+
+    def _blocker(self, resume_at: float):
+        def _block(s: dict) -> None:
+            now = time.time()
+            self._fill(s, now)
+            if s["blocked_until"] <= now:
+                s["blocked_since"] = now
+            s["blocked_until"] = max(s["blocked_until"], resume_at)
+            s["tokens"] = 0
+
+        return _block
+
+    def is_blocked(self, max_age: float | None = None) -> bool:
+        """
+        True while a hard-limit block holds — until it runs out, or max_age
+        seconds after it was set. Read-only: acquire() ignores a block that
+        has run out, so nothing needs clearing.
+        """
+        s     = self._get()
+        now   = time.time()
+        until = s.get("blocked_until") or 0.0
+        since = s.get("blocked_since") or 0.0
+        if until <= now:
+            return False
+        return max_age is None or not since or now - since <= max_age
+
+    def remaining(self, max_age: float | None = None) -> int | None:
+        """
+        Calls left in the window as of the last header, minus calls made
+        since by any process sharing the token. None if unknown, or if the
+        last header is more than max_age seconds old.
+        """
+        s = self._get()
+        if s.get("remaining") is None:
+            return None
+        if max_age is not None and time.time() - s["updated"] > max_age:
+            return None
+        return s["remaining"]
+
+    def clear(self) -> None:
+        """Forget all pacing state, e.g. after the hourly window has reset."""
+        def _clear(s: dict) -> None:
+            s.clear()
+            self._fill(s, time.time())
+
+        self._transact(_clear)
+
+    # ── Acquire ────────────────────────────────────────────────────────────────
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL, max_wait: float | None = None) -> bool:
+        """
+        Wait for permission to make one call.
+
+        Returns True once a slot is granted, or False if it can't be granted
+        within max_wait seconds (the request should then be abandoned).
+        """
+        deadline   = None if max_wait is None else time.monotonic() + max_wait
+        registered = False
+        try:
+            while True:
+                wait = await self._atransact(lambda s: self._try_take(s, priority))
+                if wait <= 0:
+                    return True
+                if not registered:
+                    with self._lock:
+                        self._waiting[priority] += 1
+                    registered = True
+
+                if deadline is not None:
+                    left = deadline - time.monotonic()
+                    if wait > left:
+                        return False
+                await asyncio.sleep(min(wait, _MAX_SLEEP))
+        finally:
+            if registered:
+                with self._lock:
+                    self._waiting[priority] -= 1
+
+    def _try_take(self, s: dict, priority: int) -> float:
+        """Take a token if allowed. Returns 0 on success, else seconds to wait."""
+        now = time.time()
+        self._fill(s, now)
+        blocked = s["blocked_until"] - now
+        if blocked > 0:
+            return blocked
+
+        if any(self._waiting[lane] for lane in _LANES if lane < priority):
+            return _YIELD_SLEEP
+
+        rate = s["rate"]
+        if rate is None:
+            return 0
+
+        if rate == 0:
+            probe_at = s["updated"] + _PROBE_AFTER
+            if now < probe_at:
+                return probe_at - now
+            s["updated"] = now
+            return 0
+
+        self._refill(s, now)
+        if s["tokens"] >= 1:
+            s["tokens"] -= 1
+            if s["remaining"]:
+                s["remaining"] -= 1
+            return 0
+        return (1 - s["tokens"]) / rate
+
+    # ── Stats ──────────────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        now = time.time()
+        s   = self._fill(self._get(), now)
+        self._refill(s, now)
+        with self._lock:
+            waiting = dict(self._waiting)
+        return {
+            "remaining":       s["remaining"],
+            "calls_per_min":   round(s["rate"] * 60, 2) if s["rate"] is not None else None,
+            "tokens":          round(s["tokens"], 2),
+            "blocked_for":     max(0, round(s["blocked_until"] - now)),
+            "waiting":         waiting,
+        }
+
+    def __repr__(self) -> str:
+        s = self._get()
+        return f"TokenBucket(remaining={s.get('remaining')}, rate={s.get('rate')})"
+
+
+# ── Per-token registry ─────────────────────────────────────────────────────────
+
+# Strong references to background state refreshes so they aren't garbage collected
+_refresh_tasks: set[asyncio.Task] = set()
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(token: str) -> TokenBucket:
+    """Return the process-wide bucket for a token, creating it on first use."""
+    bucket = _buckets.get(token)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.setdefault(token, TokenBucket(token=token))
+    return bucket
@@ -0,0 +1,253 @@
+"""
+HFRateState — per-token rate limit state shared by every process on a host.
+
+HF counts the hourly budget per token, not per process. The rate limit
+state (the last x-rate-limit-remaining value, the 10-minute block after
+MAX_HOURLY_CALLS_EXCEEDED, the token bucket pacing calls across the hour)
+used to live in module-level dicts. gunicorn workers, CLI invocations and a
+watcher sharing one token each believed they had the whole budget, paced
+themselves as if alone and hit the limit together.
+
+That state now lives in a backend all of them can see. The default is a
+SQLite file (WAL mode): every change is one short write transaction, so
+processes pace against one shared bucket and see each other's blocks at
+once.
+
+    HF_RATE_STATE unset      ~/.cache/hfapi/ratelimit.db (XDG_CACHE_HOME honoured)
+    HF_RATE_STATE=/path.db   that SQLite file, on a local disk
+    HF_RATE_STATE=memory     process-local, the old behaviour
+
+If the SQLite file can't be opened the process falls back to memory with a
+warning. The file is for processes on one host: WAL mode relies on shared
+memory and file locks that network filesystems (NFS, SMB) don't provide, so
+don't put it on a shared volume. Workers on several hosts need a networked
+backend such as Redis (see Pluggable).
+
+HFClient runs the SQLite transactions from a worker thread and reads a
+per-process copy of the state on the event loop, so a loop never stalls
+while another process holds the file's write lock.
+
+Pluggable:
+    from HFRateState import set_rate_state, SQLiteRateState
+
+    set_rate_state(SQLiteRateState("/run/hfapi/ratelimit.db"))
+
+    Any object with transact(token, fn), get(token) and clear(token=None)
+    works — e.g. a Redis backend doing transact() in a WATCH/MULTI loop to
+    share one budget across hosts. Set blocking = False on a backend that
+    never waits (it is then called on the event loop directly).
+    set_rate_state() switches the backend for the whole process, like
+    HFCodec.set_codec(); use_rate_state() does it for a block.
+
+State per token is a small dict owned by HFRateLimiter.TokenBucket
+(remaining, rate, tokens, blocked_until, ...; wall-clock timestamps so
+processes agree on them). Tokens are stored as a SHA-256 prefix, never in
+the clear. Priority lanes stay per process: a background watcher in one
+process doesn't yield to an interactive request in another.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Protocol, TypeVar
+
+import HFCodec
+
+log = logging.getLogger("hfapi.ratestate")
+
+T = TypeVar("T")
+
+# Rows not touched for this long are dropped when a store is opened
+_STALE_AFTER = 24 * 3600
+
+
+def state_key(token: str) -> str:
+    """Storage key for a token — a SHA-256 prefix, so no store holds the token itself."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+
+
+class RateStateBackend(Protocol):
+    name: str
+    blocking: bool   # transact() may wait on I/O or another process; assumed True if missing
+
+    def transact(self, token: str, fn: Callable[[dict], T]) -> T:
+        """
+        Run fn on the token's state dict ({} the first time) atomically with
+        respect to every other transact() on the same token, in any process
+        sharing the backend, and persist what fn changed. Returns fn's result.
+        """
+
+    def get(self, token: str) -> dict | None:
+        """A copy of the token's state, or None if it has none."""
+
+    def clear(self, token: str | None = None) -> None:
+        """Forget one token's state, or every token's."""
+
+
+# ── Backends ───────────────────────────────────────────────────────────────────
+
+class MemoryRateState:
+    """State in this process only."""
+
+    name     = "memory"
+    blocking = False
+
+    def __init__(self):
+        self._lock   = threading.Lock()
+        self._states: dict[str, dict] = {}
+
+    def transact(self, token: str, fn: Callable[[dict], T]) -> T:
+        with self._lock:
+            return fn(self._states.setdefault(state_key(token), {}))
+
+    def get(self, token: str) -> dict | None:
+        with self._lock:
+            state = self._states.get(state_key(token))
+            return dict(state) if state is not None else None
+
+    def clear(self, token: str | None = None) -> None:
+        with self._lock:
+            if token is None:
+                self._states.clear()
+            else:
+                self._states.pop(state_key(token), None)
+
+    def __repr__(self) -> str:
+        return f"MemoryRateState(tokens={len(self._states)})"
+
+
+class SQLiteRateState:
+    """
+    State in a SQLite file shared by every process that opens it.
+
+    transact() runs in a BEGIN IMMEDIATE transaction, which holds the
+    file's write lock for the few statements it takes; other processes
+    wait for it (up to busy_timeout seconds) instead of failing.
+    """
+
+    name     = "sqlite"
+    blocking = True
+
+    def __init__(self, path: str | Path, busy_timeout: float = 5.0):
+        self.path  = Path(path)
+        self._lock = threading.Lock()
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(path),
+            timeout=busy_timeout,
+            isolation_level=None,      # explicit BEGIN/COMMIT below
+            check_same_thread=False,   # guarded by self._lock
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_state (
+                key     TEXT PRIMARY KEY,
+                state   TEXT NOT NULL,
+                updated REAL NOT NULL
+            )
+        """)
+        self._conn.execute("DELETE FROM rate_state WHERE updated < ?", (time.time() - _STALE_AFTER,))
+
+    def transact(self, token: str, fn: Callable[[dict], T]) -> T:
+        key = state_key(token)
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row    = conn.execute("SELECT state FROM rate_state WHERE key=?", (key,)).fetchone()
+                state  = HFCodec.loads(row[0]) if row else {}
+                before = dict(state)
+                result = fn(state)
+                if state != before:
+                    conn.execute(
+                        "INSERT INTO rate_state (key, state, updated) VALUES (?,?,?) "
+                        "ON CONFLICT(key) DO UPDATE SET state=excluded.state, updated=excluded.updated",
+                        (key, HFCodec.dumps(state), time.time()),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return result
+
+    def get(self, token: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute("SELECT state FROM rate_state WHERE key=?", (state_key(token),)).fetchone()
+        return HFCodec.loads(row[0]) if row else None
+
+    def clear(self, token: str | None = None) -> None:
+        with self._lock:
+            if token is None:
+                self._conn.execute("DELETE FROM rate_state")
+            else:
+                self._conn.execute("DELETE FROM rate_state WHERE key=?", (state_key(token),))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"SQLiteRateState({str(self.path)!r})"
+
+
+# ── Active backend ─────────────────────────────────────────────────────────────
+
+def default_path() -> Path:
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache) / "hfapi" / "ratelimit.db"
+
+
+def _from_env() -> RateStateBackend:
+    setting = os.environ.get("HF_RATE_STATE", "").strip()
+    if setting.lower() == "memory":
+        return MemoryRateState()
+    path = Path(setting) if setting else default_path()
+    try:
+        return SQLiteRateState(path)
+    except (OSError, sqlite3.Error) as e:
+        log.warning(f"Shared rate limit state unavailable at {path} ({e}) — using process-local state")
+        return MemoryRateState()
+
+
+_backend: RateStateBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_rate_state() -> RateStateBackend:
+    """The active backend, opened from HF_RATE_STATE on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _from_env()
+                log.info(f"HF rate limit state: {_backend!r}")
+    return _backend
+
+
+def set_rate_state(backend: RateStateBackend | None) -> None:
+    """Keep every token's rate limit state in backend. None re-opens the HF_RATE_STATE default."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+    if backend is not None:
+        log.info(f"HF rate limit state: {backend!r}")
+
+
+@contextmanager
+def use_rate_state(backend: RateStateBackend):
+    """Keep rate limit state in backend inside the block."""
+    previous = _backend
+    set_rate_state(backend)
+    try:
+        yield backend
+    finally:
+        set_rate_state(previous)
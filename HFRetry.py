@@ -0,0 +1,81 @@
+"""
+HFRetry — retry policy for transient API failures.
+
+Without retries, one connect error or proxy hiccup makes a read return None
+and callers like HFWatcher sit out a whole poll interval (60–120 s) before
+trying again. HFClient retries such reads according to a RetryPolicy:
+
+    - Exponential backoff with jitter between attempts.
+    - Every attempt, sleep included, fits inside the policy's deadline.
+    - Only idempotent calls are retried: reads always, writes only when
+      called with an idempotency_key — and then only after a proxy/connect
+      error, an open breaker or a budget drop, where nothing reached HF. HF
+      never sees the key, so a keyed write that timed out or got a 5xx is
+      not resent; it may have landed.
+    - Never on 401/403 (retrying won't fix auth or a Cloudflare block), never
+      once the token is rate limited, and never when the request was dropped
+      for lack of rate budget.
+
+Retried:  timeouts, proxy/connect errors, and HTTP 429, 500, 502, 504 and
+          Cloudflare's 520–524. HF answers 503 for missing permissions and for
+          some unsupported queries (disputes by _uid), so 503 is not retried.
+
+Usage:
+    from HFRetry import RetryPolicy, NO_RETRY
+
+    hf = HFClient(token, retry=RetryPolicy(attempts=5, deadline=20))
+
+    # Per resource class:
+    HFPosts.retry_policy = RetryPolicy(attempts=4)
+    HFSigmarket.retry_policy = NO_RETRY
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+# HTTP statuses worth another attempt
+RETRY_STATUSES = frozenset({429, 500, 502, 504, 520, 521, 522, 523, 524})
+
+# Failure kinds reported by HFClient for requests that got no HTTP response
+TRANSPORT_FAILURES = frozenset({"timeout", "proxy", "connect", "error"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Args:
+        attempts:   Total attempts including the first (1 = never retry).
+        base_delay: Backoff before the first retry, in seconds.
+        multiplier: Backoff growth per retry.
+        max_delay:  Upper bound on a single backoff.
+        jitter:     Fraction of each backoff that is randomised (0–1). Keeps
+                    many watchers that failed together from retrying together.
+        deadline:   Seconds from the first attempt after which no further
+                    attempt starts; attempts are also cut short to fit. None
+                    means only the client timeout applies per attempt.
+        statuses:   HTTP statuses that are retried.
+    """
+    attempts:   int   = 3
+    base_delay: float = 0.5
+    multiplier: float = 2.0
+    max_delay:  float = 8.0
+    jitter:     float = 0.5
+    deadline:   float | None = 45.0
+    statuses:   frozenset[int] = field(default=RETRY_STATUSES)
+
+    def backoff(self, retry: int) -> float:
+        """Seconds to sleep before retry number retry (1-based)."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def should_retry(self, result: tuple[int, bytes] | None, failure: str | None) -> bool:
+        """True if a call that ended with this result/failure may be retried."""
+        if failure is not None:
+            return failure in TRANSPORT_FAILURES
+        return result is not None and result[0] in self.statuses
+
+
+DEFAULT_RETRY = RetryPolicy()
+NO_RETRY      = RetryPolicy(attempts=1)
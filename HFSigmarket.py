@@ -27,16 +27,20 @@ _ORDER_FIELDS = {
 
 
 class HFSigmarket(HFClient):
-    """Read sigmarket listings and orders (/read/sigmarket endpoint)."""
+    """
+    Read sigmarket listings and orders (/read/sigmarket endpoint).
 
-    def get_listings(
+    Every method has an async twin prefixed with "a" (aget_listings, ...).
+    """
+
+    async def aget_listings(
         self,
         uid: int = 0,
         page: int = 1,
         perpage: int = 20,
         include_user: bool = False,
     ) -> list[dict]:
-        """Get available signature market listings (type=market)."""
+        """Async version of get_listings()."""
         ask: dict = {
             "_type":    "market",
             "_page":    page,       # BUG FIX: was [page] (list), must be plain int
@@ -55,10 +59,20 @@ class HFSigmarket(HFClient):
             }
         # BUG FIX: was self.read_sync(ask) — missing {"sigmarket": ...} wrapper.
         # The API expects the resource name as the top-level key.
-        data = self.read_sync({"sigmarket": ask})
+        data = await self.read({"sigmarket": ask})
         return self._unwrap(data, "sigmarket")
 
-    def get_orders(
+    def get_listings(
+        self,
+        uid: int = 0,
+        page: int = 1,
+        perpage: int = 20,
+        include_user: bool = False,
+    ) -> list[dict]:
+        """Get available signature market listings (type=market)."""
+        return self._run_sync(self.aget_listings(uid, page, perpage, include_user))
+
+    async def aget_orders(
         self,
         buyer_uid: int = 0,
         seller_uid: int = 0,
@@ -67,7 +81,7 @@ class HFSigmarket(HFClient):
         perpage: int = 20,
         include_users: bool = False,
     ) -> list[dict]:
-        """Get signature market orders (type=order)."""
+        """Async version of get_orders()."""
         ask: dict = {
             "_type":    "order",
             "_page":    page,       # BUG FIX: was [page]
@@ -82,20 +96,32 @@ class HFSigmarket(HFClient):
             ask["buyer"]  = user_fields
             ask["seller"] = user_fields
         # BUG FIX: was self.read_sync(ask) — missing {"sigmarket": ...} wrapper.
-        data = self.read_sync({"sigmarket": ask})
+        data = await self.read({"sigmarket": ask})
         return self._unwrap(data, "sigmarket")
 
-    def get_all_listings(
+    def get_orders(
+        self,
+        buyer_uid: int = 0,
+        seller_uid: int = 0,
+        smid: int = 0,
+        page: int = 1,
+        perpage: int = 20,
+        include_users: bool = False,
+    ) -> list[dict]:
+        """Get signature market orders (type=order)."""
+        return self._run_sync(self.aget_orders(buyer_uid, seller_uid, smid, page, perpage, include_users))
+
+    async def aget_all_listings(
         self,
         uid: int = 0,
         perpage: int = 20,
         max_pages: int = 50,
         active_only: bool = False,
     ) -> list[dict]:
-        """Get all sigmarket listings, automatically paginating."""
+        """Async version of get_all_listings()."""
         from HFPaginator import HFPaginator
-        results = HFPaginator._paginate(
-            fetch_fn=lambda page: self.get_listings(uid=uid, page=page, perpage=perpage),
+        results = await HFPaginator._apaginate(
+            fetch_fn=lambda page: self.aget_listings(uid=uid, page=page, perpage=perpage),
             max_pages=max_pages,
             perpage=perpage,   # BUG FIX: was missing — paginator defaulted to 20,
                                # breaking partial-page detection when perpage != 20
@@ -104,7 +130,17 @@ class HFSigmarket(HFClient):
             return [r for r in results if str(r.get("active", "0")) == "1"]
         return results
 
-    def get_all_orders(
+    def get_all_listings(
+        self,
+        uid: int = 0,
+        perpage: int = 20,
+        max_pages: int = 50,
+        active_only: bool = False,
+    ) -> list[dict]:
+        """Get all sigmarket listings, automatically paginating."""
+        return self._run_sync(self.aget_all_listings(uid, perpage, max_pages, active_only))
+
+    async def aget_all_orders(
         self,
         buyer_uid: int = 0,
         seller_uid: int = 0,
@@ -112,10 +148,10 @@ class HFSigmarket(HFClient):
         max_pages: int = 50,
         active_only: bool = False,
     ) -> list[dict]:
-        """Get all sigmarket orders, automatically paginating."""
+        """Async version of get_all_orders()."""
         from HFPaginator import HFPaginator
-        results = HFPaginator._paginate(
-            fetch_fn=lambda page: self.get_orders(
+        results = await HFPaginator._apaginate(
+            fetch_fn=lambda page: self.aget_orders(
                 buyer_uid=buyer_uid, seller_uid=seller_uid, page=page, perpage=perpage
             ),
             max_pages=max_pages,
@@ -125,7 +161,22 @@ class HFSigmarket(HFClient):
             return [r for r in results if str(r.get("active", "0")) == "1"]
         return results
 
+    def get_all_orders(
+        self,
+        buyer_uid: int = 0,
+        seller_uid: int = 0,
+        perpage: int = 20,
+        max_pages: int = 50,
+        active_only: bool = False,
+    ) -> list[dict]:
+        """Get all sigmarket orders, automatically paginating."""
+        return self._run_sync(self.aget_all_orders(buyer_uid, seller_uid, perpage, max_pages, active_only))
+
+    async def aget_order(self, smid: int, include_users: bool = False) -> dict | None:
+        """Async version of get_order()."""
+        rows = await self.aget_orders(smid=smid, include_users=include_users)
+        return rows[0] if rows else None
+
     def get_order(self, smid: int, include_users: bool = False) -> dict | None:
         """Get a single sigmarket order by order ID."""
-        rows = self.get_orders(smid=smid, include_users=include_users)
-        return rows[0] if rows else None
+        return self._run_sync(self.aget_order(smid, include_users))
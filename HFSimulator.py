@@ -0,0 +1,883 @@
+"""
+HFSimulator — a local stand-in for the HackForums API v2, for load tests.
+
+Serves /api/v2/read and /api/v2/write over plain HTTP from an in-memory
+synthetic forum, so watcher scaling, pagination and rate-limit behaviour
+can be exercised without spending real quota. No dependencies beyond the
+standard library.
+
+What it implements:
+    - The asks grammar the wrapper sends: _uid, _tid, _fid, _pid, _cid,
+      _crid, _cdid, _id, _to, _from, _claimantuid, _defendantuid, _page,
+      _perpage, several resources in one /read, field projection and the
+      nested objects the wrapper asks for (posts.author, threads.firstpost,
+      bytes.from/to/post, contracts.inituser/otheruser/escrow/thread,
+      bratings.from/to/contract).
+    - Writes: posts reply, threads create, bytes send/deposit/withdraw/bump.
+    - A rolling hourly call limit per token. Every response carries
+      x-rate-limit-remaining; past the limit the body is
+      MAX_HOURLY_CALLS_EXCEEDED.
+    - HF's batch quirks: users past the first 20 ids and threads past the
+      first 30 are silently dropped, and one unknown (private or deleted)
+      tid empties a threads lookup. Disputes by _uid answer a 503.
+    - Fault injection: fixed + random latency, occasional slow responses,
+      Cloudflare-style 403s and 503s (see SimFaults). All adjustable while
+      running.
+
+Usage:
+    from HFSimulator import HFSimulator
+
+    sim = HFSimulator(hourly_limit=240, seed=1)
+    sim.start()                                   # background thread
+    hf  = HFClient("sim-token", base_url=sim.base_url)
+    ...
+    sim.faults.error_503 = 0.05                   # 5% of calls now fail
+    print(sim.stats())
+    sim.stop()
+
+    # Inside a running event loop:
+    async with HFSimulator(port=8765) as sim:
+        ...
+
+    # Stand-alone, then point everything at it:
+    hf sim serve --port 8765 --threads 2000 --posts 50000
+    HF_API_BASE=http://127.0.0.1:8765/api/v2 hf me
+
+Tokens: any bearer token is accepted and acts as user 1 unless mapped with
+sim.dataset.add_token(token, uid). A request without one gets a 401.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Callable
+from urllib.parse import parse_qs
+
+import HFCodec
+
+log = logging.getLogger("hfapi.simulator")
+
+DEFAULT_HOURLY_LIMIT = 240
+DEFAULT_PERPAGE      = 20
+MAX_PERPAGE          = 30
+
+# Pending-connection queue of the listening socket; load tests open hundreds at once
+_BACKLOG = 1024
+
+# Most ids HF answers in one lookup; the rest are silently dropped
+ID_LIMITS: dict[str, int] = {"users": 20, "threads": 30}
+
+# Fields only the token owner's "me" row has
+_ME_ONLY = frozenset({"vault", "lastvisit", "lastactive", "unreadpms", "invisible",
+                      "totalpms", "warningpoints"})
+
+RATE_LIMIT_BODY = b'{"success":false,"message":"MAX_HOURLY_CALLS_EXCEEDED"}'
+
+_CLOUDFLARE_403 = (
+    b"<!DOCTYPE html><html><head><title>Attention Required! | Cloudflare</title></head>"
+    b"<body>Sorry, you have been blocked</body></html>"
+)
+
+_CLOUDFLARE_503 = (
+    b"<!DOCTYPE html><html><head><title>hackforums.net | 503: Service unavailable</title></head>"
+    b"<body>The origin web server is not available</body></html>"
+)
+
+
+# ── Dataset ────────────────────────────────────────────────────────────────────
+
+class SimDataset:
+    """
+    The forum the simulator serves. Rows are stored the way the API returns
+    them (every value a string), keyed by numeric id, with the indexes the
+    query parameters need.
+
+    Build one with synthetic(), fill it with the add_* methods, or both.
+    clock supplies "now" for new rows (time.time by default).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.users:     dict[int, dict] = {}
+        self.forums:    dict[int, dict] = {}
+        self.threads:   dict[int, dict] = {}
+        self.posts:     dict[int, dict] = {}
+        self.bytes:     dict[int, dict] = {}
+        self.contracts: dict[int, dict] = {}
+        self.bratings:  dict[int, dict] = {}
+        self.disputes:  dict[int, dict] = {}
+
+        self.posts_by_thread:   dict[int, list[int]] = defaultdict(list)
+        self.posts_by_user:     dict[int, list[int]] = defaultdict(list)
+        self.threads_by_forum:  dict[int, list[int]] = defaultdict(list)
+        self.threads_by_user:   dict[int, list[int]] = defaultdict(list)
+        self.bytes_to:          dict[int, list[int]] = defaultdict(list)
+        self.bytes_from:        dict[int, list[int]] = defaultdict(list)
+        self.contracts_by_user: dict[int, list[int]] = defaultdict(list)
+        self.bratings_to:       dict[int, list[int]] = defaultdict(list)
+        self.bratings_from:     dict[int, list[int]] = defaultdict(list)
+        self.bratings_by_contract: dict[int, list[int]] = defaultdict(list)
+        self.disputes_by_contract: dict[int, list[int]] = defaultdict(list)
+        self.disputes_by_claimant: dict[int, list[int]] = defaultdict(list)
+        self.disputes_by_defendant: dict[int, list[int]] = defaultdict(list)
+
+        self.tokens: dict[str, int] = {}
+        self.default_uid = 1
+        self._last_id: dict[str, int] = defaultdict(int)
+        self._lock = threading.RLock()
+
+    def _new_id(self, table: str, wanted: int | None = None) -> int:
+        """Next free id of a table (or wanted, if given), HF-style ascending."""
+        new = wanted or self._last_id[table] + 1
+        self._last_id[table] = max(self._last_id[table], new)
+        return new
+
+    def now(self) -> int:
+        return int(self.clock())
+
+    def uid_for(self, token: str) -> int:
+        return self.tokens.get(token, self.default_uid)
+
+    def add_token(self, token: str, uid: int) -> None:
+        """Make token act as user uid."""
+        self.tokens[token] = uid
+
+    # ── Inserts ──
+
+    def add_user(self, username: str, uid: int | None = None, **extra: Any) -> dict:
+        with self._lock:
+            uid = self._new_id("users", uid)
+            row = {
+                "uid": str(uid), "username": username, "usergroup": "2",
+                "displaygroup": "0", "additionalgroups": "", "postnum": "0",
+                "awards": "0", "myps": "1000", "threadnum": "0",
+                "avatar": f"./uploads/avatars/avatar_{uid}.png",
+                "avatardimensions": "120|120", "avatartype": "upload",
+                "usertitle": "", "website": "", "timeonline": "0",
+                "reputation": "0", "referrals": "0", "vault": "0",
+                "lastvisit": str(self.now()), "lastactive": str(self.now()),
+                "unreadpms": "0", "invisible": "0", "totalpms": "0",
+                "warningpoints": "0",
+            }
+            row.update({k: str(v) for k, v in extra.items()})
+            self.users[uid] = row
+            return row
+
+    def add_forum(self, name: str, fid: int | None = None, description: str = "", type: str = "f") -> dict:
+        with self._lock:
+            fid = self._new_id("forums", fid)
+            row = {"fid": str(fid), "name": name, "description": description, "type": type}
+            self.forums[fid] = row
+            return row
+
+    def add_thread(self, fid: int, uid: int, subject: str, message: str, dateline: int | None = None) -> dict:
+        """Create a thread with its first post. Returns the thread row."""
+        with self._lock:
+            tid  = self._new_id("threads")
+            when = self.now() if dateline is None else int(dateline)
+            user = self.users.get(uid, {})
+            row  = {
+                "tid": str(tid), "uid": str(uid), "fid": str(fid), "subject": subject,
+                "closed": "0", "numreplies": "0", "views": "0", "dateline": str(when),
+                "_firstpost": 0, "lastpost": str(when),
+                "lastposter": user.get("username", ""), "lastposteruid": str(uid),
+                "prefix": "0", "icon": "0", "poll": "0",
+                "username": user.get("username", ""), "sticky": "0", "bestpid": "0",
+            }
+            self.threads[tid] = row
+            self.threads_by_forum[fid].append(tid)
+            self.threads_by_user[uid].append(tid)
+            if user:
+                user["threadnum"] = str(int(user["threadnum"]) + 1)
+            post = self.add_post(tid, uid, message, dateline=when, _first=True)
+            row["_firstpost"] = int(post["pid"])
+            return row
+
+    def add_post(self, tid: int, uid: int, message: str, dateline: int | None = None, _first: bool = False) -> dict:
+        """Reply to a thread. Updates the thread's lastpost/lastposter/numreplies."""
+        with self._lock:
+            thread = self.threads[tid]
+            pid    = self._new_id("posts")
+            when   = self.now() if dateline is None else int(dateline)
+            user   = self.users.get(uid, {})
+            row = {
+                "pid": str(pid), "tid": str(tid), "uid": str(uid), "fid": thread["fid"],
+                "dateline": str(when), "message": message,
+                "subject": thread["subject"] if _first else f"RE: {thread['subject']}",
+                "edituid": "", "edittime": "0", "editreason": "",
+                "username": user.get("username", ""),
+            }
+            self.posts[pid] = row
+            self.posts_by_thread[tid].append(pid)
+            self.posts_by_user[uid].append(pid)
+            if user:
+                user["postnum"] = str(int(user["postnum"]) + 1)
+            if not _first:
+                thread["numreplies"]    = str(int(thread["numreplies"]) + 1)
+                thread["lastpost"]      = str(when)
+                thread["lastposter"]    = user.get("username", "")
+                thread["lastposteruid"] = str(uid)
+            return row
+
+    def add_bytes(
+        self, from_uid: int, to_uid: int, amount: float, type: str = "don",
+        reason: str = "", pid: int = 0, dateline: int | None = None,
+    ) -> dict:
+        with self._lock:
+            txid = self._new_id("bytes")
+            when = self.now() if dateline is None else int(dateline)
+            row  = {
+                "id": str(txid), "amount": f"{float(amount):.2f}", "dateline": str(when),
+                "type": type, "reason": reason,
+                "_from": from_uid, "_to": to_uid, "_pid": pid,
+            }
+            self.bytes[txid] = row
+            self.bytes_from[from_uid].append(txid)
+            self.bytes_to[to_uid].append(txid)
+            return row
+
+    def add_contract(
+        self, inituid: int, otheruid: int, type: str = "1", status: str = "5",
+        muid: int = 0, tid: int = 0, iprice: str = "0", iproduct: str = "",
+        terms: str = "", dateline: int | None = None,
+    ) -> dict:
+        with self._lock:
+            cid  = self._new_id("contracts")
+            when = self.now() if dateline is None else int(dateline)
+            row  = {
+                "cid": str(cid), "dateline": str(when), "otherdateline": "0",
+                "public": "1", "timeout_days": "7", "timeout": str(when + 7 * 86400),
+                "status": status, "istatus": "1", "ostatus": "1" if status in ("5", "6") else "0",
+                "cancelstatus": "0", "type": type, "tid": str(tid),
+                "inituid": str(inituid), "otheruid": str(otheruid),
+                "muid": str(muid) if muid else "",
+                "iprice": iprice, "oprice": "0", "iproduct": iproduct, "oproduct": "",
+                "icurrency": "bytes", "ocurrency": "other", "terms": terms,
+                "iaddress": "", "oaddress": "",
+            }
+            self.contracts[cid] = row
+            for uid in {inituid, otheruid, muid} - {0}:
+                self.contracts_by_user[uid].append(cid)
+            return row
+
+    def add_brating(self, cid: int, fromid: int, toid: int, amount: str = "+1",
+                    message: str = "", dateline: int | None = None) -> dict:
+        with self._lock:
+            crid = self._new_id("bratings")
+            when = self.now() if dateline is None else int(dateline)
+            row  = {
+                "crid": str(crid), "contractid": str(cid), "fromid": str(fromid),
+                "toid": str(toid), "dateline": str(when), "amount": amount, "message": message,
+            }
+            self.bratings[crid] = row
+            self.bratings_to[toid].append(crid)
+            self.bratings_from[fromid].append(crid)
+            self.bratings_by_contract[cid].append(crid)
+            return row
+
+    def add_dispute(self, cid: int, claimantuid: int, defendantuid: int,
+                    notes: str = "", dateline: int | None = None) -> dict:
+        with self._lock:
+            cdid = self._new_id("disputes")
+            when = self.now() if dateline is None else int(dateline)
+            row  = {
+                "cdid": str(cdid), "contractid": str(cid), "claimantuid": str(claimantuid),
+                "defendantuid": str(defendantuid), "dateline": str(when), "status": "1",
+                "dispute_tid": "0", "claimantnotes": notes, "defendantnotes": "",
+            }
+            self.disputes[cdid] = row
+            self.disputes_by_contract[cid].append(cdid)
+            self.disputes_by_claimant[claimantuid].append(cdid)
+            self.disputes_by_defendant[defendantuid].append(cdid)
+            if cid in self.contracts:
+                self.contracts[cid]["status"] = "7"
+            return row
+
+    # ── Synthetic data ──
+
+    @classmethod
+    def synthetic(
+        cls,
+        users: int = 200,
+        forums: int = 10,
+        threads: int = 500,
+        posts: int = 5000,
+        transactions: int = 1000,
+        contracts: int = 200,
+        seed: int | None = 0,
+        days: int = 30,
+        clock: Callable[[], float] = time.time,
+    ) -> SimDataset:
+        """
+        A random forum spread over the last `days` days, built by
+        HFForumGen. The same seed always gives the same forum (ids, text,
+        who posted where). Use ForumGenerator directly for live activity.
+        """
+        from HFForumGen import ForumGenerator, GenConfig
+
+        config = GenConfig(users=users, forums=forums, threads=threads, posts=posts,
+                           transactions=transactions, contracts=contracts, days=days)
+        return ForumGenerator(config, seed=seed, dataset=cls(clock), clock=clock).build()
+
+
+# ── Query engine ───────────────────────────────────────────────────────────────
+
+class SimError(Exception):
+    """A request the simulated API answers with an HTTP error status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _ids(value: Any) -> list[int]:
+    if isinstance(value, (list, tuple)):
+        values = value
+    elif isinstance(value, str):
+        values = value.split(",")
+    else:
+        values = [value]
+    out = []
+    for v in values:
+        try:
+            out.append(int(v))
+        except (TypeError, ValueError):
+            continue
+    return out
+
+
+def _page(ask: dict) -> tuple[int, int]:
+    try:
+        page = max(1, int(ask.get("_page", 1)))
+    except (TypeError, ValueError):
+        page = 1
+    try:
+        perpage = min(MAX_PERPAGE, max(1, int(ask.get("_perpage", DEFAULT_PERPAGE))))
+    except (TypeError, ValueError):
+        perpage = DEFAULT_PERPAGE
+    return page, perpage
+
+
+def _newest(index: list[int], ask: dict) -> list[int]:
+    """One page of an id index, newest first."""
+    page, perpage = _page(ask)
+    end   = len(index) - (page - 1) * perpage
+    start = max(0, end - perpage)
+    return index[start:end][::-1] if end > 0 else []
+
+
+def _oldest(index: list[int], ask: dict) -> list[int]:
+    """One page of an id index, oldest first (posts of a thread)."""
+    page, perpage = _page(ask)
+    return index[(page - 1) * perpage : page * perpage]
+
+
+class _Engine:
+    """Answers asks dicts from a SimDataset."""
+
+    # (resource, field) → (table, foreign key in the row)
+    _NESTED = {
+        ("posts", "author"):        ("users", "uid"),
+        ("threads", "firstpost"):   ("posts", "_firstpost"),
+        ("bytes", "from"):          ("users", "_from"),
+        ("bytes", "to"):            ("users", "_to"),
+        ("bytes", "post"):          ("posts", "_pid"),
+        ("contracts", "inituser"):  ("users", "inituid"),
+        ("contracts", "otheruser"): ("users", "otheruid"),
+        ("contracts", "escrow"):    ("users", "muid"),
+        ("contracts", "thread"):    ("threads", "tid"),
+        ("bratings", "from"):       ("users", "fromid"),
+        ("bratings", "to"):         ("users", "toid"),
+        ("bratings", "contract"):   ("contracts", "contractid"),
+    }
+
+    def __init__(self, data: SimDataset):
+        self.data = data
+
+    # ── Reads ──
+
+    def read(self, asks: dict, uid: int) -> dict:
+        out = {}
+        with self.data._lock:
+            for resource, ask in asks.items():
+                if not isinstance(ask, dict):
+                    continue
+                rows = self._select(resource, ask, uid)
+                if rows is None:
+                    continue
+                if resource == "me":
+                    out["me"] = self._project(resource, rows[0], ask) if rows else {}
+                else:
+                    out[resource] = [self._project(resource, row, ask) for row in rows]
+        return out
+
+    def _lookup(self, resource: str, ask: dict, key: str, table: dict) -> list[dict]:
+        ids   = _ids(ask[key])[:ID_LIMITS.get(resource)]
+        if resource == "threads" and any(i not in table for i in ids):
+            return []   # one private or deleted tid empties the batch
+        return [table[i] for i in ids if i in table]
+
+    def _select(self, resource: str, ask: dict, uid: int) -> list[dict] | None:
+        d = self.data
+        if resource == "me":
+            return [d.users[uid]] if uid in d.users else []
+        if resource == "users":
+            return self._lookup(resource, ask, "_uid", d.users) if "_uid" in ask else []
+        if resource == "forums":
+            return self._lookup(resource, ask, "_fid", d.forums) if "_fid" in ask else []
+        if resource == "posts":
+            if "_pid" in ask:
+                return self._lookup(resource, ask, "_pid", d.posts)
+            if "_tid" in ask:
+                return self._pages(d.posts, d.posts_by_thread, ask["_tid"], ask, _oldest)
+            if "_uid" in ask:
+                return self._pages(d.posts, d.posts_by_user, ask["_uid"], ask, _newest)
+            return []
+        if resource == "threads":
+            if "_tid" in ask:
+                return self._lookup(resource, ask, "_tid", d.threads)
+            if "_fid" in ask:
+                return self._forum_threads(ask)
+            if "_uid" in ask:
+                return self._pages(d.threads, d.threads_by_user, ask["_uid"], ask, _newest)
+            return []
+        if resource == "bytes":
+            if "_id" in ask:
+                return self._lookup(resource, ask, "_id", d.bytes)
+            if "_to" in ask:
+                return self._pages(d.bytes, d.bytes_to, ask["_to"], ask, _newest)
+            if "_from" in ask:
+                return self._pages(d.bytes, d.bytes_from, ask["_from"], ask, _newest)
+            return []
+        if resource == "contracts":
+            if "_cid" in ask:
+                return [c for c in self._lookup(resource, ask, "_cid", d.contracts) if self._party(c, uid)]
+            if "_uid" in ask:
+                # Owner-scoped: another user's contracts come back empty
+                return self._pages(d.contracts, d.contracts_by_user, [uid], ask, _newest) \
+                    if uid in _ids(ask["_uid"]) else []
+            return []
+        if resource == "bratings":
+            if "_crid" in ask:
+                return self._lookup(resource, ask, "_crid", d.bratings)
+            if "_cid" in ask:
+                return self._pages(d.bratings, d.bratings_by_contract, ask["_cid"], ask, _newest)
+            if "_to" in ask:
+                return self._pages(d.bratings, d.bratings_to, ask["_to"], ask, _newest)
+            if "_from" in ask:
+                return self._pages(d.bratings, d.bratings_from, ask["_from"], ask, _newest)
+            return []
+        if resource == "disputes":
+            if "_cdid" in ask:
+                return self._lookup(resource, ask, "_cdid", d.disputes)
+            if "_cid" in ask:
+                return self._pages(d.disputes, d.disputes_by_contract, ask["_cid"], ask, _newest)
+            if "_claimantuid" in ask:
+                return self._pages(d.disputes, d.disputes_by_claimant, ask["_claimantuid"], ask, _newest)
+            if "_defendantuid" in ask:
+                return self._pages(d.disputes, d.disputes_by_defendant, ask["_defendantuid"], ask, _newest)
+            if "_uid" in ask:
+                raise SimError(503, "disputes cannot be read by _uid")
+            return []
+        return None   # unknown resource — left out of the response
+
+    def _pages(self, table: dict, index: dict, keys: Any, ask: dict, order) -> list[dict]:
+        ids: list[int] = []
+        for key in _ids(keys):
+            ids.extend(order(index.get(key, []), ask))
+        return [table[i] for i in ids]
+
+    def _forum_threads(self, ask: dict) -> list[dict]:
+        page, perpage = _page(ask)
+        rows = []
+        for fid in _ids(ask["_fid"]):
+            tids = self.data.threads_by_forum.get(fid, [])
+            top  = heapq.nlargest(page * perpage, tids,
+                                  key=lambda t: int(self.data.threads[t]["lastpost"]))
+            rows.extend(self.data.threads[t] for t in top[(page - 1) * perpage:])
+        return rows
+
+    @staticmethod
+    def _party(contract: dict, uid: int) -> bool:
+        return str(uid) in (contract["inituid"], contract["otheruid"], contract["muid"])
+
+    def _project(self, resource: str, row: dict, ask: dict) -> dict:
+        wanted = {k: v for k, v in ask.items() if not k.startswith("_") and v}
+        if not wanted:
+            return {k: v for k, v in row.items()
+                    if not k.startswith("_") and (resource == "me" or k not in _ME_ONLY)}
+        out = {}
+        for name, spec in wanted.items():
+            nested = self._NESTED.get((resource, name))
+            if nested is not None:
+                table, fk = nested
+                target = getattr(self.data, table).get(int(row.get(fk) or 0))
+                if target is not None:
+                    sub = spec if isinstance(spec, dict) else (
+                        dict.fromkeys(spec, True) if isinstance(spec, (list, tuple)) else {})
+                    out[name] = self._project(table, target, sub)
+            elif resource == "me" and name == "bytes":
+                out[name] = row["myps"]   # "bytes" on me, "myps" on users
+            elif name in row and not name.startswith("_") and (resource == "me" or name not in _ME_ONLY):
+                out[name] = row[name]
+        return out
+
+    # ── Writes ──
+
+    def write(self, asks: dict, uid: int) -> dict:
+        out = {}
+        d   = self.data
+        with d._lock:
+            for resource, ask in asks.items():
+                if not isinstance(ask, dict):
+                    continue
+                if resource == "posts":
+                    tid = _ids(ask.get("_tid"))
+                    if not tid or tid[0] not in d.threads or not ask.get("_message"):
+                        raise SimError(400, "posts write needs an existing _tid and _message")
+                    if d.threads[tid[0]]["closed"] == "1":
+                        raise SimError(403, "thread is closed")
+                    post = d.add_post(tid[0], uid, str(ask["_message"]))
+                    out["posts"] = {k: post[k] for k in ("pid", "tid", "uid", "message")}
+                elif resource == "threads":
+                    fid = _ids(ask.get("_fid"))
+                    if not fid or fid[0] not in d.forums or not ask.get("_subject") or not ask.get("_message"):
+                        raise SimError(400, "threads write needs an existing _fid, _subject and _message")
+                    thread = d.add_thread(fid[0], uid, str(ask["_subject"]), str(ask["_message"]))
+                    first  = d.posts[thread["_firstpost"]]
+                    out["threads"] = {
+                        **{k: thread[k] for k in ("tid", "uid", "subject", "dateline")},
+                        "firstpost": {k: first[k] for k in ("pid", "tid", "uid", "message")},
+                    }
+                elif resource == "bytes":
+                    out["bytes"] = self._write_bytes(ask, uid)
+        return out
+
+    def _write_bytes(self, ask: dict, uid: int) -> dict:
+        d  = self.data
+        me = d.users.get(uid)
+        if me is None:
+            raise SimError(400, "token user does not exist")
+
+        def move(amount: float, field_from: str, field_to: str | None) -> None:
+            balance = float(me[field_from])
+            if amount <= 0 or amount > balance:
+                raise SimError(400, "invalid amount or not enough bytes")
+            me[field_from] = f"{balance - amount:g}"
+            if field_to:
+                me[field_to] = f"{float(me[field_to]) + amount:g}"
+
+        if "_deposit" in ask:
+            amount = float(ask["_deposit"])
+            move(amount, "myps", "vault")
+            return {"vault": me["vault"]}
+        if "_withdraw" in ask:
+            amount = float(ask["_withdraw"])
+            move(amount, "vault", "myps")
+            return {"vault": me["vault"]}
+        if "_bump" in ask:
+            tid = _ids(ask["_bump"])
+            if not tid or tid[0] not in d.threads:
+                raise SimError(400, "unknown thread")
+            move(50.0, "myps", None)
+            tx = d.add_bytes(uid, 0, 50, type="bum", reason=f"Bump thread {tid[0]}")
+            return {"id": tx["id"]}
+        to = _ids(ask.get("_uid"))
+        if not to or to[0] not in d.users:
+            raise SimError(400, "unknown recipient")
+        amount = float(ask.get("_amount", 0))
+        move(amount, "myps", None)
+        other = d.users[to[0]]
+        other["myps"] = f"{float(other['myps']) + amount:g}"
+        tx = d.add_bytes(uid, to[0], amount, type="don", reason=str(ask.get("_reason", "")),
+                         pid=(_ids(ask.get("_pid")) or [0])[0])
+        return {"id": tx["id"]}
+
+
+# ── Faults and rate limit ──────────────────────────────────────────────────────
+
+@dataclass
+class SimFaults:
+    """
+    What goes wrong, and how slowly. Probabilities are per request (0–1).
+
+    latency:     Seconds added to every response.
+    jitter:      Up to this many extra seconds, uniformly random.
+    slow_rate:   Share of responses delayed by slow_latency instead (tail).
+    slow_latency: Seconds for a slow response.
+    error_403:   Cloudflare block page. Does not count against the hourly limit.
+    error_503:   Server error. Counts against the hourly limit, like HF.
+    error_503_html: Cloudflare page for an unreachable origin. Does not count
+                 against the hourly limit.
+    """
+    latency:      float = 0.0
+    jitter:       float = 0.0
+    slow_rate:    float = 0.0
+    slow_latency: float = 2.0
+    error_403:    float = 0.0
+    error_503:    float = 0.0
+    error_503_html: float = 0.0
+
+
+class _HourlyLimit:
+    """Rolling window of call times per token."""
+
+    def __init__(self, limit: int, window: float, clock: Callable[[], float]):
+        self.limit  = limit
+        self.window = window
+        self.clock  = clock
+        self._calls: dict[str, deque[float]] = defaultdict(deque)
+
+    def remaining(self, token: str) -> int:
+        calls  = self._calls[token]
+        cutoff = self.clock() - self.window
+        while calls and calls[0] <= cutoff:
+            calls.popleft()
+        return max(0, self.limit - len(calls))
+
+    def take(self, token: str) -> int | None:
+        """Count one call. Returns the calls left after it, or None if over the limit."""
+        if self.remaining(token) <= 0:
+            return None
+        self._calls[token].append(self.clock())
+        return self.limit - len(self._calls[token])
+
+    def reset(self, token: str | None = None) -> None:
+        if token is None:
+            self._calls.clear()
+        else:
+            self._calls.pop(token, None)
+
+
+# ── Server ─────────────────────────────────────────────────────────────────────
+
+class HFSimulator:
+    """
+    HTTP server answering /api/v2/read and /api/v2/write from a SimDataset.
+
+    Args:
+        dataset:      Forum to serve (default SimDataset.synthetic(seed=seed)).
+        host, port:   Where to listen. port=0 picks a free port; see base_url.
+        hourly_limit: Calls per token per window before MAX_HOURLY_CALLS_EXCEEDED.
+        window:       Length of the rate limit window in seconds (HF: 3600).
+                      Shorten it to test recovery without waiting an hour.
+        faults:       SimFaults to inject (adjustable while running).
+        seed:         Seeds the synthetic dataset and the fault dice.
+    """
+
+    def __init__(
+        self,
+        dataset: SimDataset | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        hourly_limit: int = DEFAULT_HOURLY_LIMIT,
+        window: float = 3600.0,
+        faults: SimFaults | None = None,
+        seed: int | None = 0,
+    ):
+        self.dataset = dataset if dataset is not None else SimDataset.synthetic(seed=seed)
+        self.host    = host
+        self.port    = port
+        self.faults  = faults or SimFaults()
+        self.limit   = _HourlyLimit(hourly_limit, window, time.monotonic)
+        self._engine = _Engine(self.dataset)
+        self._rng    = random.Random(seed)
+        self._server: asyncio.AbstractServer | None = None
+        self._loop:   asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._stats: dict[str, int] = defaultdict(int)
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def base_url(self) -> str:
+        """API base to give HFClient(base_url=...) or HF_API_BASE."""
+        return f"http://{self.host}:{self.port}/api/v2"
+
+    def stats(self) -> dict:
+        """Request counts: read, write, ok, http_401/403/503, rate_limited, connections."""
+        return dict(self._stats)
+
+    # ── Request handling ──
+
+    async def handle(self, method: str, path: str, headers: dict[str, str], body: bytes) -> tuple[int, dict, bytes]:
+        """Answer one HTTP request. Returns (status, headers, body)."""
+        path = path.split("?", 1)[0].rstrip("/")
+        if method == "HEAD" or (method == "GET" and path == ""):
+            return 200, {"content-type": "text/html"}, b""
+        endpoint = path.rsplit("/", 1)[-1]
+        if method != "POST" or path not in ("/api/v2/read", "/api/v2/write"):
+            return 404, {"content-type": "application/json"}, b'{"success":false,"message":"NOT_FOUND"}'
+        self._stats[endpoint] += 1
+
+        await self._delay()
+        faults = self.faults
+        if faults.error_403 and self._rng.random() < faults.error_403:
+            self._stats["http_403"] += 1
+            return 403, {"content-type": "text/html"}, _CLOUDFLARE_403
+        if faults.error_503_html and self._rng.random() < faults.error_503_html:
+            self._stats["http_503"] += 1
+            return 503, {"content-type": "text/html"}, _CLOUDFLARE_503
+
+        auth = headers.get("authorization", "")
+        if not auth.lower().startswith("bearer ") or not auth[7:].strip():
+            self._stats["http_401"] += 1
+            return 401, {"content-type": "application/json"}, b'{"success":false,"message":"UNAUTHORIZED"}'
+        token = auth[7:].strip()
+
+        left = self.limit.take(token)
+        if left is None:
+            self._stats["rate_limited"] += 1
+            return 200, self._json_headers(0), RATE_LIMIT_BODY
+        if faults.error_503 and self._rng.random() < faults.error_503:
+            self._stats["http_503"] += 1
+            return 503, self._json_headers(left), b'{"success":false,"message":"SERVICE_UNAVAILABLE"}'
+
+        try:
+            form = parse_qs(body.decode("utf-8"))
+            asks = HFCodec.loads(form["asks"][0])
+            if not isinstance(asks, dict):
+                raise ValueError("asks must be an object")
+        except (KeyError, ValueError, UnicodeDecodeError) as e:
+            self._stats["http_400"] += 1
+            return 400, self._json_headers(left), HFCodec.dumps({"success": False, "message": f"BAD_ASKS: {e}"}).encode()
+
+        uid = self.dataset.uid_for(token)
+        try:
+            if endpoint == "read":
+                data = self._engine.read(asks, uid)
+            else:
+                data = self._engine.write(asks, uid)
+        except SimError as e:
+            self._stats[f"http_{e.status}"] += 1
+            return e.status, self._json_headers(left), HFCodec.dumps({"success": False, "message": str(e)}).encode()
+        self._stats["ok"] += 1
+        return 200, self._json_headers(left), HFCodec.dumps(data).encode()
+
+    @staticmethod
+    def _json_headers(remaining: int) -> dict:
+        return {"content-type": "application/json", "x-rate-limit-remaining": str(remaining)}
+
+    async def _delay(self) -> None:
+        f = self.faults
+        if f.slow_rate and self._rng.random() < f.slow_rate:
+            delay = f.slow_latency
+        else:
+            delay = f.latency + (self._rng.uniform(0, f.jitter) if f.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._stats["connections"] += 1
+        self._connections.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length") or 0))
+
+                status, out_headers, payload = await self.handle(method, target, headers, body)
+                head = [f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}"]
+                head += [f"{k}: {v}" for k, v in out_headers.items()]
+                head.append(f"content-length: {len(payload)}")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+                if method != "HEAD":
+                    writer.write(payload)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    # ── Lifecycle ──
+
+    async def astart(self) -> str:
+        """Start listening on the running event loop. Returns base_url."""
+        self._server = await asyncio.start_server(self._serve_connection, self.host, self.port, backlog=_BACKLOG)
+        self.port    = self._server.sockets[0].getsockname()[1]
+        log.info(f"HF simulator listening on {self.base_url}")
+        return self.base_url
+
+    async def astop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Keep-alive connections would hold wait_closed() open
+            for writer in list(self._connections):
+                writer.close()
+            # Let the handlers see EOF and return before the loop goes away
+            for _ in range(100):
+                if not self._connections:
+                    break
+                await asyncio.sleep(0.01)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> HFSimulator:
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.astop()
+
+    def start(self) -> str:
+        """Serve from a daemon thread with its own event loop. Returns base_url."""
+        started = threading.Event()
+
+        def _run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.astart())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=_run, name="hfapi-simulator", daemon=True)
+        self._thread.start()
+        started.wait()
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.astop(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = self._thread = None
+
+    def __enter__(self) -> HFSimulator:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """Block serving requests (used by hf sim serve)."""
+        async def _main():
+            await self.astart()
+            await self._server.serve_forever()
+        try:
+            asyncio.run(_main())
+        except KeyboardInterrupt:
+            pass
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden",
+            404: "Not Found", 503: "Service Unavailable"}
@@ -24,42 +24,76 @@ API NOTE — numreplies is unreliable from threads._uid:
 """
 
 from HFClient import HFClient
+from HFFields import Fields, project
+from HFQuery import HFQuery
 
-_FIELDS = {
-    "tid": True, "uid": True, "fid": True, "subject": True,
-    "closed": True, "numreplies": True, "views": True, "dateline": True,
-    "firstpost": True, "lastpost": True, "lastposter": True,
-    "lastposteruid": True, "prefix": True, "icon": True,
-    "poll": True, "username": True, "sticky": True, "bestpid": True,
-}
+# poll_lastpost() runs on every watcher tick — prepare its asks once
+_POLL_LASTPOST = HFQuery(
+    "threads",
+    ["tid", "subject", "lastpost", "lastposter", "lastposteruid", "numreplies"],
+    params=("_tid",),
+)
 
 
 class HFThreads(HFClient):
-    """Read and create threads (/read/threads and /write/threads endpoints)."""
+    """
+    Read and create threads (/read/threads and /write/threads endpoints).
 
-    def get(self, tid: int) -> dict | None:
-        """Get a single thread by ID."""
-        threads = self.get_many([tid])
+    Every method has an async twin prefixed with "a" (aget, aget_many,
+    apoll_lastpost, ...) for use inside an event loop.
+
+    Read methods take fields= — "minimal", "summary", "full" (default), a
+    list of field names or an asks dict. Only "full" asks for the firstpost
+    body. See HFFields.
+    """
+
+    async def aget(self, tid: int, fields: Fields = None) -> dict | None:
+        """Async version of get()."""
+        threads = await self.aget_many([tid], fields)
         return threads[0] if threads else None
 
-    def get_many(self, tids: list[int]) -> list[dict]:
+    def get(self, tid: int, fields: Fields = None) -> dict | None:
+        """Get a single thread by ID."""
+        return self._run_sync(self.aget(tid, fields))
+
+    async def aget_many(self, tids: list[int], fields: Fields = None) -> list[dict]:
+        """Async version of get_many()."""
+        if not tids:
+            return []
+        data = await self.read({"threads": {"_tid": tids, **project("threads", fields)}})
+        return self._unwrap(data, "threads")
+
+    def get_many(self, tids: list[int], fields: Fields = None) -> list[dict]:
         """
         Get multiple threads by ID in one request (max 30 per call).
 
         WARNING: A single private or deleted TID in the list causes the whole
         batch to return empty. If you hit this, bisect to find the bad TID.
         """
-        if not tids:
-            return []
-        data = self.read_sync({"threads": {"_tid": tids, **_FIELDS}})
+        return self._run_sync(self.aget_many(tids, fields))
+
+    async def aget_by_forum(self, fid: int, fields: Fields = None) -> list[dict]:
+        """Async version of get_by_forum()."""
+        data = await self.read({"threads": {"_fid": [fid], **project("threads", fields)}})
         return self._unwrap(data, "threads")
 
-    def get_by_forum(self, fid: int) -> list[dict]:
+    def get_by_forum(self, fid: int, fields: Fields = None) -> list[dict]:
         """Get recent threads in a forum."""
-        data = self.read_sync({"threads": {"_fid": [fid], **_FIELDS}})
+        return self._run_sync(self.aget_by_forum(fid, fields))
+
+    async def aget_by_user(
+        self, uid: int, page: int = 1, perpage: int = 20, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_by_user()."""
+        data = await self.read({"threads": {
+            "_uid": [uid], "_page": page, "_perpage": perpage,
+            **project("threads", fields),
+        }})
         return self._unwrap(data, "threads")
 
-    def get_by_user(self, uid: int, page: int = 1, perpage: int = 20) -> list[dict]:
+    def get_by_user(
+        self, uid: int, page: int = 1, perpage: int = 20, fields: Fields = None
+    ) -> list[dict]:
         """
         Get threads created by a user (OP threads only).
 
@@ -71,10 +105,13 @@ class HFThreads(HFClient):
         WARNING: numreplies from this endpoint can be stale. Use lastpost
         (unix timestamp) as the primary change signal, not numreplies.
         """
-        data = self.read_sync({"threads": {
-            "_uid": [uid], "_page": page, "_perpage": perpage,
-            **_FIELDS,
-        }})
+        return self._run_sync(self.aget_by_user(uid, page, perpage, fields))
+
+    async def apoll_lastpost(self, tids: list[int]) -> list[dict]:
+        """Async version of poll_lastpost()."""
+        if not tids:
+            return []
+        data = await self.read(_POLL_LASTPOST.bind(_tid=tids))
         return self._unwrap(data, "threads")
 
     def poll_lastpost(self, tids: list[int]) -> list[dict]:
@@ -89,34 +126,49 @@ class HFThreads(HFClient):
         NOTE: numreplies can be stale when threads are fetched via _uid.
         When fetching by _tid (as this method does), numreplies is reliable.
         """
-        if not tids:
-            return []
-        data = self.read_sync({"threads": {
-            "_tid":          tids,
-            "tid":           True,
-            "subject":       True,
-            "lastpost":      True,
-            "lastposter":    True,
-            "lastposteruid": True,
-            "numreplies":    True,
-        }})
-        return self._unwrap(data, "threads")
+        return self._run_sync(self.apoll_lastpost(tids))
 
-    def create(self, fid: int, subject: str, message: str) -> dict | None:
-        """Create a new thread. Requires 'Posts Write' scope."""
-        data = self.write_sync({"threads": {
+    @staticmethod
+    def create_asks(fid: int, subject: str, message: str) -> dict:
+        """Build the asks for create()."""
+        return {"threads": {
             "_fid":     fid,
             "_subject": subject,
             "_message": message,
-        }})
+        }}
+
+    async def acreate(
+        self, fid: int, subject: str, message: str, idempotency_key: str | None = None
+    ) -> dict | None:
+        """Async version of create()."""
+        data = await self.write(self.create_asks(fid, subject, message), idempotency_key)
         rows = self._unwrap(data, "threads")
         return rows[0] if rows else None
 
-    def get_all_by_user(self, uid: int, perpage: int = 20, max_pages: int = 50) -> list[dict]:
+    def create(self, fid: int, subject: str, message: str, idempotency_key: str | None = None) -> dict | None:
+        """
+        Create a new thread. Requires 'Posts Write' scope.
+
+        With an idempotency_key the write is retried if a failure means it
+        never reached HF, and a repeat call with the key returns the first
+        response. A timeout still returns None — the thread may exist.
+        HFOutbox.create_thread() queues it durably and checks.
+        """
+        return self._run_sync(self.acreate(fid, subject, message, idempotency_key))
+
+    async def aget_all_by_user(
+        self, uid: int, perpage: int = 20, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
+        """Async version of get_all_by_user()."""
+        from HFPaginator import HFPaginator
+        return await HFPaginator.aget_all_threads_by_user(self, uid, perpage, max_pages, fields)
+
+    def get_all_by_user(
+        self, uid: int, perpage: int = 20, max_pages: int = 50, fields: Fields = None
+    ) -> list[dict]:
         """
         Get ALL threads created by a user, automatically paginating.
 
         Note: returns OP threads only. See get_by_user() for the full caveat.
         """
-        from HFPaginator import HFPaginator
-        return HFPaginator.get_all_threads_by_user(self, uid, perpage, max_pages)
+        return self._run_sync(self.aget_all_by_user(uid, perpage, max_pages, fields))
@@ -0,0 +1,119 @@
+"""
+HFTokenPool — spread public reads across several OAuth tokens.
+
+Every token has its own hourly call budget. Public reads (users, threads,
+posts, forums) return the same data no matter which token makes them, so
+an HFClient given a pool routes those reads to whichever token has the
+most budget left. Owner-scoped resources (me, bytes, contracts, bratings,
+disputes, sigmarket) return data for the token's own account and always go
+out on the client's own token.
+
+Usage:
+    from HFClient    import HFClient
+    from HFTokenPool import HFTokenPool
+
+    pool = HFTokenPool([token_a, token_b, token_c])
+    hf   = HFClient(token_a, token_pool=pool)
+
+    # Routed to the token with the most remaining budget:
+    await hf.read({"users": {"_uid": [761578], "username": True}})
+
+    # Always uses token_a — contracts are owner-scoped:
+    await hf.read({"contracts": {"_uid": [my_uid], "cid": True}})
+
+    print(pool.stats())
+
+Routing rules:
+    - A read is routed only if every resource in the asks is public. One
+      owner-scoped key pins the whole request to the owning token.
+    - Tokens flagged by is_rate_limited() are skipped.
+    - The pick is the token with the highest get_rate_limit_remaining()
+      (unknown counts as 9999, so untried tokens are preferred); ties go to
+      the token that has been routed to least.
+    - If every pool token is rate limited, the client's own token is used.
+    - Writes are never routed.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from HFClient import get_rate_limit_remaining, is_rate_limited
+
+# Resources that return the same data regardless of which token asks
+PUBLIC_RESOURCES = frozenset({"users", "threads", "posts", "forums"})
+
+
+class HFTokenPool:
+    """
+    A set of OAuth tokens that public reads can be load-balanced across.
+
+    Args:
+        tokens: Access tokens to route through. The owning client's token
+                does not need to be in the pool.
+    """
+
+    def __init__(self, tokens: list[str] | None = None):
+        self._lock   = threading.Lock()
+        self._tokens: list[str] = []
+        self._routed: dict[str, int] = {}
+        for token in tokens or []:
+            self.add(token)
+
+    def add(self, token: str) -> None:
+        with self._lock:
+            if token and token not in self._routed:
+                self._tokens.append(token)
+                self._routed[token] = 0
+
+    def remove(self, token: str) -> bool:
+        """Remove a token (e.g. after a 401). Returns True if it was pooled."""
+        with self._lock:
+            if token not in self._routed:
+                return False
+            self._tokens.remove(token)
+            del self._routed[token]
+            return True
+
+    # ── Routing ────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def is_public(asks: dict) -> bool:
+        """True if every resource in asks can be served by any token."""
+        return bool(asks) and all(key in PUBLIC_RESOURCES for key in asks)
+
+    def pick(self) -> str | None:
+        """Return the pooled token with the most budget left, or None if all are limited."""
+        with self._lock:
+            candidates = [t for t in self._tokens if not is_rate_limited(t)]
+            if not candidates:
+                return None
+            token = max(candidates, key=lambda t: (get_rate_limit_remaining(t), -self._routed[t]))
+            self._routed[token] += 1
+            return token
+
+    def route(self, asks: dict, owner: str) -> str:
+        """Choose the token for a /read of asks made on behalf of owner."""
+        if not self.is_public(asks):
+            return owner
+        return self.pick() or owner
+
+    # ── Stats ──────────────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Per-token routing state, keyed by the last 6 characters of each token."""
+        with self._lock:
+            return {
+                f"...{t[-6:]}": {
+                    "remaining":    get_rate_limit_remaining(t),
+                    "rate_limited": is_rate_limited(t),
+                    "routed":       self._routed[t],
+                }
+                for t in self._tokens
+            }
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __repr__(self) -> str:
+        return f"HFTokenPool(tokens={len(self._tokens)})"
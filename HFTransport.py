@@ -0,0 +1,371 @@
+"""
+HFTransport — pluggable HTTP transport for HFClient, with cassette
+record/replay for offline benchmarking.
+
+Every /read and /write POST goes through the active transport. By default
+that's HttpxTransport, the shared httpx pool HFClient has always used.
+Everything above it (coalescing, single-flight, rate limiter, retries,
+hedging, breakers, metrics) runs unchanged whatever transport is active, so
+a watcher, paginator or batch change can be benchmarked against the same
+recorded traffic on a machine with no network.
+
+Recording:
+    from HFTransport import Cassette, RecordingTransport, use_transport
+
+    with use_transport(RecordingTransport(Cassette("watch.cassette"))):
+        rows = await pager.aget_all_posts_by_thread(6083735)
+
+    Each exchange is appended to the file as one JSON line as soon as it
+    completes (by a writer thread, off the event loop): endpoint, asks,
+    status, response headers, body and latency. Failures (timeouts,
+    proxy/connect errors) are recorded too. The token and request headers
+    are never written. cassette.flush() waits for the file to catch up.
+
+Replay:
+    from HFTransport import Cassette, ReplayTransport, use_transport
+
+    replay = ReplayTransport(Cassette.load("watch.cassette"), time_scale=1.0)
+    with use_transport(replay):
+        rows = await pager.aget_all_posts_by_thread(6083735)
+    print(replay.stats())   # {"served": 412, "misses": 0, "repeats": 37}
+
+    Requests are matched on endpoint + canonical asks; identical asks are
+    answered in recorded order, and the last answer is repeated once they
+    run out. time_scale=1.0 keeps the recorded latency, 0.5 halves it, 0
+    answers at once. An unmatched request raises CassetteMiss, which the
+    client sees as a transport error. Replayed answers don't touch the
+    shared rate state: the remaining count and MAX_HOURLY_CALLS blocks in
+    a cassette are from when it was recorded.
+
+    Matching is on the asks as POSTed, and read coalescing merges whatever
+    concurrent reads land within coalesce_window of each other. Which
+    reads share a POST depends on timing, so a replay at another
+    time_scale, or under a different load, can merge them differently
+    from the recording and miss. For runs that must replay exactly,
+    record and replay with coalesce_window=0 on the clients, or replay at
+    time_scale=1.0 and expect the odd miss.
+
+set_transport() switches the transport for the whole process, like
+HFCodec.set_codec(); use_transport() does it for a block and restores the
+previous one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Mapping, NamedTuple, Protocol
+
+import httpx
+
+import HFCodec
+from HFQuery import canonical_asks, encode_asks
+
+log = logging.getLogger("hfapi.transport")
+
+CASSETTE_VERSION = 1
+
+# Response headers not worth keeping in a cassette
+_SKIP_HEADERS = frozenset({"set-cookie", "cf-ray", "date", "report-to", "nel"})
+
+
+class TransportResponse(NamedTuple):
+    status:  int
+    headers: Mapping[str, str]   # case-insensitive (httpx.Headers)
+    content: bytes
+
+
+class Transport(Protocol):
+    # False for transports that never touch the network (HFClient.warm() skips them)
+    live: bool
+
+    async def post(
+        self,
+        url: str,
+        token: str,
+        asks: dict,
+        proxy: str | None,
+        options: Any,
+    ) -> TransportResponse:
+        """
+        POST asks to url and return the response. Raises httpx.ProxyError,
+        httpx.ConnectError or any other exception on transport failure.
+        HFClient applies the timeout by cancelling the call.
+        """
+
+
+class CassetteMiss(LookupError):
+    """Raised by ReplayTransport for a request with no recorded exchange."""
+
+
+# ── Live transport ─────────────────────────────────────────────────────────────
+
+class HttpxTransport:
+    """The shared per-proxy httpx pool in HFClient. The default transport."""
+
+    live = True
+
+    async def post(self, url, token, asks, proxy, options) -> TransportResponse:
+        from HFClient import _get_http_client
+
+        client  = _get_http_client(proxy, options)
+        headers = {"Authorization": f"Bearer {token}"}
+        r = await client.post(url, data={"asks": encode_asks(asks)}, headers=headers)
+        return TransportResponse(r.status_code, r.headers, r.content)
+
+
+# ── Cassettes ──────────────────────────────────────────────────────────────────
+
+class Cassette:
+    """
+    Recorded exchanges, one dict each:
+
+        {"endpoint": "read", "asks": {...}, "status": 200,
+         "headers": {"x-rate-limit-remaining": "231", ...},
+         "body": "{...}", "latency": 0.412, "at": 12.7, "failure": null}
+
+    at is seconds since recording started. A body that isn't UTF-8 is kept
+    as body_b64. failure is "timeout", "proxy", "connect" or "error" for an
+    exchange that got no HTTP response (status, headers and body are then
+    null).
+
+    With a path, new exchanges are appended to the file as JSON lines as
+    they are recorded, so an interrupted run keeps what it had. The writes
+    happen in order on one worker thread; flush() waits for them.
+    """
+
+    def __init__(self, path: str | Path | None = None, interactions: list[dict] | None = None):
+        self.path = Path(path) if path is not None else None
+        self.interactions: list[dict] = list(interactions or [])
+        self._lock    = threading.Lock()
+        self._writer: ThreadPoolExecutor | None = None
+        self._pending: Future | None = None
+
+    @classmethod
+    def load(cls, path: str | Path) -> Cassette:
+        """Read a cassette file. New exchanges recorded into it are appended."""
+        interactions = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = HFCodec.loads(line)
+                if "hfapi_cassette" in entry:
+                    if entry["hfapi_cassette"] > CASSETTE_VERSION:
+                        raise ValueError(f"{path}: cassette version {entry['hfapi_cassette']} is newer than supported")
+                    continue
+                interactions.append(entry)
+        return cls(path, interactions)
+
+    def append(self, interaction: dict) -> None:
+        """Add an exchange; with a path it is queued for the file."""
+        with self._lock:
+            self.interactions.append(interaction)
+            if self.path is not None:
+                if self._writer is None:
+                    self._writer = ThreadPoolExecutor(1, thread_name_prefix="hfapi-cassette")
+                self._pending = self._writer.submit(self._write, self.path, interaction)
+
+    @staticmethod
+    def _write(path: Path, interaction: dict) -> None:
+        try:
+            new = not path.exists() or path.stat().st_size == 0
+            with open(path, "a", encoding="utf-8") as f:
+                if new:
+                    f.write(HFCodec.dumps({"hfapi_cassette": CASSETTE_VERSION, "created": time.time()}) + "\n")
+                f.write(HFCodec.dumps(interaction) + "\n")
+        except OSError as e:
+            log.warning(f"Could not record HF /{interaction.get('endpoint')} exchange: {e}")
+
+    def flush(self) -> None:
+        """Wait until every exchange appended so far is in the file."""
+        pending = self._pending
+        if pending is not None:
+            pending.result()
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Write every exchange to path (default: the cassette's own path), replacing it."""
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("Cassette has no path to save to")
+        self.flush()
+        with self._lock, open(path, "w", encoding="utf-8") as f:
+            f.write(HFCodec.dumps({"hfapi_cassette": CASSETTE_VERSION, "created": time.time()}) + "\n")
+            for interaction in self.interactions:
+                f.write(HFCodec.dumps(interaction) + "\n")
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def __repr__(self) -> str:
+        return f"Cassette({str(self.path) if self.path else 'memory'}, exchanges={len(self.interactions)})"
+
+
+def _endpoint(url: str) -> str:
+    return url.rsplit("/", 1)[-1]
+
+
+def _failure_kind(exc: BaseException) -> str:
+    if isinstance(exc, httpx.ProxyError):
+        return "proxy"
+    if isinstance(exc, httpx.ConnectError):
+        return "connect"
+    return "error"
+
+
+# ── Recording ──────────────────────────────────────────────────────────────────
+
+class RecordingTransport:
+    """
+    Pass every call through to inner (default HttpxTransport) and record the
+    exchange in cassette.
+    """
+
+    live = True
+
+    def __init__(self, cassette: Cassette, inner: Transport | None = None):
+        self.cassette = cassette
+        self.inner    = inner or HttpxTransport()
+        self._started = time.monotonic()
+
+    def _record(self, url: str, asks: dict, started: float, **outcome) -> None:
+        entry = {
+            "endpoint": _endpoint(url),
+            "asks":     HFCodec.loads(encode_asks(asks)),
+            "status":   None,
+            "headers":  None,
+            "body":     None,
+            "latency":  round(time.monotonic() - started, 6),
+            "at":       round(started - self._started, 6),
+            "failure":  None,
+        }
+        entry.update(outcome)
+        self.cassette.append(entry)
+
+    async def post(self, url, token, asks, proxy, options) -> TransportResponse:
+        started = time.monotonic()
+        try:
+            r = await self.inner.post(url, token, asks, proxy, options)
+        except asyncio.CancelledError:
+            # Timed out (or a hedge that lost) — replayed as a timeout
+            self._record(url, asks, started, failure="timeout")
+            raise
+        except Exception as e:
+            self._record(url, asks, started, failure=_failure_kind(e), error=str(e))
+            raise
+
+        headers = {k: v for k, v in r.headers.items() if k.lower() not in _SKIP_HEADERS}
+        try:
+            body = {"body": r.content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"body_b64": base64.b64encode(r.content).decode("ascii")}
+        self._record(url, asks, started, status=r.status, headers=headers, **body)
+        return r
+
+
+# ── Replay ─────────────────────────────────────────────────────────────────────
+
+class ReplayTransport:
+    """
+    Answer calls from a cassette without touching the network.
+
+    Args:
+        cassette:   Recorded exchanges (Cassette.load(path)).
+        time_scale: Multiplier on the recorded latency of each answer.
+                    1.0 replays the original timing, 0 answers at once.
+    """
+
+    live = False
+
+    def __init__(self, cassette: Cassette, time_scale: float = 1.0):
+        if time_scale < 0:
+            raise ValueError("time_scale must be >= 0")
+        self.cassette   = cassette
+        self.time_scale = time_scale
+        self._exchanges: dict[tuple[str, str], list[dict]] = defaultdict(list)
+        self._next:      dict[tuple[str, str], int] = defaultdict(int)
+        self._stats = {"served": 0, "misses": 0, "repeats": 0}
+        for entry in cassette.interactions:
+            self._exchanges[(entry["endpoint"], HFCodec.canonical(entry["asks"]))].append(entry)
+
+    def _take(self, key: tuple[str, str]) -> dict:
+        exchanges = self._exchanges.get(key)
+        if not exchanges:
+            self._stats["misses"] += 1
+            raise CassetteMiss(f"no recorded exchange for /{key[0]} {key[1][:200]}")
+        i = self._next[key]
+        if i >= len(exchanges):
+            self._stats["repeats"] += 1
+            i = len(exchanges) - 1
+        self._next[key] = i + 1
+        self._stats["served"] += 1
+        return exchanges[i]
+
+    async def post(self, url, token, asks, proxy, options) -> TransportResponse:
+        entry = self._take((_endpoint(url), canonical_asks(asks)))
+        delay = (entry.get("latency") or 0.0) * self.time_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        failure = entry.get("failure")
+        if failure == "timeout":
+            raise asyncio.TimeoutError()
+        if failure == "proxy":
+            raise httpx.ProxyError(entry.get("error") or "recorded proxy error")
+        if failure == "connect":
+            raise httpx.ConnectError(entry.get("error") or "recorded connect error")
+        if failure is not None:
+            raise RuntimeError(entry.get("error") or "recorded transport error")
+
+        if "body_b64" in entry:
+            content = base64.b64decode(entry["body_b64"])
+        else:
+            content = (entry.get("body") or "").encode("utf-8")
+        return TransportResponse(entry["status"], httpx.Headers(entry.get("headers") or {}), content)
+
+    def rewind(self) -> None:
+        """Start answering every request from its first recorded exchange again."""
+        self._next.clear()
+        self._stats = {"served": 0, "misses": 0, "repeats": 0}
+
+    def stats(self) -> dict:
+        """{"served": n, "misses": n, "repeats": n} since creation or rewind()."""
+        return dict(self._stats)
+
+    def __repr__(self) -> str:
+        return f"ReplayTransport({self.cassette!r}, time_scale={self.time_scale})"
+
+
+# ── Active transport ───────────────────────────────────────────────────────────
+
+_DEFAULT   = HttpxTransport()
+_transport: Transport = _DEFAULT
+
+
+def get_transport() -> Transport:
+    return _transport
+
+
+def set_transport(transport: Transport | None) -> None:
+    """Route every HFClient call through transport. None restores HttpxTransport."""
+    global _transport
+    _transport = transport if transport is not None else _DEFAULT
+    log.info(f"HF transport: {type(_transport).__name__}")
+
+
+@contextmanager
+def use_transport(transport: Transport):
+    """Route HFClient calls made inside the block through transport."""
+    previous = _transport
+    set_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_transport(previous)
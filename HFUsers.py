@@ -10,20 +10,15 @@ AVATAR URL NOTE:
     Use normalize_avatar_url() for this — it handles the None/empty case too.
 """
 
+import asyncio
+
+from HFBatch import ID_LIMITS
 from HFClient import HFClient
+from HFFields import Fields, project
 
 _HF_BASE = "https://hackforums.net"
 
-_FIELDS = {
-    "uid": True, "username": True, "usergroup": True,
-    "displaygroup": True, "additionalgroups": True,
-    "postnum": True, "awards": True, "myps": True,
-    "threadnum": True, "avatar": True, "avatardimensions": True,
-    "avatartype": True, "usertitle": True, "website": True,
-    "timeonline": True, "reputation": True, "referrals": True,
-}
-
-_MAX_UIDS_PER_REQUEST = 20
+_MAX_UIDS_PER_REQUEST = ID_LIMITS[("users", "_uid")]
 
 
 def normalize_avatar_url(avatar: str | None) -> str | None:
@@ -66,46 +61,76 @@ class HFUsers(HFClient):
     Note on byte balance:
         The field is 'myps' here (not 'bytes' as in the /me endpoint).
         These are two different field names for the same data.
+
+    Every method has an async twin prefixed with "a" (aget, aget_many, ...).
+    get() and get_many() take fields= ("minimal", "summary", "full", a list
+    of field names or an asks dict). See HFFields.
     """
 
     # Expose as a static method for convenience
     normalize_avatar_url = staticmethod(normalize_avatar_url)
 
-    def get(self, uid: int) -> dict | None:
-        """Get a user's profile by UID."""
-        users = self.get_many([uid])
+    async def aget(self, uid: int, fields: Fields = None) -> dict | None:
+        """Async version of get()."""
+        users = await self.aget_many([uid], fields)
         return users[0] if users else None
 
-    def get_many(self, uids: list[int]) -> list[dict]:
-        """
-        Get profiles for multiple users. Auto-chunks lists > 20 UIDs
-        (the API silently returns partial results above that limit).
-        """
+    def get(self, uid: int, fields: Fields = None) -> dict | None:
+        """Get a user's profile by UID."""
+        return self._run_sync(self.aget(uid, fields))
+
+    async def aget_many(self, uids: list[int], fields: Fields = None) -> list[dict]:
+        """Async version of get_many()."""
         if not uids:
             return []
+        ask = project("users", fields)
         if len(uids) <= _MAX_UIDS_PER_REQUEST:
-            data = self.read_sync({"users": {"_uid": uids, **_FIELDS}})
+            data = await self.read({"users": {"_uid": uids, **ask}})
             return self._unwrap(data, "users")
-        results = []
-        for i in range(0, len(uids), _MAX_UIDS_PER_REQUEST):
-            chunk = uids[i : i + _MAX_UIDS_PER_REQUEST]
-            data  = self.read_sync({"users": {"_uid": chunk, **_FIELDS}})
-            results.extend(self._unwrap(data, "users"))
-        return results
+        chunks = [uids[i : i + _MAX_UIDS_PER_REQUEST] for i in range(0, len(uids), _MAX_UIDS_PER_REQUEST)]
+        pages  = await asyncio.gather(*(self.read({"users": {"_uid": chunk, **ask}}) for chunk in chunks))
+        return [user for data in pages for user in self._unwrap(data, "users")]
 
-    def get_username(self, uid: int) -> str | None:
-        user = self.get(uid)
+    def get_many(self, uids: list[int], fields: Fields = None) -> list[dict]:
+        """
+        Get profiles for multiple users. Lists > 20 UIDs are split into
+        chunks (the API silently returns partial results above that limit),
+        requested together and paced by the rate limiter like any read.
+        """
+        return self._run_sync(self.aget_many(uids, fields))
+
+    async def aget_username(self, uid: int) -> str | None:
+        """Async version of get_username()."""
+        user = await self.aget(uid, fields="minimal")
         return user.get("username") if user else None
 
+    def get_username(self, uid: int) -> str | None:
+        return self._run_sync(self.aget_username(uid))
+
+    async def aget_bytes(self, uid: int) -> float:
+        """Async version of get_bytes()."""
+        user = await self.aget(uid, fields=["uid", "myps"])
+        return float(user.get("myps", 0)) if user else 0.0
+
     def get_bytes(self, uid: int) -> float:
         """Returns byte balance (field is 'myps' from the users endpoint)."""
-        user = self.get(uid)
-        return float(user.get("myps", 0)) if user else 0.0
+        return self._run_sync(self.aget_bytes(uid))
 
-    def get_reputation(self, uid: int) -> int:
-        user = self.get(uid)
+    async def aget_reputation(self, uid: int) -> int:
+        """Async version of get_reputation()."""
+        user = await self.aget(uid, fields=["uid", "reputation"])
         return int(float(user.get("reputation", 0))) if user else 0
 
+    def get_reputation(self, uid: int) -> int:
+        return self._run_sync(self.aget_reputation(uid))
+
+    async def aget_avatar_url(self, uid: int) -> str | None:
+        """Async version of get_avatar_url()."""
+        user = await self.aget(uid, fields=["uid", "avatar"])
+        if not user:
+            return None
+        return normalize_avatar_url(user.get("avatar"))
+
     def get_avatar_url(self, uid: int) -> str | None:
         """
         Get a user's avatar as an absolute URL.
@@ -115,12 +140,13 @@ class HFUsers(HFClient):
         Returns:
             Absolute avatar URL or None if no avatar is set or user not found.
         """
-        user = self.get(uid)
-        if not user:
-            return None
-        return normalize_avatar_url(user.get("avatar"))
+        return self._run_sync(self.aget_avatar_url(uid))
+
+    async def aget_usernames_map(self, uids: list[int]) -> dict[int, str]:
+        """Async version of get_usernames_map()."""
+        users = await self.aget_many(uids, fields="minimal")
+        return {int(u["uid"]): u["username"] for u in users if u.get("uid") and u.get("username")}
 
     def get_usernames_map(self, uids: list[int]) -> dict[int, str]:
         """Get a UID → username mapping for a list of UIDs."""
-        users = self.get_many(uids)
-        return {int(u["uid"]): u["username"] for u in users if u.get("uid") and u.get("username")}
+        return self._run_sync(self.aget_usernames_map(uids))
@@ -16,6 +16,9 @@ from dataclasses import dataclass, field
 from typing import Callable, Awaitable
 
 from HFClient import HFClient
+from HFLatency import hedged_reads
+from HFQuery import HFQuery
+from HFRateLimiter import PRIORITY_BACKGROUND, request_priority
 
 log = logging.getLogger("hfapi.watcher")
 
@@ -24,6 +27,45 @@ Callback = Callable[[dict], Awaitable[None]]
 # Views must jump this much in a single poll cycle to fire thread_view_spike.
 _VIEW_SPIKE_THRESHOLD = 500
 
+# ── Prepared poll queries ──────────────────────────────────────────────────────
+# Every poll sends one of these with only the ids/page changing, so the asks
+# JSON is built from a cached template (see HFQuery).
+
+_THREAD_META = HFQuery(
+    "threads",
+    ["tid", "subject", "lastpost", "lastposteruid", "lastposter",
+     "numreplies", "views", "bestpid", "closed"],
+    params=("_tid",),
+)
+_THREAD_NEW_POSTS = HFQuery(
+    "posts", ["pid", "uid", "username", "dateline", "message"],
+    params=("_tid", "_page"), _perpage=10,
+)
+_FORUM_THREADS = HFQuery(
+    "threads", ["tid", "uid", "subject", "dateline", "lastpost", "username", "firstpost"],
+    params=("_fid",), _page=1, _perpage=20,
+)
+_USER_THREADS = HFQuery(
+    "threads", ["tid", "subject", "dateline"],
+    params=("_uid",), _page=1, _perpage=20,
+)
+_USER_POSTS = HFQuery(
+    "posts", ["pid", "tid", "subject", "dateline", "message"],
+    params=("_uid",), _page=1, _perpage=20,
+)
+_KEYWORD_THREADS = HFQuery(
+    "threads", ["tid", "subject", "dateline"],
+    params=("_fid",), _page=1, _perpage=20,
+)
+_KEYWORD_POSTS = HFQuery(
+    "posts", ["pid", "message", "dateline"],
+    params=("_tid",), _page=1, _perpage=5,
+)
+_BYTES_RECEIVED = HFQuery(
+    "bytes", ["id", "amount", "reason", "dateline", "from"],
+    params=("_to",), _perpage=10,
+)
+
 
 # ── Watch job dataclasses ──────────────────────────────────────────────────────
 
@@ -207,17 +249,26 @@ class HFWatcher:
             f"{len(self._keyword_watches)} keyword(s), "
             f"{len(self._bytes_watches)} bytes watcher(s)"
         )
+        # Open connections now so the first round of polls doesn't queue
+        # behind TLS handshakes
+        watches = (len(self._thread_watches) + len(self._forum_watches) + len(self._user_watches)
+                   + len(self._keyword_watches) + len(self._bytes_watches))
+        await self._hf.warm(min(max(watches, 1), 8))
+
+        # Poll tasks copy the current context when created, so every watcher
+        # request runs in the background rate limiter lane.
         tasks = []
-        for w in self._thread_watches:
-            tasks.append(asyncio.create_task(self._thread_loop(w), name=f"watch_thread_{w.tid}"))
-        for w in self._forum_watches:
-            tasks.append(asyncio.create_task(self._forum_loop(w), name=f"watch_forum_{w.fid}"))
-        for w in self._user_watches:
-            tasks.append(asyncio.create_task(self._user_loop(w), name=f"watch_user_{w.uid}"))
-        for w in self._keyword_watches:
-            tasks.append(asyncio.create_task(self._keyword_loop(w), name="watch_keyword"))
-        for w in self._bytes_watches:
-            tasks.append(asyncio.create_task(self._bytes_loop(w), name="watch_bytes"))
+        with request_priority(PRIORITY_BACKGROUND):
+            for w in self._thread_watches:
+                tasks.append(asyncio.create_task(self._thread_loop(w), name=f"watch_thread_{w.tid}"))
+            for w in self._forum_watches:
+                tasks.append(asyncio.create_task(self._forum_loop(w), name=f"watch_forum_{w.fid}"))
+            for w in self._user_watches:
+                tasks.append(asyncio.create_task(self._user_loop(w), name=f"watch_user_{w.uid}"))
+            for w in self._keyword_watches:
+                tasks.append(asyncio.create_task(self._keyword_loop(w), name="watch_keyword"))
+            for w in self._bytes_watches:
+                tasks.append(asyncio.create_task(self._bytes_loop(w), name="watch_bytes"))
 
         try:
             await asyncio.gather(*tasks)
@@ -241,20 +292,9 @@ class HFWatcher:
             await asyncio.sleep(w.interval)
 
     async def _poll_thread(self, w: _ThreadWatch) -> None:
-        meta = await self._hf.read({
-            "threads": {
-                "_tid":          [w.tid],
-                "tid":           True,
-                "subject":       True,
-                "lastpost":      True,
-                "lastposteruid": True,
-                "lastposter":    True,
-                "numreplies":    True,
-                "views":         True,
-                "bestpid":       True,
-                "closed":        True,
-            }
-        })
+        # Notification latency hangs on this call — hedge its slow tail
+        with hedged_reads():
+            meta = await self._hf.read(_THREAD_META.bind(_tid=[w.tid]))
 
         if not meta or "threads" not in meta:
             return
@@ -340,18 +380,7 @@ class HFWatcher:
 
         # ── Fetch newest posts ────────────────────────────────────────────────
         last_page = max(1, (numreplies + 1 + 9) // 10)
-        post_data = await self._hf.read({
-            "posts": {
-                "_tid":     [w.tid],
-                "_page":    last_page,
-                "_perpage": 10,
-                "pid":      True,
-                "uid":      True,
-                "username": True,
-                "dateline": True,
-                "message":  True,
-            }
-        })
+        post_data = await self._hf.read(_THREAD_NEW_POSTS.bind(_tid=[w.tid], _page=last_page))
 
         # BUG FIX: save old_last_post BEFORE updating w._last_post.
         # Previously w._last_post was updated first, making the dateline
@@ -420,20 +449,7 @@ class HFWatcher:
             await asyncio.sleep(w.interval)
 
     async def _poll_forum(self, w: _ForumWatch) -> None:
-        data = await self._hf.read({
-            "threads": {
-                "_fid":      [w.fid],
-                "_page":     1,
-                "_perpage":  20,
-                "tid":       True,
-                "uid":       True,
-                "subject":   True,
-                "dateline":  True,
-                "lastpost":  True,
-                "username":  True,
-                "firstpost": True,
-            }
-        })
+        data = await self._hf.read(_FORUM_THREADS.bind(_fid=[w.fid]))
         if not data or "threads" not in data:
             return
 
@@ -478,16 +494,7 @@ class HFWatcher:
             await asyncio.sleep(w.interval)
 
     async def _poll_user(self, w: _UserWatch) -> None:
-        thread_data = await self._hf.read({
-            "threads": {
-                "_uid":     [w.uid],
-                "_page":    1,
-                "_perpage": 20,
-                "tid":      True,
-                "subject":  True,
-                "dateline": True,
-            }
-        })
+        thread_data = await self._hf.read(_USER_THREADS.bind(_uid=[w.uid]))
         if thread_data and "threads" in thread_data:
             rows = thread_data["threads"]
             if isinstance(rows, dict):
@@ -512,18 +519,7 @@ class HFWatcher:
                 })
 
         if w.mode == "all":
-            post_data = await self._hf.read({
-                "posts": {
-                    "_uid":     [w.uid],
-                    "_page":    1,
-                    "_perpage": 20,
-                    "pid":      True,
-                    "tid":      True,
-                    "subject":  True,
-                    "dateline": True,
-                    "message":  True,
-                }
-            })
+            post_data = await self._hf.read(_USER_POSTS.bind(_uid=[w.uid]))
             if post_data and "posts" in post_data:
                 posts = post_data["posts"]
                 if isinstance(posts, dict):
@@ -569,16 +565,7 @@ class HFWatcher:
     async def _poll_keyword(self, w: _KeywordWatch) -> None:
         fids = w.fids or []
         for fid in fids:
-            data = await self._hf.read({
-                "threads": {
-                    "_fid":     [fid],
-                    "_page":    1,
-                    "_perpage": 20,
-                    "tid":      True,
-                    "subject":  True,
-                    "dateline": True,
-                }
-            })
+            data = await self._hf.read(_KEYWORD_THREADS.bind(_fid=[fid]))
             if not data or "threads" not in data:
                 continue
 
@@ -595,16 +582,7 @@ class HFWatcher:
                 if tid in w._seen_tids:
                     continue
 
-                post_data = await self._hf.read({
-                    "posts": {
-                        "_tid":     [tid],
-                        "_page":    1,
-                        "_perpage": 5,
-                        "pid":      True,
-                        "message":  True,
-                        "dateline": True,
-                    }
-                })
+                post_data = await self._hf.read(_KEYWORD_POSTS.bind(_tid=[tid]))
                 if not post_data or "posts" not in post_data:
                     continue
 
@@ -658,17 +636,7 @@ class HFWatcher:
                 return
             w._my_uid = uid
 
-        data = await self._hf.read({
-            "bytes": {
-                "_to":      [w._my_uid],
-                "_perpage": 10,
-                "id":       True,
-                "amount":   True,
-                "reason":   True,
-                "dateline": True,
-                "from":     True,
-            }
-        })
+        data = await self._hf.read(_BYTES_RECEIVED.bind(_to=[w._my_uid]))
         if not data or "bytes" not in data:
             return
 
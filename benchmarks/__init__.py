@@ -0,0 +1,26 @@
+"""
+Offline micro-benchmarks for the CPU-bound hot paths of the wrapper.
+
+Nothing here touches the network. The suite times:
+
+    bbcode.*    HFBBCode to_text / to_html / preview / extract_* over a
+                corpus of generated posts (HFForumGen, fixed seed)
+    watcher.*   HFWatcher._strip_bbcode over the same corpus
+    cache.*     HFCache get / set / LRU eviction at 10k, 100k and 1M entries
+    events.*    HFEventStore add_if_new / filter_new / prune on a temp db
+    batch.*     HFBatch ask construction and HFBatchResult parsing of
+                simulator responses
+
+Run from the repository root:
+
+    python -m benchmarks                     # full run, compare to baseline.json
+    python -m benchmarks --quick             # smaller sizes, fewer runs
+    python -m benchmarks -k cache            # only cases whose name contains "cache"
+    python -m benchmarks --save-baseline     # record this run as the new baseline
+
+Each run writes its results to benchmarks/results/<timestamp>.json and
+compares every case against benchmarks/baseline.json. A case more than
+--tolerance slower than its baseline is a regression, and the exit status
+is 1. Baselines are machine-specific: record one on the machine you compare
+on.
+"""
@@ -0,0 +1,91 @@
+"""
+python -m benchmarks [--quick] [-k PATTERN] [--runs N] [--tolerance F]
+                     [--baseline PATH] [--out PATH] [--save-baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from benchmarks import cases  # noqa: F401  (registers the cases)
+from benchmarks.harness import (
+    compare, env_mismatch, environment, measure, progress, read_results,
+    report_line, select, write_results,
+)
+
+HERE = Path(__file__).resolve().parent
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m benchmarks", description="Offline micro-benchmarks for hf-api.")
+    p.add_argument("--quick", action="store_true", help="skip the 1M-entry cases and do 3 runs per case")
+    p.add_argument("-k", dest="patterns", action="append", metavar="PATTERN",
+                   help="only cases whose name contains PATTERN (repeatable)")
+    p.add_argument("--runs", type=int, default=None, help="timed runs per case (default 7, 3 with --quick)")
+    p.add_argument("--tolerance", type=float, default=0.25,
+                   help="slowdown vs baseline that counts as a regression (default 0.25 = 25%%)")
+    p.add_argument("--baseline", type=Path, default=HERE / "baseline.json")
+    p.add_argument("--out", type=Path, default=None,
+                   help="results file (default benchmarks/results/<timestamp>.json)")
+    p.add_argument("--save-baseline", action="store_true", help="write this run to the baseline file")
+    p.add_argument("--list", action="store_true", help="list the selected cases and exit")
+    args = p.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    selected = select(quick=args.quick, patterns=args.patterns)
+    if args.list:
+        for c in selected:
+            print(c.name)
+        return 0
+    if not selected:
+        progress("No benchmark cases selected.")
+        return 2
+
+    runs = args.runs or (3 if args.quick else 7)
+    env  = environment(args.quick)
+
+    baseline_doc = None if args.save_baseline else read_results(args.baseline)
+    baseline     = baseline_doc["results"] if baseline_doc else {}
+    if baseline_doc:
+        for line in env_mismatch(env, baseline_doc.get("env", {})):
+            progress(f"warning: baseline environment differs — {line}")
+    elif not args.save_baseline:
+        progress(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+
+    results: dict[str, dict] = {}
+    for c in selected:
+        results[c.name] = measure(c, runs)
+        diff = compare({c.name: results[c.name]}, baseline, args.tolerance)[c.name] if baseline else None
+        print(report_line(c.name, results[c.name], diff), flush=True)
+
+    out = args.out or HERE / "results" / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    write_results(out, env, results)
+    progress(f"Results written to {out}")
+
+    if args.save_baseline:
+        previous = read_results(args.baseline)
+        merged   = {**(previous["results"] if previous else {}), **results}
+        write_results(args.baseline, env, merged)
+        progress(f"Baseline saved to {args.baseline} ({len(results)} case(s) updated)")
+        return 0
+
+    if not baseline:
+        return 0
+    diffs   = compare(results, baseline, args.tolerance)
+    slower  = sorted(name for name, d in diffs.items() if d["verdict"] == "slower")
+    faster  = sorted(name for name, d in diffs.items() if d["verdict"] == "faster")
+    if faster:
+        progress(f"Faster than baseline: {', '.join(faster)}")
+    if slower:
+        progress(f"REGRESSION (> {args.tolerance:.0%} slower): {', '.join(slower)}")
+        return 1
+    progress(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
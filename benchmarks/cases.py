@@ -0,0 +1,230 @@
+"""
+The benchmark cases. Importing this module registers them with the harness.
+
+One op is one call of the code under test: one post rendered, one cache
+get, one add_if_new, one batch built. ns/op is therefore comparable
+across runs with different sizes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+import HFCodec
+from HFBatch import HFBatch, HFBatchResult, split_asks
+from HFBBCode import HFBBCode
+from HFCache import HFCache
+from HFEventStore import HFEventStore
+from HFWatcher import _strip_bbcode
+
+from benchmarks import corpus
+from benchmarks.harness import case
+
+# ── BBCode ─────────────────────────────────────────────────────────────────────
+
+def _per_post(fn):
+    def setup():
+        posts = corpus.posts()
+
+        def run():
+            for text in posts:
+                fn(text)
+        return run, len(posts)
+    return setup
+
+
+for _name, _fn in (
+    ("bbcode.to_text",          HFBBCode.to_text),
+    ("bbcode.to_html",          HFBBCode.to_html),
+    ("bbcode.preview",          HFBBCode.preview),
+    ("bbcode.extract_mentions", HFBBCode.extract_mentions),
+    ("bbcode.extract_quotes",   HFBBCode.extract_quotes),
+    ("bbcode.extract_links",    HFBBCode.extract_links),
+    ("watcher.strip_bbcode",    _strip_bbcode),
+):
+    case(_name)(_per_post(_fn))
+
+
+# ── HFCache ────────────────────────────────────────────────────────────────────
+
+CACHE_SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+CACHE_GETS  = 200_000
+
+
+def _filled(size: int, maxsize: int = 0) -> HFCache:
+    cache = HFCache(ttl=3600, maxsize=maxsize)
+    row   = {"uid": 0, "username": "bench", "myps": "0"}
+    for uid in range(size):
+        cache.set("users", uid, row)
+    return cache
+
+
+def _cache_cases(label: str, size: int) -> None:
+    full_only = size > 100_000
+
+    @case(f"cache.set[{label}]", fresh=True, full_only=full_only)
+    def _set():
+        cache = HFCache(ttl=3600)
+        row   = {"uid": 0, "username": "bench", "myps": "0"}
+
+        def run():
+            for uid in range(size):
+                cache.set("users", uid, row)
+        return run, size
+
+    @case(f"cache.get[{label}]", full_only=full_only)
+    def _get():
+        cache = _filled(size)
+        rng   = random.Random(size)
+        # One in ten lookups misses, like a watcher resolving new posters
+        keys  = [rng.randrange(size + size // 9) for _ in range(CACHE_GETS)]
+
+        def run():
+            for uid in keys:
+                cache.get("users", uid)
+        return run, len(keys)
+
+    @case(f"cache.evict[{label}]", full_only=full_only)
+    def _evict():
+        cache = _filled(size, maxsize=size)
+        fresh = itertools.count(size)
+        ops   = max(5, 2_000_000 // size)
+        row   = {"uid": 0}
+
+        def run():
+            for _ in range(ops):
+                cache.set("users", next(fresh), row)   # every set evicts one entry
+        return run, ops
+
+
+for _label, _size in CACHE_SIZES.items():
+    _cache_cases(_label, _size)
+
+
+# ── HFEventStore ───────────────────────────────────────────────────────────────
+
+_tmpdir = Path(tempfile.mkdtemp(prefix="hfapi-bench-"))
+_stores: list[HFEventStore] = []
+_serial = itertools.count()
+
+
+@atexit.register
+def _cleanup() -> None:
+    for store in _stores:
+        store.close()
+    shutil.rmtree(_tmpdir, ignore_errors=True)
+
+
+def _store() -> HFEventStore:
+    store = HFEventStore(str(_tmpdir / f"events-{next(_serial)}.db"))
+    _stores.append(store)
+    return store
+
+
+@case("events.add_if_new", fresh=True)
+def _add_if_new():
+    store = _store()
+    store.add_many("thread_replies", "tid_1", list(range(0, 1_000, 2)))
+    # Half already seen, half new — a poll that overlaps the previous page
+    ids = list(range(1_000))
+
+    def run():
+        for pid in ids:
+            store.add_if_new("thread_replies", "tid_1", pid)
+    return run, len(ids)
+
+
+@case("events.filter_new")
+def _filter_new():
+    store = _store()
+    for tid in range(100):
+        store.add_many("thread_replies", f"tid_{tid}", list(range(tid * 1_000, tid * 1_000 + 500)))
+    rng = random.Random(1)
+    # A 20-post page per poll, mostly seen with a few new ids at the end
+    polls = []
+    for _ in range(2_000):
+        tid   = rng.randrange(100)
+        start = tid * 1_000 + rng.randrange(480, 500)
+        polls.append((f"tid_{tid}", list(range(start, start + 20))))
+
+    def run():
+        for key, ids in polls:
+            store.filter_new("thread_replies", key, ids)
+    return run, len(polls)
+
+
+@case("events.prune", fresh=True)
+def _prune():
+    store = _store()
+    keys  = [f"tid_{tid}" for tid in range(50)]
+    for key in keys:
+        store.add_many("thread_replies", key, list(range(2_000)))
+
+    def run():
+        for key in keys:
+            store.prune("thread_replies", key, keep=500)
+    return run, len(keys)
+
+
+# ── HFBatch ────────────────────────────────────────────────────────────────────
+
+@case("batch.build")
+def _build():
+    uids = list(range(1, 21))
+    tids = list(range(1, 31))
+    ops  = 20_000
+
+    def run():
+        for _ in range(ops):
+            (HFBatch(None)
+             .me()
+             .users(uids)
+             .threads(tids=tids)
+             .posts(tid=6083735, perpage=20)
+             .bytes_received(uid=761578, perpage=20))
+    return run, ops
+
+
+@case("batch.build_fields")
+def _build_fields():
+    uids = list(range(1, 21))
+    tids = list(range(1, 31))
+    ops  = 20_000
+
+    def run():
+        for _ in range(ops):
+            (HFBatch(None)
+             .me(fields="minimal")
+             .users(uids, fields="summary")
+             .threads(tids=tids, fields=["tid", "lastpost", "numreplies"])
+             .posts(tid=6083735, fields="minimal"))
+    return run, ops
+
+
+@case("batch.split")
+def _split():
+    asks = (HFBatch(None)
+            .me(fields="minimal")
+            .users(list(range(1, 501)), fields="summary")
+            .threads(tids=list(range(1, 91)), fields="minimal"))._asks
+    ops  = 2_000
+
+    def run():
+        for _ in range(ops):
+            split_asks(asks)
+    return run, ops
+
+
+@case("batch.result")
+def _result():
+    bodies = corpus.batch_bodies() * 200
+
+    def run():
+        for body in bodies:
+            HFBatchResult(HFCodec.loads(body))
+    return run, len(bodies)
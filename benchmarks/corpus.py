@@ -0,0 +1,57 @@
+"""
+Fixed inputs for the benchmark cases: a generated forum (HFForumGen, fixed
+seed and clock) and real-shaped /read responses answered from it by the
+simulator's query engine. Built once per process.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+import HFCodec
+from HFBatch import HFBatch
+from HFForumGen import ForumGenerator, GenConfig, SimClock
+from HFSimulator import SimDataset, _Engine
+
+SEED  = 20_240_601
+EPOCH = 1_717_200_000   # fixed "now" so datelines (and body sizes) never change
+
+CORPUS_POSTS = 5_000
+
+
+@cache
+def forum() -> SimDataset:
+    clock = SimClock(EPOCH)
+    return ForumGenerator(GenConfig.scaled(CORPUS_POSTS), seed=SEED, clock=clock).build()
+
+
+@cache
+def posts() -> tuple[str, ...]:
+    """Every post body of the generated forum, in pid order."""
+    data = forum()
+    return tuple(data.posts[pid]["message"] for pid in sorted(data.posts))
+
+
+def batch_asks() -> dict:
+    """A typical dashboard batch: me + 20 users + 30 threads + a posts page + bytes."""
+    data = forum()
+    tid  = max(data.posts_by_thread, key=lambda t: len(data.posts_by_thread[t]))
+    return dict(
+        HFBatch(None)
+        .me()
+        .users(list(range(1, 21)))
+        .threads(tids=list(range(1, 31)))
+        .posts(tid=tid, perpage=20)
+        .bytes_received(uid=1, perpage=20)
+        ._asks
+    )
+
+
+@cache
+def batch_bodies() -> tuple[bytes, ...]:
+    """Encoded /read responses for batch_asks() and each of its resources alone."""
+    engine = _Engine(forum())
+    asks   = batch_asks()
+    bodies = [engine.read(asks, uid=1)]
+    bodies += [engine.read({k: v}, uid=1) for k, v in asks.items()]
+    return tuple(HFCodec.dumps(b).encode("utf-8") for b in bodies)
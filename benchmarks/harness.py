@@ -0,0 +1,178 @@
+"""
+Case registry, timing and baseline comparison for the benchmark suite.
+
+A case is a setup function registered with @case. Setup builds whatever the
+case needs and returns (fn, ops): fn does ops operations and is the only
+part that is timed. Setup runs once per case, or before every run for
+fresh=True cases whose fn uses up its input (filling an empty cache,
+pruning a store).
+
+Each case is run several times and scored on its fastest run, which is the
+least noisy estimate of what the code costs on this machine.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import HFCodec
+
+Setup = Callable[[], tuple[Callable[[], Any], int]]
+
+RESULTS_VERSION = 1
+
+
+@dataclass
+class Case:
+    name:      str
+    setup:     Setup
+    fresh:     bool = False   # run setup again before every timed run
+    full_only: bool = False   # skipped with --quick
+
+    @property
+    def group(self) -> str:
+        return self.name.split(".", 1)[0]
+
+
+_CASES: list[Case] = []
+
+
+def case(name: str, *, fresh: bool = False, full_only: bool = False) -> Callable[[Setup], Setup]:
+    """Register a setup function as a benchmark case."""
+    def register(setup: Setup) -> Setup:
+        if any(c.name == name for c in _CASES):
+            raise ValueError(f"Duplicate benchmark case '{name}'")
+        _CASES.append(Case(name, setup, fresh, full_only))
+        return setup
+    return register
+
+
+def select(quick: bool = False, patterns: list[str] | None = None) -> list[Case]:
+    """Registered cases, minus full-only ones in quick mode, filtered by substring."""
+    out = []
+    for c in _CASES:
+        if quick and c.full_only:
+            continue
+        if patterns and not any(p in c.name for p in patterns):
+            continue
+        out.append(c)
+    return out
+
+
+# ── Timing ─────────────────────────────────────────────────────────────────────
+
+def measure(c: Case, runs: int) -> dict:
+    """Time one case. Returns its result entry."""
+    fn, ops = c.setup()
+    times = []
+    for i in range(runs):
+        if c.fresh and i:
+            fn, ops = c.setup()
+        gc.collect()
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    best = min(times)
+    return {
+        "ops":         ops,
+        "runs":        runs,
+        "best_s":      round(best, 6),
+        "median_s":    round(statistics.median(times), 6),
+        "ns_per_op":   round(best / ops * 1e9, 1),
+        "ops_per_sec": round(ops / best, 1) if best else None,
+    }
+
+
+def environment(quick: bool) -> dict:
+    return {
+        "python":   platform.python_version(),
+        "impl":     platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine":  platform.machine(),
+        "codec":    HFCodec.get_codec().name,
+        "quick":    quick,
+        "created":  time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+# ── Results files ──────────────────────────────────────────────────────────────
+
+def write_results(path: Path, env: dict, results: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = {"hfapi_bench": RESULTS_VERSION, "env": env, "results": results}
+    path.write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def read_results(path: Path) -> dict | None:
+    """A results or baseline file, or None if there is none."""
+    try:
+        doc = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    if doc.get("hfapi_bench", 0) > RESULTS_VERSION:
+        raise ValueError(f"{path}: results version {doc['hfapi_bench']} is newer than supported")
+    return doc
+
+
+# ── Comparison ─────────────────────────────────────────────────────────────────
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> dict[str, dict]:
+    """
+    Compare ns_per_op case by case. Each entry gets a ratio (current /
+    baseline) and a verdict: "slower" beyond 1 + tolerance, "faster" below
+    1 / (1 + tolerance), otherwise "ok"; "new" for cases with no baseline.
+    """
+    out = {}
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None or not base.get("ns_per_op"):
+            out[name] = {"ratio": None, "verdict": "new"}
+            continue
+        ratio = current["ns_per_op"] / base["ns_per_op"]
+        if ratio > 1 + tolerance:
+            verdict = "slower"
+        elif ratio < 1 / (1 + tolerance):
+            verdict = "faster"
+        else:
+            verdict = "ok"
+        out[name] = {"ratio": round(ratio, 3), "verdict": verdict}
+    return out
+
+
+def env_mismatch(env: dict, base_env: dict) -> list[str]:
+    """Environment fields that differ from the baseline's (comparison is then shaky)."""
+    return [
+        f"{k}: {base_env.get(k)} → {env.get(k)}"
+        for k in ("python", "impl", "machine", "codec")
+        if base_env.get(k) != env.get(k)
+    ]
+
+
+def _fmt_ns(ns: float) -> str:
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f} ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f} µs"
+    return f"{ns:.0f} ns"
+
+
+def report_line(name: str, result: dict, diff: dict | None) -> str:
+    line = f"{name:<34} {_fmt_ns(result['ns_per_op']):>11}/op {result['ops_per_sec']:>14,.0f} op/s"
+    if diff is not None:
+        if diff["ratio"] is None:
+            line += "   (new)"
+        else:
+            line += f"   x{diff['ratio']:.2f} {diff['verdict']}"
+    return line
+
+
+def progress(text: str) -> None:
+    print(text, file=sys.stderr, flush=True)
@@ -0,0 +1,497 @@
+"""
+End-to-end HFWatcher benchmark: detection latency and API cost per event
+against a local HFSimulator, swept over the number of watches.
+
+For each N in the sweep a child process generates a forum (HFForumGen,
+fixed seed), serves it with an HFSimulator and reports every post and
+thread it creates. This process runs one HFWatcher with N watches. The mix
+is thread, user, forum and keyword watches on the hottest threads, the
+busiest users and every forum. Every callback is recorded. The simulator lives
+in its own process, so the CPU and RSS measured here are the watcher's.
+
+Phases per N:
+    seed     Start the watcher and wait until every watch has polled once.
+             First polls only record existing state.
+    measure  Live activity for --duration seconds.
+    drain    Activity stops; the watches get --drain seconds (default two
+             intervals) to pick up what's left.
+
+An event is expected when a watch's target gets new activity during
+measure:
+    thread   every reply in the thread                  (thread_reply)
+    forum    every new thread in the forum              (new_thread)
+    user     every new thread by the user               (user_thread)
+             and with --user-mode all every post too    (user_post)
+    keyword  every new post in its forums that matches  (keyword_match)
+
+Reported per N:
+    latency      p50 / p95 / p99 seconds from the row appearing in the
+                 simulator to its callback (first delivery)
+    api_calls    HTTP requests the simulator answered during measure + drain
+    calls/event  api_calls / delivered events
+    missed       expected events never delivered (also per watch kind)
+    duplicates   repeat deliveries of an event by the same watch
+    unexpected   deliveries after seeding that match no expected event —
+                 old threads bumped onto a forum's first page, pid-less
+                 fallback replies
+    backfill     deliveries during seeding, before any live activity
+    poll_errors  polls that raised (timeouts, connection errors), per kind
+    poll_rate    polls done / polls due at the configured interval — below
+                 1.0 the watcher can't keep up with its own schedule
+    cpu          CPU seconds of this process during measure + drain, and
+                 as a percentage of one core
+    rss          resident set size at the end, and growth since before
+                 the watcher was created
+
+Usage (from the repository root):
+    python -m benchmarks.watchers                           # sweep 10,100,1000,10000
+    python -m benchmarks.watchers --sweep 10,100 --duration 30 --interval 2
+    python -m benchmarks.watchers --mix thread=70,user=20,forum=5,keyword=5 --limit 240
+
+Results are printed and written to benchmarks/results/watchers-<timestamp>.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import logging
+import multiprocessing as mp
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from benchmarks.harness import environment, progress, write_results
+
+HERE = Path(__file__).resolve().parent
+
+WATCH_KINDS  = ("thread", "user", "forum", "keyword")
+DEFAULT_MIX  = {"thread": 70, "user": 20, "forum": 5, "keyword": 5}
+DEFAULT_SWEEP = (10, 100, 1_000, 10_000)
+
+# Common words of the generated posts, used as keyword watch patterns
+KEYWORDS = ("method", "escrow", "bitcoin", "script", "discord", "giveaway",
+            "tutorial", "proxy", "premium", "leak", "checker", "ebook")
+
+# Delivered event → field holding the id it is about
+_EVENT_IDS = {
+    "thread_reply":  "pid",
+    "new_thread":    "tid",
+    "user_thread":   "tid",
+    "user_post":     "pid",
+    "keyword_match": "pid",
+}
+
+
+# ── Forum process ──────────────────────────────────────────────────────────────
+
+def _serve(spec: dict, out, go, halt, done) -> None:
+    """
+    Child process: build the forum, serve it, stream created posts as
+    ("post", pid, tid, uid, fid, message, first, created_at) until done.
+    """
+    from HFForumGen import ForumGenerator, GenConfig, SimClock
+    from HFSimulator import HFSimulator, SimFaults
+
+    logging.basicConfig(level=logging.WARNING)
+    config = GenConfig.scaled(spec["posts"], live_replies=spec["replies"], live_threads=spec["new_threads"])
+    gen    = ForumGenerator(config, seed=spec["seed"], clock=SimClock())
+    data   = gen.build()
+    sim    = HFSimulator(data, hourly_limit=spec["limit"], seed=spec["seed"],
+                         faults=SimFaults(latency=spec["latency"], jitter=spec["jitter"]))
+    sim.start()
+
+    open_tids = [tid for tid, t in data.threads.items() if t["closed"] == "0"]
+    open_tids.sort(key=lambda tid: len(data.posts_by_thread[tid]), reverse=True)
+    uids = sorted(data.users, key=lambda uid: len(data.posts_by_user.get(uid, ())), reverse=True)
+    fids = [fid for fid, f in data.forums.items() if f["type"] == "f"]
+    out.put(("ready", {
+        "base_url": sim.base_url,
+        "tids":     open_tids[:spec["tids"]],
+        "uids":     uids[:spec["uids"]],
+        "fids":     fids,
+    }))
+
+    def listener(kind: str, row: dict) -> None:
+        if kind == "post":
+            post, first = row, False
+        elif kind == "thread":
+            post, first = data.posts[row["_firstpost"]], True
+        else:
+            return
+        out.put(("post", int(post["pid"]), int(post["tid"]), int(post["uid"]), int(post["fid"]),
+                 post["message"], first, time.time()))
+
+    gen.subscribe(listener)
+    go.wait()
+    before = sim.stats()
+    gen.start(speed=spec["speed"], tick=spec["tick"])
+    halt.wait()
+    gen.stop()
+    done.wait()
+    out.put(("stats", {"before": before, "after": sim.stats(), "generator": gen.stats()["events"]}))
+    sim.stop()
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+def _parse_mix(text: str) -> dict[str, int]:
+    mix = dict.fromkeys(WATCH_KINDS, 0)
+    for part in text.split(","):
+        kind, _, share = part.partition("=")
+        kind = kind.strip()
+        if kind not in mix:
+            raise argparse.ArgumentTypeError(f"unknown watch kind '{kind}' (known: {', '.join(WATCH_KINDS)})")
+        mix[kind] = int(share)
+    if sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("watch mix is empty")
+    return mix
+
+
+def _split(n: int, mix: dict[str, int]) -> dict[str, int]:
+    """n watches split by mix shares (largest remainder), at least one per kind with a share."""
+    total  = sum(mix.values())
+    exact  = {k: n * share / total for k, share in mix.items()}
+    counts = {k: int(v) for k, v in exact.items()}
+    for k in sorted(exact, key=lambda k: exact[k] - counts[k], reverse=True)[:n - sum(counts.values())]:
+        counts[k] += 1
+    if n >= sum(1 for share in mix.values() if share):
+        for k, share in mix.items():
+            if share and not counts[k]:
+                counts[max(counts, key=counts.get)] -= 1
+                counts[k] = 1
+    return counts
+
+
+def _percentile(ordered: list[float], q: float) -> float | None:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered) + 0.5)) - 1))]
+
+
+def _rss_mb() -> float | None:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        import os
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+    except ImportError:
+        return None
+
+
+# ── One sweep point ────────────────────────────────────────────────────────────
+
+async def run_point(n: int, args: argparse.Namespace) -> dict:
+    from HFClient import HFClient
+    from HFWatcher import HFWatcher
+
+    counts = _split(n, args.mix)
+    spec = {
+        "posts":       max(20_000, counts["thread"] * 12),
+        "tids":        counts["thread"],
+        "uids":        counts["user"],
+        "replies":     args.replies,
+        "new_threads": args.new_threads,
+        "speed":       args.speed,
+        "tick":        args.tick,
+        "limit":       args.limit,
+        "latency":     args.latency,
+        "jitter":      args.jitter,
+        "seed":        args.seed,
+    }
+    ctx  = mp.get_context("spawn")
+    out  = ctx.Queue()
+    go, halt, done = ctx.Event(), ctx.Event(), ctx.Event()
+    proc = ctx.Process(target=_serve, args=(spec, out, go, halt, done), name=f"hfapi-bench-forum-{n}", daemon=True)
+    proc.start()
+    try:
+        _, catalog = await asyncio.to_thread(out.get, True, 600)
+        return await _measure(n, counts, catalog, args, out, go, halt, done, HFClient, HFWatcher)
+    finally:
+        done.set()
+        proc.join(timeout=10)
+        if proc.is_alive():
+            proc.kill()
+
+
+async def _measure(n, counts, catalog, args, out, go, halt, done, HFClient, HFWatcher) -> dict:
+    gc.collect()
+    rss_before = _rss_mb()
+
+    client  = HFClient(f"bench-watchers-{n}", base_url=catalog["base_url"])
+    errors: Counter = Counter()
+
+    async def on_error(kind: str, exc: Exception) -> None:
+        errors[kind] += 1
+
+    watcher = HFWatcher(client, on_error=on_error)
+    deliveries: list[tuple[int, dict, float]] = []
+
+    def callback(index: int):
+        async def _deliver(event: dict) -> None:
+            deliveries.append((index, event, time.time()))
+        return _deliver
+
+    # watch index → (kind, target); target lookups for expected events
+    watches: list[tuple[str, int]] = []
+    by_tid:     dict[int, list[int]] = defaultdict(list)
+    by_fid:     dict[int, list[int]] = defaultdict(list)
+    by_uid:     dict[int, list[int]] = defaultdict(list)
+    by_kw_fid:  dict[int, list[int]] = defaultdict(list)
+    patterns:   dict[int, object] = {}
+
+    tids, uids, fids = catalog["tids"], catalog["uids"], catalog["fids"]
+    for i in range(counts["thread"]):
+        tid = tids[i % len(tids)]
+        by_tid[tid].append(len(watches))
+        watcher.watch_thread(tid, callback(len(watches)), interval=args.interval)
+        watches.append(("thread", tid))
+    for i in range(counts["user"]):
+        uid = uids[i % len(uids)]
+        by_uid[uid].append(len(watches))
+        watcher.watch_user(uid, callback(len(watches)), interval=args.interval, mode=args.user_mode)
+        watches.append(("user", uid))
+    for i in range(counts["forum"]):
+        fid = fids[i % len(fids)]
+        by_fid[fid].append(len(watches))
+        watcher.watch_forum(fid, callback(len(watches)), interval=args.interval)
+        watches.append(("forum", fid))
+    for i in range(counts["keyword"]):
+        kw_fids = [fids[(i * args.keyword_fids + j) % len(fids)] for j in range(args.keyword_fids)]
+        for fid in kw_fids:
+            by_kw_fid[fid].append(len(watches))
+        watcher.watch_keyword(KEYWORDS[i % len(KEYWORDS)], callback(len(watches)),
+                              interval=args.interval, fids=kw_fids)
+        patterns[len(watches)] = watcher._keyword_watches[-1].pattern
+        watches.append(("keyword", i))
+
+    # Count polls per watch (first poll = seeded)
+    polls: Counter = Counter()
+
+    def counted(poll):
+        async def _poll(w):
+            try:
+                return await poll(w)
+            finally:
+                polls[id(w)] += 1
+        return _poll
+
+    for name in ("_poll_thread", "_poll_forum", "_poll_user", "_poll_keyword"):
+        setattr(watcher, name, counted(getattr(watcher, name)))
+
+    task = asyncio.create_task(watcher.start())
+    seed_started = time.monotonic()
+    while len(polls) < len(watches) and time.monotonic() - seed_started < args.seed_timeout:
+        await asyncio.sleep(0.1)
+    seed_s = time.monotonic() - seed_started
+    unseeded = len(watches) - len(polls)
+    if unseeded:
+        progress(f"  N={n}: {unseeded} watch(es) not seeded after {args.seed_timeout:.0f}s — measuring anyway")
+
+    backfill = len(deliveries)
+    errors.clear()
+    polls_go = sum(polls.values())
+    cpu_go   = time.process_time()
+    t_go     = time.time()
+    wall_go  = time.monotonic()
+    go.set()
+    await asyncio.sleep(args.duration)
+    halt.set()
+    await asyncio.sleep(args.drain if args.drain is not None else 2 * args.interval)
+    wall_s   = time.monotonic() - wall_go
+    cpu_s    = time.process_time() - cpu_go
+    polls_s  = sum(polls.values()) - polls_go
+    rss_end  = _rss_mb()
+
+    watcher.stop()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    done.set()
+
+    # ── Collect what the forum created ──
+    created: dict[tuple[int, str, int], float] = {}
+    sim_stats: dict = {}
+    while True:
+        msg = await asyncio.to_thread(out.get, True, 60)
+        if msg[0] == "stats":
+            sim_stats = msg[1]
+            break
+        _, pid, tid, uid, fid, message, first, at = msg
+        if not first:
+            for i in by_tid.get(tid, ()):
+                created[(i, "thread_reply", pid)] = at
+        else:
+            for i in by_fid.get(fid, ()):
+                created[(i, "new_thread", tid)] = at
+            for i in by_uid.get(uid, ()):
+                created[(i, "user_thread", tid)] = at
+        if args.user_mode == "all":
+            for i in by_uid.get(uid, ()):
+                created[(i, "user_post", pid)] = at
+        for i in by_kw_fid.get(fid, ()):
+            if patterns[i].search(message):
+                created[(i, "keyword_match", pid)] = at
+
+    # ── Score deliveries ──
+    delivered: dict[tuple[int, str, int], float] = {}
+    duplicates = unexpected = other = 0
+    for index, event, at in deliveries[backfill:]:
+        kind = event.get("event")
+        id_field = _EVENT_IDS.get(kind)
+        if id_field is None:
+            other += 1
+            continue
+        key = (index, kind, int(event.get(id_field) or 0))
+        if key in delivered:
+            duplicates += 1
+        elif key in created:
+            delivered[key] = at
+        else:
+            unexpected += 1
+
+    latencies = sorted(delivered[k] - created[k] for k in delivered)
+    expected_by_kind: Counter = Counter()
+    missed_by_kind:   Counter = Counter()
+    for key in created:
+        kind = watches[key[0]][0]
+        expected_by_kind[kind] += 1
+        if key not in delivered:
+            missed_by_kind[kind] += 1
+
+    before, after = sim_stats.get("before", {}), sim_stats.get("after", {})
+    api_calls = sum(after.get(e, 0) - before.get(e, 0) for e in ("read", "write"))
+    due = len(watches) * wall_s / args.interval
+
+    return {
+        "watches":       dict(counts),
+        "interval_s":    args.interval,
+        "seed_s":        round(seed_s, 2),
+        "unseeded":      unseeded,
+        "wall_s":        round(wall_s, 2),
+        "expected":      len(created),
+        "delivered":     len(delivered),
+        "missed":        len(created) - len(delivered),
+        "duplicates":    duplicates,
+        "unexpected":    unexpected,
+        "other_events":  other,
+        "poll_errors":   dict(errors),
+        "backfill":      backfill,
+        "expected_by_kind": dict(expected_by_kind),
+        "missed_by_kind":   dict(missed_by_kind),
+        "latency_p50_s": _round(_percentile(latencies, 50)),
+        "latency_p95_s": _round(_percentile(latencies, 95)),
+        "latency_p99_s": _round(_percentile(latencies, 99)),
+        "latency_max_s": _round(latencies[-1] if latencies else None),
+        "api_calls":     api_calls,
+        "rate_limited":  after.get("rate_limited", 0) - before.get("rate_limited", 0),
+        "calls_per_event": round(api_calls / len(delivered), 2) if delivered else None,
+        "polls":         polls_s,
+        "poll_rate":     round(polls_s / due, 3) if due else None,
+        "cpu_s":         round(cpu_s, 2),
+        "cpu_pct":       round(100 * cpu_s / wall_s, 1) if wall_s else None,
+        "rss_mb":        _round(rss_end, 1),
+        "rss_growth_mb": _round(rss_end - rss_before, 1) if rss_end is not None and rss_before is not None else None,
+        "forum_events":  sim_stats.get("generator", {}),
+    }
+
+
+def _round(value: float | None, digits: int = 4) -> float | None:
+    return None if value is None else round(value, digits)
+
+
+def _row(n: int, r: dict) -> str:
+    def ms(v):
+        return "     -" if v is None else f"{v * 1000:6.0f}"
+    cpe = "    -" if r["calls_per_event"] is None else f"{r['calls_per_event']:5.1f}"
+    return (
+        f"{n:>6} {r['expected']:>8} {r['delivered']:>9} {r['missed']:>6} {r['duplicates']:>4} {r['unexpected']:>5}"
+        f" {ms(r['latency_p50_s'])} {ms(r['latency_p95_s'])} {ms(r['latency_p99_s'])}"
+        f" {r['api_calls']:>8} {cpe} {r['poll_rate'] or 0:>5.2f} {r['cpu_pct'] or 0:>5.0f}% {r['rss_mb'] or 0:>7.0f}"
+    )
+
+
+_HEADER = (
+    f"{'N':>6} {'expected':>8} {'delivered':>9} {'missed':>6} {'dup':>4} {'unexp':>5}"
+    f" {'p50ms':>6} {'p95ms':>6} {'p99ms':>6} {'calls':>8} {'c/ev':>5} {'polls':>5} {'cpu':>6} {'rss MB':>7}"
+)
+
+
+# ── CLI ────────────────────────────────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m benchmarks.watchers",
+                                description="End-to-end HFWatcher latency and API cost against a local simulator.")
+    p.add_argument("--sweep", default=",".join(map(str, DEFAULT_SWEEP)),
+                   help="watch counts to run, comma-separated (default 10,100,1000,10000)")
+    p.add_argument("--mix", type=_parse_mix, default=dict(DEFAULT_MIX),
+                   help="watch kind shares, e.g. thread=70,user=20,forum=5,keyword=5")
+    p.add_argument("--interval", type=float, default=5.0, help="poll interval of every watch in seconds (default 5)")
+    p.add_argument("--duration", type=float, default=60.0, help="seconds of live activity per N (default 60)")
+    p.add_argument("--drain", type=float, default=None, help="seconds to wait after activity stops (default 2 intervals)")
+    p.add_argument("--seed-timeout", type=float, default=600.0, help="longest wait for every watch's first poll")
+    p.add_argument("--user-mode", choices=("threads", "all"), default="all", help="watch_user mode (default all)")
+    p.add_argument("--keyword-fids", type=int, default=2, help="forums per keyword watch (default 2)")
+    p.add_argument("--replies", type=float, default=600.0, help="new replies per simulated minute (default 600)")
+    p.add_argument("--new-threads", type=float, default=30.0, help="new threads per simulated minute (default 30)")
+    p.add_argument("--speed", type=float, default=1.0, help="simulated seconds per real second (default 1)")
+    p.add_argument("--tick", type=float, default=0.1, help="generator step in real seconds (default 0.1)")
+    p.add_argument("--limit", type=int, default=10**9, help="simulator hourly call limit (default: unlimited)")
+    p.add_argument("--latency", type=float, default=0.0, help="simulated response latency in seconds")
+    p.add_argument("--jitter", type=float, default=0.0, help="extra random latency up to this many seconds")
+    p.add_argument("--seed", type=int, default=20_240_601)
+    p.add_argument("--out", type=Path, default=None,
+                   help="results file (default benchmarks/results/watchers-<timestamp>.json)")
+    args = p.parse_args(argv)
+
+    try:
+        sweep = [int(n) for n in args.sweep.split(",") if n.strip()]
+    except ValueError:
+        p.error(f"--sweep must be comma-separated integers, not {args.sweep!r}")
+    if not sweep or min(sweep) < 1:
+        p.error("--sweep needs at least one watch count >= 1")
+
+    logging.basicConfig(level=logging.WARNING)
+    # Failed polls are counted (poll_errors) and show up as misses; one
+    # warning per timeout would drown the table
+    logging.getLogger("hfapi").setLevel(logging.ERROR)
+    # Each run starts with a fresh budget, not whatever a previous run left
+    # in the shared rate limit file
+    from HFRateState import MemoryRateState, set_rate_state
+    set_rate_state(MemoryRateState())
+
+    results: dict[str, dict] = {}
+    print(_HEADER, flush=True)
+    for n in sweep:
+        progress(f"N={n}: building forum and seeding watches…")
+        result = asyncio.run(run_point(n, args))
+        results[f"watchers[{n}]"] = result
+        print(_row(n, result), flush=True)
+        if result["poll_errors"]:
+            progress("  poll errors: " + ", ".join(f"{k} {v}" for k, v in sorted(result["poll_errors"].items())))
+        if result["missed_by_kind"]:
+            progress("  missed by kind: " + ", ".join(
+                f"{k} {result['missed_by_kind'].get(k, 0)}/{v}" for k, v in sorted(result["expected_by_kind"].items())
+            ))
+
+    env = environment(quick=False)
+    env["args"] = {k: v for k, v in vars(args).items() if k != "out"}
+    out = args.out or HERE / "results" / f"watchers-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    write_results(out, env, results)
+    progress(f"Results written to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -55,7 +55,9 @@ def out(data, as_json=False, keys=None):
 @click.group()
 def cli():
     """HackForums API CLI — full wrapper for the HF API v2."""
-    pass
+    # CLI commands are someone waiting at a terminal — interactive rate limiter lane
+    from HFRateLimiter import PRIORITY_INTERACTIVE, set_request_priority
+    set_request_priority(PRIORITY_INTERACTIVE)
 
 
 # ── Auth ───────────────────────────────────────────────────────────────────────
@@ -803,29 +805,24 @@ def batch_fetch(me, uids, tids, fids, pids, as_json):
       hf batch fetch --me --forum 25 --json
       hf batch fetch --user 761578 --user 1337 --post 59852445
     """
-    import asyncio
     from HFBatch import HFBatch
     from HFClient import HFClient
 
     token = get_token()
 
-    async def run():
-        hf = HFClient(token)
-        b  = HFBatch(hf)
-        if me:
-            b.me()
-        if uids:
-            b.users(list(uids))
-        if tids:
-            b.threads(tids=list(tids))
-        if fids:
-            for fid in fids:
-                b.threads(fid=fid)
-        if pids:
-            b.posts(pids=list(pids))
-        return await b.fetch()
-
-    result = asyncio.run(run())
+    b = HFBatch(HFClient(token))
+    if me:
+        b.me()
+    if uids:
+        b.users(list(uids))
+    if tids:
+        b.threads(tids=list(tids))
+    if fids:
+        for fid in fids:
+            b.threads(fid=fid)
+    if pids:
+        b.posts(pids=list(pids))
+    result = b.fetch_sync()
 
     if as_json:
         click.echo(json.dumps(result._raw, indent=2))
@@ -863,6 +860,60 @@ def cache_stats():
     click.echo("  # {'entries': 1, 'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'ttl': 300}")
 
 
+# ── Simulator ──────────────────────────────────────────────────────────────────
+
+@cli.group()
+def sim():
+    """Local HF API stand-in for load tests."""
+    pass
+
+
+@sim.command("serve")
+@click.option("--host",      default="127.0.0.1", show_default=True)
+@click.option("--port",      default=8765, show_default=True, type=int)
+@click.option("--users",     default=200, show_default=True, type=int, help="Synthetic users.")
+@click.option("--forums",    default=10, show_default=True, type=int, help="Synthetic forums.")
+@click.option("--threads",   default=500, show_default=True, type=int, help="Synthetic threads.")
+@click.option("--posts",     default=5000, show_default=True, type=int, help="Synthetic posts (threads included).")
+@click.option("--seed",      default=0, show_default=True, type=int, help="Dataset and fault seed.")
+@click.option("--limit",     default=240, show_default=True, type=int, help="Hourly calls per token.")
+@click.option("--latency",   default=0.0, show_default=True, type=float, help="Seconds added to every response.")
+@click.option("--jitter",    default=0.0, show_default=True, type=float, help="Up to this many extra random seconds.")
+@click.option("--p403",      default=0.0, show_default=True, type=float, help="Share of calls answered with a Cloudflare 403.")
+@click.option("--p503",      default=0.0, show_default=True, type=float, help="Share of calls answered with a 503.")
+@click.option("--live",      is_flag=True, help="Keep generating replies, threads and payments while serving.")
+@click.option("--speed",     default=1.0, show_default=True, type=float, help="Simulated seconds per real second with --live.")
+@click.option("--replies",   default=6.0, show_default=True, type=float, help="Live replies per simulated minute.")
+def sim_serve(host, port, users, forums, threads, posts, seed, limit, latency, jitter, p403, p503,
+              live, speed, replies):
+    """Serve a synthetic forum on /api/v2/read and /api/v2/write.
+
+    \b
+    Point clients at it with:
+      HF_API_BASE=http://127.0.0.1:8765/api/v2 hf me
+    """
+    from HFForumGen import ForumGenerator, GenConfig
+    from HFSimulator import HFSimulator, SimFaults
+
+    click.echo(f"Building dataset ({users} users, {threads} threads, {posts} posts)...")
+    config = GenConfig(users=users, forums=forums, threads=threads, posts=posts,
+                       transactions=max(10, posts // 10), contracts=max(5, posts // 40),
+                       live_replies=replies)
+    gen    = ForumGenerator(config, seed=seed)
+    server = HFSimulator(
+        gen.build(), host=host, port=port, hourly_limit=limit, seed=seed,
+        faults=SimFaults(latency=latency, jitter=jitter, error_403=p403, error_503=p503),
+    )
+    if live:
+        gen.start(speed=speed)
+        click.echo(f"Live activity on: {replies:g} replies per simulated minute at {speed:g}x")
+    click.echo(f"Serving on {server.base_url} — Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    finally:
+        gen.stop()
+
+
 # ── Entry point ────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
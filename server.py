@@ -23,10 +23,21 @@ from HFForums import HFForums
 from HFContracts import HFContracts
 from HFBratings import HFBratings
 from HFDisputes import HFDisputes
+from HFLatency import set_hedging
+from HFMetrics import OPENMETRICS_CONTENT_TYPE, render_openmetrics
+from HFRateLimiter import PRIORITY_INTERACTIVE, set_request_priority
 
 app = Flask(__name__)
 
 
+@app.before_request
+def interactive_lane():
+    # Page loads jump ahead of watcher/paginator traffic in the rate limiter
+    set_request_priority(PRIORITY_INTERACTIVE)
+    # JSON endpoints are latency-critical — hedge their slow reads
+    set_hedging(request.path.startswith("/api/"))
+
+
 def get_token() -> str | None:
     auth = HFAuth()
     return auth.get_access_token()
@@ -240,6 +251,12 @@ def user_bratings(uid):
 
 # ── API endpoints (JSON) ───────────────────────────────────────────────────────
 
+@app.route("/metrics")
+def metrics():
+    # Request counts, latency, bytes and errors per endpoint/resource (HFMetrics)
+    return render_openmetrics(), 200, {"Content-Type": OPENMETRICS_CONTENT_TYPE}
+
+
 @app.route("/api/me")
 def api_me():
     token, err = require_auth()
@@ -22,7 +22,10 @@ setup(
         # Config
         "cli", "hf_config",
         # Core
-        "HFClient", "HFAuth",
+        "HFClient", "HFAuth", "HFRateLimiter", "HFTokenPool", "HFProxyPool",
+        "HFCodec", "HFRetry", "HFLatency", "HFMetrics", "HFCircuitBreaker",
+        "HFFields", "HFQuery", "HFTransport", "HFRateState",
+        "HFSimulator", "HFForumGen",
         # Resource APIs
         "HFMe", "HFUsers", "HFPosts", "HFThreads", "HFForums",
         "HFBytes", "HFContracts", "HFBratings", "HFDisputes",
@@ -31,7 +34,7 @@ setup(
         "HFPaginator", "HFBBCode", "HFBBCodeBuilder",
         "HFWatcher", "HFWebhook",
         # New
-        "HFBatch", "HFEventStore", "HFCache",
+        "HFBatch", "HFEventStore", "HFOutbox", "HFCache",
         "HFExceptions", "HFTypes",
     ],
     install_requires=[
@@ -40,6 +43,10 @@ setup(
         "flask",           # server.py web UI
         "click>=8.0",      # CLI
     ],
+    extras_require={
+        "http2": ["httpx[http2]"],   # HFClient(http2=True)
+        "speed": ["orjson"],         # faster JSON via HFCodec
+    },
     entry_points={
         "console_scripts": [
             "hf=cli:cli",
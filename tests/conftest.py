@@ -0,0 +1,46 @@
+"""
+Shared fixtures. Tests run against an in-process HFSimulator or a fake
+transport — no network, no real token — with process-wide client state
+reset in between.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import HFCircuitBreaker
+import HFClient
+import HFLatency
+import HFRateLimiter
+from HFRateState import MemoryRateState, use_rate_state
+
+
+@pytest.fixture(autouse=True)
+def isolated_state():
+    """Fresh breakers, rate limiters, latency windows and write memory; rate state stays in memory."""
+    HFCircuitBreaker._breakers.clear()
+    HFRateLimiter._buckets.clear()
+    HFLatency._windows.clear()
+    HFClient._completed_writes.clear()
+    with use_rate_state(MemoryRateState()):
+        yield
+    HFCircuitBreaker._breakers.clear()
+    HFRateLimiter._buckets.clear()
+    HFLatency._windows.clear()
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine on a new event loop, closing the HTTP clients it opened."""
+    def _run(coro):
+        async def main():
+            try:
+                return await coro
+            finally:
+                await HFClient._close_loop_clients()
+        return asyncio.run(main())
+    return _run
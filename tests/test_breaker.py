@@ -0,0 +1,43 @@
+"""Circuit breaker: Cloudflare blocks open it, HF's own error answers don't."""
+
+from HFCircuitBreaker import FAILURE_THRESHOLD, OPEN, get_breaker, is_breaker_failure
+from HFClient import HFClient
+from HFRetry import NO_RETRY
+from HFSimulator import HFSimulator, SimFaults
+
+DISPUTES_BY_UID = {"disputes": {"_uid": [1], "cdid": True}}   # HF answers a 503
+
+
+def test_classification():
+    assert is_breaker_failure(None, "timeout")
+    assert is_breaker_failure(403, None, b"<!DOCTYPE html><html>blocked</html>")
+    assert is_breaker_failure(502, None, b"<html>Bad gateway</html>")
+    assert not is_breaker_failure(503, None, b'{"success":false,"message":"disputes cannot be read by _uid"}')
+    assert not is_breaker_failure(500, None, b"")
+    assert not is_breaker_failure(200, None, b"{}")
+
+
+def test_hf_503_does_not_open_breaker(run):
+    async def main():
+        async with HFSimulator() as sim:
+            hf = HFClient("tok-503", base_url=sim.base_url, timeout=2, retry=NO_RETRY, coalesce_window=0)
+            results = [await hf.read(DISPUTES_BY_UID) for _ in range(FAILURE_THRESHOLD + 2)]
+            return results, sim.stats().get("http_503", 0)
+
+    results, answered_503 = run(main())
+    assert results == [None] * (FAILURE_THRESHOLD + 2)
+    assert answered_503 == FAILURE_THRESHOLD + 2
+    assert get_breaker("direct", "read").state != OPEN
+
+
+def test_cloudflare_403_opens_breaker(run):
+    async def main():
+        async with HFSimulator(faults=SimFaults(error_403=1.0)) as sim:
+            hf = HFClient("tok-403", base_url=sim.base_url, timeout=2, retry=NO_RETRY, coalesce_window=0)
+            for _ in range(FAILURE_THRESHOLD + 2):
+                await hf.read({"me": {"uid": True}})
+            return sim.stats().get("read", 0)
+
+    sent = run(main())
+    assert get_breaker("direct", "read").state == OPEN
+    assert sent == FAILURE_THRESHOLD   # the rest were refused without a request
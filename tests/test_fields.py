@@ -0,0 +1,40 @@
+"""HFFields: profiles, field lists and nested objects checked against the response types."""
+
+import pytest
+
+from HFFields import profiles, project, register_profile
+from HFPosts import HFPosts
+
+
+def test_projections():
+    assert project("bytes", "minimal") == dict.fromkeys(profiles("bytes")["minimal"], True)
+    assert project("bytes", ["id", "amount"]) == {"id": True, "amount": True}
+    assert project("bytes", {"id": True, "from": ["uid", "username"]}) == {"id": True, "from": ["uid", "username"]}
+    assert project("bytes", None, default="summary") == project("bytes", "summary")
+
+
+@pytest.mark.parametrize("fields, message", [
+    (["id", "amout"],       "bytes: unknown field 'amout'"),
+    (["_uid"],              "'_uid' is a query parameter"),
+    ({"from": ["nope"]},    "bytes.from: unknown field 'nope'"),
+    ({"amount": ["x"]},     "bytes.amount is a plain field"),
+    ("detailed",            "Unknown bytes field profile 'detailed'"),
+    ([],                    "Empty bytes field projection"),
+    (42,                    "fields must be a profile name"),
+])
+def test_bad_projection_raises(fields, message):
+    with pytest.raises(ValueError, match=message):
+        project("bytes", fields)
+
+
+def test_registered_profile():
+    register_profile("threads", "test-poll", ["tid", "lastpost", "numreplies"])
+    assert project("threads", "test-poll") == {"tid": True, "lastpost": True, "numreplies": True}
+    with pytest.raises(ValueError, match="unknown field 'lastpots'"):
+        register_profile("threads", "test-typo", ["tid", "lastpots"])
+    assert "test-typo" not in profiles("threads")
+
+
+def test_getter_rejects_typo_before_sending():
+    with pytest.raises(ValueError, match="unknown field 'messsage'"):
+        HFPosts("tok-fields").get_by_thread(1, fields=["pid", "messsage"])
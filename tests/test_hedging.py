@@ -0,0 +1,57 @@
+"""Hedged reads: a read still waiting at the observed p95 gets a second request; the first answer wins."""
+
+import asyncio
+
+import httpx
+
+import HFClient as client_module
+from HFClient import HFClient, get_client_stats
+from HFLatency import MIN_SAMPLES, record
+from HFRetry import NO_RETRY
+
+ASKS = {"me": {"uid": True}}
+
+
+def _serve(monkeypatch, delays: list[float]) -> list[float]:
+    """Answer every POST after the next of delays; returns the list of calls made."""
+    calls: list[float] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        delay = delays[min(len(calls), len(delays) - 1)]
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, content=b'{"me":[{"uid":"1"}]}')
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(client_module, "_get_http_client", lambda proxy, options=None: client)
+    return calls
+
+
+def _read(run, hedge: bool) -> tuple[dict | None, int, int]:
+    for _ in range(MIN_SAMPLES):
+        record("read", "direct", 0.05)   # p95 = 50 ms
+    before = get_client_stats()
+
+    async def main():
+        hf = HFClient("tok-hedge", timeout=2, coalesce_window=0, hedge=hedge, hedge_ratio=1.0, retry=NO_RETRY)
+        return await asyncio.wait_for(hf.read(ASKS), 1.0)
+
+    result = run(main())
+    after  = get_client_stats()
+    return result, after["hedged"] - before["hedged"], after["hedge_wins"] - before["hedge_wins"]
+
+
+def test_slow_read_hedged_at_p95(run, monkeypatch):
+    calls = _serve(monkeypatch, [5.0, 0.0])
+    result, hedged, wins = _read(run, hedge=True)
+    assert result == {"me": [{"uid": "1"}]}
+    assert len(calls) == 2
+    assert (hedged, wins) == (1, 1)
+
+
+def test_no_hedge_unless_enabled(run, monkeypatch):
+    calls = _serve(monkeypatch, [0.2])
+    result, hedged, _ = _read(run, hedge=False)
+    assert result == {"me": [{"uid": "1"}]}
+    assert len(calls) == 1
+    assert hedged == 0
@@ -0,0 +1,128 @@
+"""HFOutbox: finding in-doubt writes on HF before sending them again."""
+
+import asyncio
+import sqlite3
+import time
+
+import HFOutbox
+from HFClient import HFClient
+from HFOutbox import DONE, HFOutbox as Outbox, _check_bytes_send
+from HFBytes import HFBytes
+from HFRetry import RetryPolicy
+from HFSimulator import HFSimulator, SimFaults
+
+
+def _payer(sim: HFSimulator, token: str) -> int:
+    uid = int(sim.dataset.add_user("payer", myps="100000")["uid"])
+    sim.dataset.add_token(token, uid)
+    return uid
+
+
+def test_bytes_send_needs_matching_recipient(run):
+    async def main():
+        async with HFSimulator() as sim:
+            uid = _payer(sim, "tok-uid")
+            # Same amount and reason, another recipient / none at all
+            sim.dataset.add_bytes(uid, 2, 25, reason="prize")
+            sim.dataset.add_bytes(uid, 0, 25, type="bum", reason="prize")
+            hf   = HFClient("tok-uid", base_url=sim.base_url, timeout=2)
+            asks = HFBytes.send_asks(3, 25, "prize")
+            return await _check_bytes_send(hf, uid, asks, time.time() - 60)
+
+    assert run(main()) is False
+
+
+def test_bytes_send_found_past_first_pages(run):
+    async def main():
+        async with HFSimulator() as sim:
+            uid  = _payer(sim, "tok-pages")
+            now  = int(time.time())
+            sim.dataset.add_bytes(uid, 3, 25, reason="prize", dateline=now - 100)
+            for i in range(70):   # later sends bury it under two full pages
+                sim.dataset.add_bytes(uid, 2, 1, reason=f"tip {i}", dateline=now - 50)
+            hf    = HFClient("tok-pages", base_url=sim.base_url, timeout=2, coalesce_window=0)
+            asks  = HFBytes.send_asks(3, 25, "prize")
+            found = await _check_bytes_send(hf, uid, asks, now - 200)
+            return found, sim.stats().get("read", 0)
+
+    found, reads = run(main())
+    assert found is True
+    assert reads == 3
+
+
+def test_bytes_send_stops_before_first_attempt(run):
+    async def main():
+        async with HFSimulator() as sim:
+            uid = _payer(sim, "tok-since")
+            now = int(time.time())
+            # An identical payout from an earlier run, before this attempt
+            sim.dataset.add_bytes(uid, 3, 25, reason="prize", dateline=now - 3600)
+            for i in range(40):
+                sim.dataset.add_bytes(uid, 2, 1, reason=f"tip {i}", dateline=now - 50)
+            hf    = HFClient("tok-since", base_url=sim.base_url, timeout=2, coalesce_window=0)
+            asks  = HFBytes.send_asks(3, 25, "prize")
+            found = await _check_bytes_send(hf, uid, asks, now - 200)
+            return found, sim.stats().get("read", 0)
+
+    found, reads = run(main())
+    assert found is False
+    assert reads == 2
+
+
+def test_timed_out_send_settled_without_resending(run, tmp_path, monkeypatch):
+    monkeypatch.setattr(HFOutbox, "_SETTLE_DELAY", 0.0)
+
+    async def main():
+        async with HFSimulator(faults=SimFaults(latency=0.4)) as sim:
+            uid = _payer(sim, "tok-outbox")
+            hf  = HFClient("tok-outbox", base_url=sim.base_url, timeout=0.2)
+            box = Outbox(hf, str(tmp_path / "outbox.db"), reserve=0,
+                         retry=RetryPolicy(attempts=3, base_delay=0.1, jitter=0, deadline=None))
+            key = box.send_bytes(3, 25, "prize", key="prize-3")
+            await box.drain()
+            # The lookup reads time out too until the latency goes away
+            sim.faults.latency = 0.0
+            for _ in range(50):
+                if box.get(key)["state"] == DONE:
+                    break
+                await box.drain()
+                await asyncio.sleep(0.05)
+            sent = [tx for tx in sim.dataset.bytes.values() if tx["_from"] == uid and tx["_to"] == 3]
+            state = box.get(key)["state"]
+            box.close()
+            return state, len(sent)
+
+    state, sent = run(main())
+    assert state == DONE
+    assert sent == 1
+
+
+def test_drain_waits_for_the_file_lock_off_the_loop(run, tmp_path):
+    path = str(tmp_path / "outbox.db")
+
+    async def main():
+        async with HFSimulator() as sim:
+            _payer(sim, "tok-locked")
+            hf  = HFClient("tok-locked", base_url=sim.base_url, timeout=2)
+            box = Outbox(hf, path, reserve=0)
+            key = box.send_bytes(3, 25, "prize", key="prize-locked")
+            # Another drainer holds the write lock for half a second
+            holder = sqlite3.connect(path, isolation_level=None)
+            holder.execute("BEGIN IMMEDIATE")
+            drain   = asyncio.ensure_future(box.drain())
+            slowest = 0.0
+            until   = time.monotonic() + 0.5
+            while time.monotonic() < until:
+                started = time.monotonic()
+                await asyncio.sleep(0.01)
+                slowest = max(slowest, time.monotonic() - started - 0.01)
+            holder.execute("COMMIT")
+            await drain
+            holder.close()
+            state = box.get(key)["state"]
+            box.close()
+            return state, slowest
+
+    state, slowest = run(main())
+    assert state == DONE
+    assert slowest < 0.05
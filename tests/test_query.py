@@ -0,0 +1,48 @@
+"""HFQuery: prepared asks encode to exactly what HFCodec gives for the plain dict."""
+
+import pytest
+
+import HFCodec
+from HFQuery import HFQuery, PreparedAsks, canonical_asks
+
+POLL   = HFQuery("threads", ["tid", "lastpost", "numreplies"], params=("_tid",))
+NEWEST = HFQuery("posts", "minimal", params=("_tid", "_page"), _perpage=10)
+
+
+@pytest.fixture(params=["json", "orjson"])
+def codec(request):
+    previous = HFCodec.get_codec()
+    try:
+        HFCodec.set_codec(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+    yield
+    HFCodec.set_codec(previous)
+
+
+@pytest.mark.parametrize("asks", [
+    lambda: POLL.bind(_tid=[6083735, 6084000]),
+    lambda: POLL.bind(_tid=['quo"te', "ünï", "a\\b"]),
+    lambda: NEWEST.bind(_page=3, _tid=[1]),   # slots land either side of the fixed _perpage
+])
+def test_bound_asks_match_canonical(codec, asks):
+    prepared = asks()
+    plain    = dict(prepared)
+    assert prepared.canonical == HFCodec.canonical(plain)
+    assert canonical_asks(prepared) == canonical_asks(plain)
+    assert HFCodec.loads(prepared.json) == plain
+
+
+def test_merged_asks_match_canonical(codec):
+    merged = PreparedAsks.merge([POLL.bind(_tid=[2]), NEWEST.bind(_tid=[1], _page=1)])
+    assert merged.canonical == HFCodec.canonical(dict(merged))
+    assert HFCodec.loads(merged.json) == dict(merged)
+
+
+def test_bind_checks_parameters():
+    with pytest.raises(ValueError, match="missing _page"):
+        NEWEST.bind(_tid=[1])
+    with pytest.raises(ValueError, match="undeclared _uid"):
+        POLL.bind(_tid=[1], _uid=[2])
+    with pytest.raises(ValueError, match="must start with '_'"):
+        HFQuery("posts", "minimal", params=("tid",))
@@ -0,0 +1,55 @@
+"""TokenBucket: pacing from the remaining header, lanes released in order, lane wait limits."""
+
+import asyncio
+import time
+
+from HFRateLimiter import LANE_MAX_WAIT, PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, PRIORITY_NORMAL, TokenBucket
+
+
+def test_burst_then_paced_by_remaining(run):
+    bucket = TokenBucket(window=1.0, burst=2)
+    bucket.update(20)   # 20 calls left in a 1 s window: 2 at once, then one per 50 ms
+
+    async def main():
+        started = time.monotonic()
+        for _ in range(4):
+            assert await bucket.acquire()
+        return time.monotonic() - started
+
+    assert 0.08 < run(main()) < 0.3
+
+
+def test_higher_lane_goes_first(run):
+    bucket = TokenBucket(window=1.0, burst=1)
+    bucket.update(10)   # one slot every 100 ms
+    order  = []
+
+    async def take(name: str, priority: int):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    async def main():
+        await bucket.acquire(PRIORITY_NORMAL)   # empty the bucket
+        background = asyncio.ensure_future(take("background", PRIORITY_BACKGROUND))
+        await asyncio.sleep(0.01)               # queued first, still served last
+        await asyncio.gather(background, take("interactive", PRIORITY_INTERACTIVE))
+
+    run(main())
+    assert order == ["interactive", "background"]
+
+
+def test_lane_max_wait(run, monkeypatch):
+    monkeypatch.setitem(LANE_MAX_WAIT, PRIORITY_INTERACTIVE, 0.1)
+    bucket = TokenBucket()
+    bucket.block_until(time.time() + 0.3)
+
+    async def main():
+        started     = time.monotonic()
+        interactive = await bucket.acquire(PRIORITY_INTERACTIVE, LANE_MAX_WAIT[PRIORITY_INTERACTIVE])
+        gave_up     = time.monotonic() - started
+        background  = await bucket.acquire(PRIORITY_BACKGROUND, LANE_MAX_WAIT[PRIORITY_BACKGROUND])
+        return interactive, gave_up, background, time.monotonic() - started
+
+    interactive, gave_up, background, waited = run(main())
+    assert interactive is False and gave_up < 0.05   # can't make it in time: gives up at once
+    assert background is True and waited >= 0.25     # no limit: waits out the block
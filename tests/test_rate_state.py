@@ -0,0 +1,110 @@
+"""Rate limit state shared through HFRateState backends."""
+
+import asyncio
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from HFClient import HFClient, get_rate_limit_remaining, is_rate_limited
+from HFRateLimiter import TokenBucket
+from HFRateState import SQLiteRateState, use_rate_state
+from HFSimulator import HFSimulator
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_remaining_seen_by_other_backend(run, tmp_path):
+    path = tmp_path / "ratelimit.db"
+
+    async def main():
+        async with HFSimulator(hourly_limit=240) as sim:
+            hf = HFClient("tok-shared-state", base_url=sim.base_url, timeout=2)
+            with use_rate_state(SQLiteRateState(path)):
+                await hf.read({"me": {"uid": True}})
+
+    run(main())
+    # A second connection to the file, as another process would open it
+    with use_rate_state(SQLiteRateState(path)):
+        assert get_rate_limit_remaining("tok-shared-state") == 239
+
+
+def test_block_set_by_another_process(tmp_path):
+    path = tmp_path / "ratelimit.db"
+    script = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]);"
+        "from HFRateState import SQLiteRateState, set_rate_state;"
+        "from HFRateLimiter import TokenBucket;"
+        "set_rate_state(SQLiteRateState(sys.argv[2]));"
+        "TokenBucket(token='tok-blocked').block_until(time.time() + 600)"
+    )
+    subprocess.run([sys.executable, "-c", script, str(ROOT), str(path)], check=True, timeout=30)
+
+    with use_rate_state(SQLiteRateState(path)):
+        assert is_rate_limited("tok-blocked")
+        assert not is_rate_limited("tok-other")
+
+
+def test_acquire_waits_for_lock_off_the_loop(run, tmp_path):
+    path    = tmp_path / "ratelimit.db"
+    backend = SQLiteRateState(path, busy_timeout=5.0)
+    holder  = sqlite3.connect(str(path), isolation_level=None)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        # Another process holds the write lock for half a second
+        holder.execute("BEGIN IMMEDIATE")
+        asyncio.get_running_loop().call_later(0.5, holder.execute, "COMMIT")
+        tick = asyncio.ensure_future(ticker())
+        started = time.monotonic()
+        with use_rate_state(backend):
+            granted = await TokenBucket(token="tok-locked").acquire()
+        waited = time.monotonic() - started
+        tick.cancel()
+        return granted, waited, ticks
+
+    granted, waited, ticks = run(main())
+    holder.close()
+    assert granted
+    assert waited >= 0.4
+    assert ticks >= 20   # the loop kept running while acquire() waited
+
+
+def test_rate_checks_never_wait_on_the_lock(run, tmp_path):
+    from HFTokenPool import HFTokenPool
+
+    path    = tmp_path / "ratelimit.db"
+    backend = SQLiteRateState(path, busy_timeout=5.0)
+    holder  = sqlite3.connect(str(path), isolation_level=None)
+    pool    = HFTokenPool(["tok-pool-1", "tok-pool-2"])
+
+    async def main():
+        # Another process holds the write lock for half a second, while an
+        # acquire() waits for it in a worker thread holding the backend
+        holder.execute("BEGIN IMMEDIATE")
+        asyncio.get_running_loop().call_later(0.5, holder.execute, "COMMIT")
+        with use_rate_state(backend):
+            waiter = asyncio.ensure_future(TokenBucket(token="tok-pool-1").acquire())
+            await asyncio.sleep(0.05)
+            slowest = 0.0
+            while not waiter.done():
+                started = time.monotonic()
+                is_rate_limited("tok-pool-1")
+                get_rate_limit_remaining("tok-pool-2")
+                pool.pick()
+                slowest = max(slowest, time.monotonic() - started)
+                await asyncio.sleep(0.01)
+            return await waiter, slowest
+
+    granted, slowest = run(main())
+    holder.close()
+    assert granted
+    assert slowest < 0.05
@@ -0,0 +1,124 @@
+"""Read coalescing and single-flight: only reads with the same client settings share a POST."""
+
+import asyncio
+
+from HFClient import HFClient, get_client_stats
+from HFRetry import NO_RETRY
+from HFSimulator import HFSimulator, SimDataset, SimFaults
+
+ASKS = {"users": {"_uid": [1], "uid": True, "username": True}}
+
+
+def _forum(name: str) -> SimDataset:
+    data = SimDataset()
+    data.add_user(name, uid=1)
+    return data
+
+
+def test_identical_reads_to_different_servers_not_shared(run):
+    async def main():
+        async with HFSimulator(_forum("alpha")) as a, HFSimulator(_forum("beta")) as b:
+            ha = HFClient("tok-shared", base_url=a.base_url, timeout=2)
+            hb = HFClient("tok-shared", base_url=b.base_url, timeout=2)
+            ra, rb = await asyncio.gather(ha.read(ASKS), hb.read(ASKS))
+            return ra, rb, a.stats().get("read", 0), b.stats().get("read", 0)
+
+    ra, rb, reads_a, reads_b = run(main())
+    assert ra["users"][0]["username"] == "alpha"
+    assert rb["users"][0]["username"] == "beta"
+    assert (reads_a, reads_b) == (1, 1)
+
+
+def test_reads_with_different_settings_not_coalesced(run):
+    async def main():
+        async with HFSimulator(_forum("alpha")) as sim:
+            fast = HFClient("tok-settings", base_url=sim.base_url, timeout=2, retry=NO_RETRY)
+            slow = HFClient("tok-settings", base_url=sim.base_url, timeout=9)
+            await asyncio.gather(
+                fast.read({"forums": {"_fid": [1], "fid": True}}),
+                fast.read(ASKS),
+                slow.read(ASKS),
+            )
+            return sim.stats().get("read", 0)
+
+    # fast's two reads coalesce; slow's identical read doesn't ride on them
+    assert run(main()) == 2
+
+
+def test_same_settings_share_one_post(run):
+    async def main():
+        async with HFSimulator(_forum("alpha")) as sim:
+            one = HFClient("tok-same", base_url=sim.base_url, timeout=2)
+            two = HFClient("tok-same", base_url=sim.base_url, timeout=2)
+            before = get_client_stats()
+            r1, r2, r3 = await asyncio.gather(
+                one.read(ASKS), two.read(ASKS), two.read({"forums": {"_fid": [1], "fid": True}}),
+            )
+            after = get_client_stats()
+            return r1, r2, sim.stats().get("read", 0), after["deduplicated"] - before["deduplicated"]
+
+    r1, r2, posts, deduplicated = run(main())
+    assert r1 == r2
+    assert posts == 1
+    assert deduplicated == 1
+
+
+def test_batch_503_resent_per_caller(run):
+    async def main():
+        async with HFSimulator(_forum("alpha")) as sim:
+            hf = HFClient("tok-split", base_url=sim.base_url, timeout=2, retry=NO_RETRY)
+            good, bad = await asyncio.gather(
+                hf.read(ASKS),
+                hf.read({"disputes": {"_uid": [1], "cdid": True}}),   # HF answers a 503
+            )
+            return good, bad, sim.stats().get("read", 0)
+
+    good, bad, posts = run(main())
+    assert good["users"][0]["username"] == "alpha"
+    assert bad is None
+    assert posts == 3   # the merged POST, then one per caller
+
+
+def test_batch_cloudflare_503_not_resent(run):
+    async def main():
+        async with HFSimulator(_forum("alpha"), faults=SimFaults(error_503_html=1.0)) as sim:
+            hf = HFClient("tok-cf503", base_url=sim.base_url, timeout=2, retry=NO_RETRY)
+            results = await asyncio.gather(hf.read(ASKS), hf.read({"forums": {"_fid": [1], "fid": True}}))
+            return results, sim.stats().get("read", 0)
+
+    results, posts = run(main())
+    assert results == [None, None]
+    assert posts == 1
+
+
+def test_token_pool_clients_not_coalesced_with_plain_clients(run):
+    from HFTokenPool import HFTokenPool
+
+    async def main():
+        async with HFSimulator(_forum("alpha")) as sim:
+            pool   = HFTokenPool(["tok-pool-a", "tok-pool-b"])
+            pooled = HFClient("tok-pool-owner", base_url=sim.base_url, timeout=2, token_pool=pool)
+            plain  = HFClient("tok-pool-owner", base_url=sim.base_url, timeout=2)
+            await asyncio.gather(pooled.read(ASKS), plain.read({"forums": {"_fid": [1], "fid": True}}))
+            return sim.stats().get("read", 0)
+
+    assert run(main()) == 2
+
+
+def test_disputed_contracts_read_through_same_server(run):
+    from HFContracts import HFContracts
+
+    async def main():
+        data = SimDataset()
+        me   = int(data.add_user("me")["uid"])
+        them = int(data.add_user("them")["uid"])
+        data.add_token("tok-disputes", me)
+        data.add_contract(me, them)
+        cid = data.add_contract(me, them)["cid"]
+        data.add_dispute(int(cid), them, me)
+        async with HFSimulator(data) as sim:
+            contracts = HFContracts("tok-disputes", base_url=sim.base_url, timeout=2)
+            return cid, await contracts.aget_disputed(me)
+
+    cid, disputed = run(main())
+    assert [c["cid"] for c in disputed] == [cid]
@@ -0,0 +1,84 @@
+"""Cassette record/replay: answers come back as recorded, without side effects on shared state."""
+
+import asyncio
+
+import httpx
+
+import HFCodec
+from HFClient import HFClient, get_rate_limit_remaining, is_rate_limited
+from HFRetry import NO_RETRY
+from HFTransport import Cassette, RecordingTransport, ReplayTransport, TransportResponse, use_transport
+
+ASKS = {"users": {"_uid": [1], "uid": True, "username": True}}
+
+
+class _FakeHF:
+    """Answers users lookups with made-up rows, a little later each time."""
+
+    live = True
+
+    def __init__(self):
+        self.calls = 0
+
+    async def post(self, url, token, asks, proxy, options) -> TransportResponse:
+        self.calls += 1
+        await asyncio.sleep(0.01 * self.calls)
+        rows = [{"uid": str(uid), "username": f"user{uid}-{self.calls}"} for uid in asks["users"]["_uid"]]
+        return TransportResponse(200, httpx.Headers({"x-rate-limit-remaining": "200"}),
+                                 HFCodec.dumps({"users": rows}).encode())
+
+
+def test_record_then_replay(run, tmp_path):
+    path  = tmp_path / "users.cassette"
+    inner = _FakeHF()
+
+    async def session(transport, uids):
+        hf = HFClient("tok-cassette", timeout=2, coalesce_window=0, retry=NO_RETRY)
+        with use_transport(transport):
+            return [await hf.read({"users": {"_uid": [uid], "uid": True, "username": True}}) for uid in uids]
+
+    cassette = Cassette(path)
+    recorded = run(session(RecordingTransport(cassette, inner), [1, 2, 1]))
+    cassette.flush()
+    replay   = ReplayTransport(Cassette.load(path), time_scale=0)
+    replayed = run(session(replay, [1, 2, 1]))
+    missed   = run(session(replay, [3]))
+
+    assert inner.calls == 3
+    assert replayed == recorded
+    assert recorded[0] != recorded[2]   # repeated asks are answered in recorded order
+    assert missed == [None]
+    assert replay.stats() == {"served": 3, "misses": 1, "repeats": 0}
+
+
+def _exchange(body: str, remaining: str) -> dict:
+    return {"endpoint": "read", "asks": ASKS, "status": 200, "headers": {"x-rate-limit-remaining": remaining},
+            "body": body, "latency": 0.0, "at": 0.0, "failure": None}
+
+
+def test_replay_leaves_rate_state_alone(run):
+    cassette = Cassette(interactions=[
+        _exchange('{"users":[{"uid":"1","username":"alpha"}]}', "3"),
+        _exchange('{"success":false,"message":"MAX_HOURLY_CALLS_EXCEEDED"}', "0"),
+    ])
+
+    async def main():
+        hf = HFClient("tok-replay", timeout=2, retry=NO_RETRY, coalesce_window=0)
+        with use_transport(ReplayTransport(cassette, time_scale=0)):
+            return [await hf.read(ASKS), await hf.read(ASKS)]
+
+    first, _ = run(main())
+    assert first["users"][0]["username"] == "alpha"
+    assert get_rate_limit_remaining("tok-replay") == 9999
+    assert not is_rate_limited("tok-replay")
+
+
+def test_cassette_file_keeps_recording_order(tmp_path):
+    path     = tmp_path / "reads.cassette"
+    cassette = Cassette(path)
+    for i in range(50):
+        cassette.append(_exchange(f'{{"n":{i}}}', str(i)))
+    cassette.flush()
+
+    loaded = Cassette.load(path)
+    assert [e["body"] for e in loaded.interactions] == [f'{{"n":{i}}}' for i in range(50)]
@@ -0,0 +1,70 @@
+"""Keyed writes: retried only when nothing reached HF."""
+
+import asyncio
+
+from HFClient import HFClient, get_client_stats
+from HFRetry import RetryPolicy
+from HFSimulator import HFSimulator, SimFaults
+
+FAST_RETRY = RetryPolicy(attempts=3, base_delay=0.01, jitter=0)
+
+
+def _open_thread(sim: HFSimulator) -> int:
+    return next(tid for tid, t in sim.dataset.threads.items() if t["closed"] != "1")
+
+
+def test_keyed_write_not_resent_after_timeout(run):
+    async def main():
+        async with HFSimulator(faults=SimFaults(latency=0.5)) as sim:
+            hf    = HFClient("tok-timeout", base_url=sim.base_url, timeout=0.2, retry=FAST_RETRY)
+            tid   = _open_thread(sim)
+            posts = len(sim.dataset.posts)
+            data  = await hf.write({"posts": {"_tid": tid, "_message": "once"}}, idempotency_key="reply-1")
+            await asyncio.sleep(0.5)   # the timed-out write still lands
+            return data, sim.stats().get("write", 0), len(sim.dataset.posts) - posts
+
+    data, sent, landed = run(main())
+    assert data is None
+    assert sent == 1
+    assert landed == 1
+
+
+def test_keyed_write_not_resent_after_5xx(run):
+    async def main():
+        async with HFSimulator(faults=SimFaults(error_503=1.0)) as sim:
+            hf = HFClient("tok-503", base_url=sim.base_url, timeout=2, retry=FAST_RETRY)
+            data = await hf.write({"posts": {"_tid": _open_thread(sim), "_message": "x"}}, idempotency_key="reply-2")
+            return data, sim.stats().get("write", 0)
+
+    data, sent = run(main())
+    assert data is None
+    assert sent == 1
+
+
+def test_keyed_write_retried_after_connect_error(run):
+    async def main():
+        async with HFSimulator() as sim:
+            url = sim.base_url
+        # Nothing listens on the port any more — every attempt fails to connect
+        hf = HFClient("tok-connect", base_url=url, timeout=2, retry=FAST_RETRY)
+        before = get_client_stats()["retries"]
+        data = await hf.write({"bytes": {"_deposit": 1}}, idempotency_key="deposit-1")
+        return data, get_client_stats()["retries"] - before
+
+    data, retries = run(main())
+    assert data is None
+    assert retries == FAST_RETRY.attempts - 1
+
+
+def test_keyed_write_replayed_from_memory(run):
+    async def main():
+        async with HFSimulator() as sim:
+            hf    = HFClient("tok-replay", base_url=sim.base_url, timeout=2)
+            asks  = {"posts": {"_tid": _open_thread(sim), "_message": "twice?"}}
+            first = await hf.write(asks, idempotency_key="reply-3")
+            again = await hf.write(asks, idempotency_key="reply-3")
+            return first, again, sim.stats().get("write", 0)
+
+    first, again, sent = run(main())
+    assert first is not None and first == again
+    assert sent == 1